@@ -0,0 +1,56 @@
+# coding: utf8
+"""Corpora for the benchmarks, one per code path of parse_number."""
+from __future__ import unicode_literals
+
+import os
+import random
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from parse_numeric_value.compose import scale_words  # noqa: E402
+from parse_numeric_value.engines import load_language, lookup_table  # noqa: E402
+from parse_numeric_value.prefilter import dictionary_suffixes  # noqa: E402
+from tests.lang import conversion_cases  # noqa: E402
+
+PATHS = ('dict', 'regex', 'rejected', 'multi_word', 'mixed')
+
+NON_NUMERALS = ['straat', 'weg', 'laan', 'kerk', 'markt', 'dorp', 'straße', 'platz', 'gasse', 'schule',
+                'rue', 'avenue', 'place', 'chemin', 'église', 'gare', 'station', 'school', 'bahnhof', 'mairie']
+
+
+def _takes_dictionary_path(module, lang, text):
+    for suffix in dictionary_suffixes[lang]:
+        if text.endswith(suffix) and text[:len(text) - len(suffix)] in module.text_lookup:
+            return True
+    return False
+
+
+def corpus(lang, path, size=10000, seed=0):
+    """:param lang: language code
+       :param path: one of PATHS, mixed samples the existing test parametrisation
+       :param size: number of texts
+       :return: list of texts, or an empty list when the language doesn't have the path"""
+    rng = random.Random(seed)
+    module = load_language(lang)
+    spellings = sorted(lookup_table(lang))
+    if path == 'dict':
+        if not dictionary_suffixes[lang]:
+            # parse_number of the language doesn't look texts up, e.g. fr
+            return []
+        population = [text for text in spellings if _takes_dictionary_path(module, lang, text)]
+    elif path == 'regex':
+        population = [text for text in spellings if not _takes_dictionary_path(module, lang, text)]
+    elif path == 'rejected':
+        population = NON_NUMERALS + [text for text, value, match in conversion_cases(lang) if value == (None, None)]
+        population += [text + word for text in spellings[::50] for word in NON_NUMERALS[:5]]
+    elif path == 'multi_word':
+        scales = sorted(scale_words(lang))
+        return [rng.choice(spellings) + ' ' + rng.choice(scales) + ' ' + rng.choice(spellings)
+                for _ in range(size)]
+    elif path == 'mixed':
+        population = [text for text, value, match in conversion_cases(lang)]
+    else:
+        raise ValueError('Unknown path {!r}, expected one of {}'.format(path, ', '.join(PATHS)))
+    return [rng.choice(population) for _ in range(size)]
@@ -0,0 +1,59 @@
+# coding: utf8
+"""Shows how parse_numbers_parallel scales with the number of worker processes.
+
+   python benchmarks/parallel_scaling.py --lang nl --size 500000"""
+from __future__ import unicode_literals, print_function
+
+import argparse
+import os
+import random
+import time
+
+from corpora import NON_NUMERALS
+
+from parse_numeric_value.engines import lookup_table
+from parse_numeric_value.parallel import DEFAULT_CHUNK_SIZE, parse_numbers_parallel
+
+
+def corpus(lang, size, seed=0):
+    """Spellings of the lookup table mixed with non-numerals and their compounds"""
+    rng = random.Random(seed)
+    spellings = sorted(lookup_table(lang))
+    texts = []
+    for _ in range(size):
+        spelling = rng.choice(spellings)
+        roll = rng.random()
+        if roll < 0.5:
+            texts.append(spelling)
+        elif roll < 0.75:
+            texts.append(spelling + rng.choice(NON_NUMERALS))
+        else:
+            texts.append(rng.choice(NON_NUMERALS))
+    return texts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--lang', default='nl')
+    parser.add_argument('--size', type=int, default=200000)
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument('--cache-size', type=int, default=0, help='per worker, 0 disables caching')
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count())
+    args = parser.parse_args(argv)
+
+    texts = corpus(args.lang, args.size)
+    print('workers  seconds  texts/s  speedup')
+    baseline = None
+    workers = 1
+    while workers <= args.max_workers:
+        start = time.perf_counter()
+        parse_numbers_parallel(texts, lang=args.lang, determine_value=True, workers=workers,
+                               chunk_size=args.chunk_size, cache_size=args.cache_size)
+        seconds = time.perf_counter() - start
+        baseline = baseline or seconds
+        print('{:7d}  {:7.2f}  {:7.0f}  {:7.2f}'.format(workers, seconds, len(texts) / seconds, baseline / seconds))
+        workers *= 2
+
+
+if __name__ == '__main__':
+    main()
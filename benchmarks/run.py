@@ -0,0 +1,89 @@
+# coding: utf8
+"""Times parse_number of each language on each of its code paths and saves the results as JSON.
+
+   python benchmarks/run.py --output bench.json [--compare previous.json]"""
+from __future__ import unicode_literals, print_function
+
+import argparse
+import datetime
+import json
+import platform
+import time
+
+from corpora import PATHS, corpus
+
+from parse_numeric_value.engines import ENGINES, get_parser
+
+LANGUAGES = ('nl', 'de', 'fr')
+
+
+def time_corpus(parse_number, texts, repeat):
+    """:return: the best time per call over repeat runs, in nanoseconds"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in texts:
+            parse_number(text, True)
+        best = min(best, time.perf_counter() - start)
+    return best / len(texts) * 1e9
+
+
+def run(languages=LANGUAGES, engines=('regex',), size=10000, repeat=5):
+    """:return: dict with the environment and a list of results,
+                each holding language, engine, path, number of texts and nanoseconds per call"""
+    results = []
+    for lang in languages:
+        for engine in engines:
+            parse_number = get_parser(lang, engine)
+            # Builds or loads what the engine needs before it's timed, e.g. the table or the mapped file
+            for text in corpus(lang, 'mixed', 100):
+                parse_number(text, True)
+            for path in PATHS:
+                texts = corpus(lang, path, size)
+                if not texts:
+                    continue
+                results.append({'lang': lang, 'engine': engine, 'path': path, 'texts': len(texts),
+                                'ns_per_call': round(time_corpus(parse_number, texts, repeat), 1)})
+    return {'created': datetime.datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'size': size,
+            'repeat': repeat,
+            'results': results}
+
+
+def compare(current, previous):
+    """Prints the ratio between current and previous for every result they have in common"""
+    before = {(r['lang'], r['engine'], r['path']): r['ns_per_call'] for r in previous['results']}
+    print('lang  engine  path        ns/call  previous  ratio')
+    for r in current['results']:
+        key = (r['lang'], r['engine'], r['path'])
+        if key in before:
+            print('{:4}  {:6}  {:10}  {:7.0f}  {:8.0f}  {:5.2f}'.format(
+                r['lang'], r['engine'], r['path'], r['ns_per_call'], before[key], r['ns_per_call'] / before[key]))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--lang', action='append', choices=LANGUAGES)
+    parser.add_argument('--engine', action='append', choices=ENGINES)
+    parser.add_argument('--size', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output', help='JSON file to write the results to')
+    parser.add_argument('--compare', help='JSON file written by an earlier run')
+    args = parser.parse_args(argv)
+
+    current = run(args.lang or LANGUAGES, args.engine or ('regex',), args.size, args.repeat)
+    if args.output:
+        with open(args.output, 'w') as fh:
+            json.dump(current, fh, indent=2)
+    if args.compare:
+        with open(args.compare) as fh:
+            compare(current, json.load(fh))
+    else:
+        for r in current['results']:
+            print('{lang:4}  {engine:6}  {path:10}  {ns_per_call:7.0f} ns/call'.format(**r))
+
+
+if __name__ == '__main__':
+    main()
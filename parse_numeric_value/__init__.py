@@ -0,0 +1 @@
+from parse_numeric_value.registry import languages, load_language, parse_number, resolve_language  # noqa: F401
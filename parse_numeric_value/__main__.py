@@ -0,0 +1,7 @@
+# coding: utf8
+"""python -m parse_numeric_value, see parse_numeric_value.cli"""
+import sys
+
+from parse_numeric_value.cli import main
+
+sys.exit(main())
@@ -0,0 +1,164 @@
+# coding: utf8
+"""Prebuilt lookup tables, so a fresh process doesn't run every candidate spelling through parse_number.
+
+   Each table is written to a file holding a header line with its version and the marshalled table.
+   The version is a fingerprint of the sources the table is derived from and of the Python version,
+   so a file that no longer matches is rebuilt the first time it's needed.
+   The files are written by setup.py into the package, or at runtime into the first writable
+   of the package data directory and the cache directory."""
+from __future__ import unicode_literals
+
+import functools
+import hashlib
+import importlib
+import marshal
+import os
+import sys
+import tempfile
+
+from parse_numeric_value import registry
+from parse_numeric_value.registry import load_language, resolve_language
+
+FORMAT_VERSION = 1
+
+PACKAGE_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+
+# Modules whose source determines the content of the tables, besides the language module
+_sources = ('parse_numeric_value.engines', 'parse_numeric_value.compose')
+
+
+def cache_directory():
+    """:return: the directory for tables when the package directory isn't writable,
+                $PARSE_NUMERIC_VALUE_CACHE or parse_numeric_value in the user's cache directory"""
+    directory = os.environ.get('PARSE_NUMERIC_VALUE_CACHE')
+    if directory:
+        return directory
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'parse_numeric_value')
+
+
+def _options_suffix(options):
+    return ''.join('-{}={}'.format(key, value) for key, value in sorted(options.items()))
+
+
+def table_version(lang, **options):
+    """:param lang:    language code
+       :param options: extra keyword arguments for parse_number the table is built with
+       :return: fingerprint of everything the table of lang depends on, as a hex string"""
+    lang = resolve_language(lang)
+    digest = hashlib.sha1('{} {} {} {}{}'.format(FORMAT_VERSION, sys.version_info[:2], marshal.version,
+                                                 lang, _options_suffix(options)).encode('utf8'))
+    for module in [load_language(lang)] + [importlib.import_module(name) for name in _sources]:
+        try:
+            with open(module.__file__, 'rb') as fh:
+                digest.update(fh.read())
+        except (AttributeError, OSError, TypeError):
+            digest.update(repr(getattr(module, 'numeric_lookup', module.__name__)).encode('utf8'))
+    return digest.hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def library_version():
+    """:return: the version of the installed parse_numeric_value, or of the source tree it's imported from"""
+    try:
+        from importlib.metadata import PackageNotFoundError, version
+        try:
+            return version('parse_numeric_value')
+        except PackageNotFoundError:
+            pass
+    except ImportError:
+        pass
+    try:
+        with open(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'VERSION')) as fh:
+            return fh.read().strip()
+    except OSError:
+        return 'unknown'
+
+
+def result_version(lang, **options):
+    """:return: the version of the results for lang: the library version and its table_version"""
+    return '{}/{}'.format(library_version(), table_version(lang, **options))
+
+
+def artifact_path(lang, directory=PACKAGE_DIRECTORY, **options):
+    """:return: the file name of the table of lang in directory"""
+    return os.path.join(directory, '{}{}.table'.format(resolve_language(lang), _options_suffix(options)))
+
+
+def _header(version):
+    return 'parse_numeric_value table {}\n'.format(version).encode('ascii')
+
+
+def read_table(path, version):
+    """:param path:    file name of a table
+       :param version: the table_version it should have
+       :return: the table, or None when the file is missing, stale or damaged"""
+    try:
+        with open(path, 'rb') as fh:
+            if fh.readline() != _header(version):
+                return None
+            return marshal.loads(fh.read())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+
+def write_table(table, path, version):
+    """Writes table to path, replacing it atomically so concurrent readers never see a partial file"""
+    directory = os.path.dirname(path)
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+    fd, temporary = tempfile.mkstemp(dir=directory, prefix='.parse_numeric_value', suffix='.table')
+    try:
+        with os.fdopen(fd, 'wb') as fh:
+            fh.write(_header(version))
+            fh.write(marshal.dumps(table))
+        os.chmod(temporary, 0o644)
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+
+
+def load_table(lang, directories=None, **options):
+    """:param lang:        language code
+       :param directories: directories to look in, by default the package data and the cache directory
+       :param options:     extra keyword arguments for parse_number, e.g. strict_AN_spelling
+       :return: the lookup table of lang, read from the first directory holding a current version,
+                otherwise built and written to the first directory that is writable"""
+    from parse_numeric_value.engines import build_table
+    version = table_version(lang, **options)
+    directories = directories or (PACKAGE_DIRECTORY, cache_directory())
+    for directory in directories:
+        table = read_table(artifact_path(lang, directory, **options), version)
+        if table is not None:
+            return table
+    table = build_table(lang, **options)
+    for directory in directories:
+        try:
+            write_table(table, artifact_path(lang, directory, **options), version)
+            break
+        except OSError:
+            continue
+    return table
+
+
+def build_artifacts(directory=PACKAGE_DIRECTORY, languages=None):
+    """Writes the tables of languages, by default all of them, to directory,
+       both in this format and in the memory-mappable one of parse_numeric_value.mapped
+       :return: list of the file names written"""
+    from parse_numeric_value.engines import build_table
+    from parse_numeric_value.mapped import mapped_path, write_mapped_table
+    paths = []
+    for lang in languages or registry.languages():
+        table = build_table(lang)
+        version = table_version(lang)
+        path = artifact_path(lang, directory)
+        write_table(table, path, version)
+        write_mapped_table(table, mapped_path(lang, directory), version)
+        paths += [path, mapped_path(lang, directory)]
+    return paths
+
+
+if __name__ == '__main__':
+    for written in build_artifacts(*sys.argv[1:2]):
+        print(written)
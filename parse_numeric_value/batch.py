@@ -0,0 +1,123 @@
+# coding: utf8
+"""Parse whole columns of text strings, each distinct string only once."""
+from __future__ import unicode_literals
+
+from array import array
+
+from parse_numeric_value.engines import get_parser
+from parse_numeric_value.normalize import normalizing_parser
+
+# Rows of parse_numbers_array, the kind is the tri-state of the second item parse_number returns
+RESULT_DTYPE = [('value', 'i8'), ('valid', '?'), ('kind', 'i1'), ('overflow', '?')]
+INVALID, CARDINAL, ORDINAL = -1, 0, 1
+INT64_MIN, INT64_MAX = -2 ** 63, 2 ** 63 - 1
+
+
+class CompactResults(object):
+    """Results of parse_numbers stored as the distinct results
+       and an array with an index into them for every input string"""
+    __slots__ = ('results', 'indices')
+
+    def __init__(self, results, indices):
+        self.results = results
+        self.indices = indices
+
+    def __len__(self):
+        return len(self.indices)
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [self.results[index] for index in self.indices[position]]
+        return self.results[self.indices[position]]
+
+    def __iter__(self):
+        results = self.results
+        for index in self.indices:
+            yield results[index]
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __repr__(self):
+        return 'CompactResults({!r})'.format(list(self))
+
+
+def _parser(lang, engine, normalize, fold_diacritics):
+    parse_number = get_parser(lang, engine)
+    return normalizing_parser(parse_number, lang, fold_diacritics) if normalize else parse_number
+
+
+def parse_numbers(texts, lang='nl', determine_value=False, compact=False, engine='regex', normalize=False,
+                  fold_diacritics=False, **options):
+    """Accepts any iterable of text strings and parses each distinct string once
+       :param texts:           iterable of text strings that may be numbers
+       :param lang:            language code: nl, de or fr
+       :param determine_value: calculate the values they represent as well
+       :param compact:         return a CompactResults instead of a list
+       :param engine:          see parse_numeric_value.engines
+       :param normalize:       normalize the texts first, see parse_numeric_value.normalize
+       :param fold_diacritics: with normalize, accept number words without their diacritics as well
+       :param options:         extra keyword arguments for parse_number, e.g. strict_AN_spelling
+       :return: the results parse_number gives for each of the texts, in input order"""
+    distinct, indices = _parse_distinct(texts, _parser(lang, engine, normalize, fold_diacritics),
+                                        determine_value, options)
+    if compact:
+        return CompactResults(distinct, indices)
+    return [distinct[index] for index in indices]
+
+
+def _parse_distinct(texts, parse_number, determine_value, options):
+    """:return: a tuple consisting of the results for the distinct texts and an array with an index
+                into them for every text"""
+    seen = {}
+    distinct = []
+    indices = array('L')
+    for text in texts:
+        try:
+            index = seen[text]
+        except KeyError:
+            index = seen[text] = len(distinct)
+            distinct.append(parse_number(text, determine_value=determine_value, **options))
+        indices.append(index)
+    return distinct, indices
+
+
+def _array_row(result):
+    value, ordinal = result
+    if ordinal is None:
+        return 0, False, INVALID, False
+    kind = ORDINAL if ordinal else CARDINAL
+    if type(value) is float and value.is_integer():
+        value = int(value)
+    if type(value) is int and INT64_MIN <= value <= INT64_MAX:
+        return value, True, kind, False
+    return 0, True, kind, True
+
+
+def parse_numbers_array(texts, lang='nl', engine='regex', normalize=False, fold_diacritics=False, **options):
+    """Parses like parse_numbers with determine_value=True, returning NumPy arrays, which requires NumPy
+       :param texts:           iterable of text strings that may be numbers
+       :param lang:            language code: nl, de or fr
+       :param engine:          see parse_numeric_value.engines
+       :param normalize:       normalize the texts first, see parse_numeric_value.normalize
+       :param fold_diacritics: with normalize, accept number words without their diacritics as well
+       :param options:         extra keyword arguments for parse_number, e.g. strict_AN_spelling
+       :return: a tuple consisting of
+                 * a structured array with RESULT_DTYPE, one row per text in input order:
+                    value:    the value as int64, 0 for invalid texts and for overflow
+                    valid:    whether the text is a numeral
+                    kind:     INVALID, CARDINAL or ORDINAL
+                    overflow: the value doesn't fit in an int64, e.g. driekwart or quadrilliard
+                 * dict mapping the positions with overflow to their exact value
+                e.g. results['value'][results['valid'] & (results['kind'] == ORDINAL)]"""
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError('parse_numbers_array requires NumPy: pip install numpy')
+    distinct, indices = _parse_distinct(texts, _parser(lang, engine, normalize, fold_diacritics), True, options)
+    table = numpy.array([_array_row(result) for result in distinct], dtype=RESULT_DTYPE)
+    results = table[numpy.frombuffer(indices, dtype='u{}'.format(indices.itemsize))]
+    exact = {}
+    for position in numpy.flatnonzero(results['overflow']).tolist():
+        exact[position] = distinct[indices[position]][0]
+    return results, exact
@@ -0,0 +1,58 @@
+# coding: utf8
+"""Opt-in memoization of parse_number, one bounded LRU cache per language."""
+from __future__ import unicode_literals
+
+import functools
+
+from parse_numeric_value.engines import get_parser
+from parse_numeric_value.registry import resolve_language
+
+DEFAULT_MAXSIZE = 2 ** 16
+
+_caches = {}
+
+
+def cached_parser(lang, maxsize=DEFAULT_MAXSIZE, engine='regex'):
+    """:param lang:    language code
+       :param maxsize: maximum number of results kept, the least recently used are evicted first
+                       None lets the cache grow without bound
+       :param engine:  see parse_numeric_value.engines
+       :return: a function with the same signature and results as parse_number of the language module,
+                which also has the cache_info() and cache_clear() of functools.lru_cache.
+                Asking again for the same language and engine returns the same function,
+                unless maxsize differs, in which case a new, empty cache replaces the old one"""
+    key = (resolve_language(lang), engine)
+    if key in _caches and _caches[key][0] == maxsize:
+        return _caches[key][1]
+    parse = get_parser(lang, engine)
+
+    @functools.lru_cache(maxsize=maxsize)
+    def cached(number, determine_value, options):
+        return parse(number, determine_value=determine_value, **dict(options))
+
+    def parse_number(number, determine_value=False, **options):
+        return cached(number, determine_value, tuple(sorted(options.items())) if options else ())
+
+    parse_number.__doc__ = parse.__doc__
+    parse_number.cache_info = cached.cache_info
+    parse_number.cache_clear = cached.cache_clear
+    _caches[key] = (maxsize, parse_number)
+    return parse_number
+
+
+def cache_info(lang=None):
+    """:param lang: language code, None for all languages
+       :return: dict mapping (language, engine) to the hits, misses, maxsize and currsize of its cache"""
+    lang = lang and resolve_language(lang)
+    return {key: parse_number.cache_info()
+            for key, (maxsize, parse_number) in _caches.items()
+            if lang is None or key[0] == lang}
+
+
+def cache_clear(lang=None):
+    """Empties the caches, e.g. after changing the lookup tables of a language module
+       :param lang: language code, None for all languages"""
+    lang = lang and resolve_language(lang)
+    for key, (maxsize, parse_number) in _caches.items():
+        if lang is None or key[0] == lang:
+            parse_number.cache_clear()
@@ -0,0 +1,189 @@
+# coding: utf8
+"""Command line tool parsing one token per line, from files or stdin, to TSV or JSON Lines on stdout.
+
+   Each output row holds the token, its value, whether it's an ordinal and the language.
+   Input is read and output written in large blocks, and with --jobs the parsing is spread
+   over worker processes, a bounded number of blocks at a time, so memory use doesn't grow with the input."""
+from __future__ import unicode_literals
+
+import argparse
+import collections
+import io
+import json
+import multiprocessing
+import sys
+
+from parse_numeric_value import parallel
+from parse_numeric_value.cache import DEFAULT_MAXSIZE, cached_parser
+from parse_numeric_value.engines import ENGINES
+from parse_numeric_value.registry import languages, resolve_language
+
+BUFFER_SIZE = 2 ** 20
+CHUNK_SIZE = 20000
+
+FORMATS = ('tsv', 'jsonl')
+
+
+def read_tokens(streams):
+    """:param streams: binary files holding one token per line, UTF-8 encoded
+       :return: iterator over lists of the non-empty tokens, a block of lines at a time"""
+    for stream in streams:
+        text = io.TextIOWrapper(stream, encoding='utf8', errors='replace', newline=None)
+        while True:
+            lines = text.readlines(BUFFER_SIZE)
+            if not lines:
+                break
+            yield [token for token in (line.rstrip('\n') for line in lines) if token]
+        text.detach()
+
+
+def deduplicated(chunks):
+    """:return: the chunks without the tokens that occurred in an earlier chunk or earlier in the same chunk"""
+    seen = set()
+    for chunk in chunks:
+        distinct = []
+        for token in chunk:
+            if token not in seen:
+                seen.add(token)
+                distinct.append(token)
+        if distinct:
+            yield distinct
+
+
+def _tsv(token, value, ordinal, lang):
+    return '{}\t{}\t{}\t{}\n'.format(token.replace('\t', ' '), '' if value is None else value,
+                                     '' if ordinal is None else int(ordinal), lang)
+
+
+def _jsonl(token, value, ordinal, lang):
+    return json.dumps({'text': token, 'value': value, 'ordinal': ordinal, 'lang': lang}, ensure_ascii=False) + '\n'
+
+
+_formatters = {'tsv': _tsv, 'jsonl': _jsonl}
+
+
+def format_rows(tokens, parse_number, lang, output_format='tsv', rejected=False, **options):
+    """:param tokens:        list of text strings that may be numbers
+       :param parse_number:  function with the signature of parse_number of the language module
+       :param lang:          language code written in each row
+       :param output_format: tsv or jsonl
+       :param rejected:      write rows for the tokens that aren't numbers as well, without value and ordinal,
+                             including the tokens parse_number raises for, e.g. French quatre-vingt
+       :param options:       extra keyword arguments for parse_number, e.g. strict_AN_spelling
+       :return: the rows for tokens, UTF-8 encoded"""
+    formatter = _formatters[output_format]
+    formatted = {}
+    rows = []
+    for token in tokens:
+        try:
+            row = formatted[token]
+        except KeyError:
+            try:
+                value, ordinal = parse_number(token, True, **options)
+            except Exception:
+                value = ordinal = None
+            row = formatted[token] = formatter(token, value, ordinal, lang) if ordinal is not None or rejected else ''
+        rows.append(row)
+    return ''.join(rows).encode('utf8')
+
+
+def _format_chunk(job):
+    tokens, lang, output_format, rejected, options = job
+    return format_rows(tokens, parallel._parse_number, lang, output_format, rejected, **options)
+
+
+def _parallel_blocks(chunks, lang, engine, jobs, output_format, rejected, options):
+    """Formats chunks on jobs worker processes, keeping at most 2 chunks per worker in flight
+       :return: iterator over the formatted blocks, in input order"""
+    pending = collections.deque()
+    with multiprocessing.Pool(jobs, initializer=parallel._init_worker,
+                              initargs=(lang, engine, DEFAULT_MAXSIZE)) as pool:
+        for chunk in chunks:
+            pending.append(pool.apply_async(_format_chunk, ((chunk, lang, output_format, rejected, options),)))
+            if len(pending) >= 2 * jobs:
+                yield pending.popleft().get()
+        while pending:
+            yield pending.popleft().get()
+
+
+def open_inputs(names, stdin):
+    """:param names: file names, - for stdin
+       :return: iterator over the binary files, each closed when the next one is asked for"""
+    for name in names:
+        if name == '-':
+            yield stdin
+        else:
+            with open(name, 'rb', buffering=BUFFER_SIZE) as fh:
+                yield fh
+
+
+def run(streams, output, lang='nl', engine='hybrid', output_format='tsv', dedup=False, jobs=1, rejected=False,
+        **options):
+    """Parses the tokens of streams and writes their rows to output, see format_rows
+       :param streams: binary files holding one token per line
+       :param output:  binary file
+       :param lang:    language code, optionally with a region, the rows hold the language without region
+       :param dedup:   write each distinct token only once
+       :param jobs:    number of worker processes, 1 parses in this process
+       :return: number of tokens read"""
+    lang = resolve_language(lang)
+    counted = [0]
+
+    def counting(chunks):
+        for chunk in chunks:
+            counted[0] += len(chunk)
+            yield chunk
+
+    chunks = counting(read_tokens(streams))
+    if dedup:
+        chunks = deduplicated(chunks)
+    if jobs > 1:
+        chunks = (tokens for chunk in chunks for tokens in parallel.chunked(chunk, CHUNK_SIZE))
+        blocks = _parallel_blocks(chunks, lang, engine, jobs, output_format, rejected, options)
+    else:
+        parse_number = cached_parser(lang, engine=engine)
+        blocks = (format_rows(chunk, parse_number, lang, output_format, rejected, **options) for chunk in chunks)
+    for block in blocks:
+        output.write(block)
+    output.flush()
+    return counted[0]
+
+
+def main(argv=None, stdin=None, stdout=None):
+    parser = argparse.ArgumentParser(prog='parse_numeric_value', description=__doc__.split('\n')[0])
+    parser.add_argument('files', nargs='*', default=['-'], help='files with one token per line, - for stdin')
+    parser.add_argument('--lang', default='nl', help='language code, one of {}, optionally with a region'.format(
+        ', '.join(languages())))
+    parser.add_argument('--engine', default='hybrid', choices=ENGINES)
+    parser.add_argument('--format', default='tsv', choices=FORMATS, dest='output_format')
+    parser.add_argument('--dedup', action='store_true', help='write each distinct token only once')
+    parser.add_argument('--all', action='store_true', dest='rejected',
+                        help='write the tokens that are not numbers as well, without value')
+    parser.add_argument('--jobs', '-j', type=int, default=1, help='number of worker processes, 0 for one per core')
+    parser.add_argument('--strict', action='store_true', help="strict_AN_spelling, only for nl")
+    args = parser.parse_args(argv)
+    try:
+        lang = resolve_language(args.lang)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.jobs < 0:
+        parser.error('--jobs should be 0 or more')
+    options = {}
+    if args.strict:
+        if lang != 'nl':
+            parser.error('--strict only applies to nl')
+        options['strict_AN_spelling'] = True
+
+    stdout = stdout or sys.stdout.buffer
+    try:
+        run(open_inputs(args.files, stdin or sys.stdin.buffer), stdout, lang, args.engine, args.output_format,
+            args.dedup, args.jobs or multiprocessing.cpu_count(), args.rejected, **options)
+    except BrokenPipeError:
+        # Output piped into e.g. head, which stopped reading
+        sys.stderr.close()
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
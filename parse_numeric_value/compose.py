@@ -0,0 +1,149 @@
+# coding: utf8
+"""Numbers written in several words, composed in a single pass over the words.
+
+   Each word is parsed once, on its own. Scale words from numeric_lookup multiply what precedes them:
+   honderd/hundert/cent within a group, duizend/tausend/mille and up close a group,
+   a larger scale word after a smaller one multiplies everything before it, e.g. duizend miljoen.
+   Only a number of a hundred or more is followed by a smaller one, tens and units only after a conjunction,
+   and zero is only a number on its own."""
+from __future__ import unicode_literals
+
+from parse_numeric_value.registry import load_language, resolve_language
+
+# Words that may join the words of a number
+conjunctions = {'nl': {'en'}, 'de': {'und'}, 'fr': {'et'}}
+
+# The ordinal suffix of scale words and whether it replaces a final e
+ordinal_suffixes = {'nl': ('ste', False), 'de': ('ste', True), 'fr': ('ième', True)}
+
+
+# Words parse_number of the language doesn't know, which count as a number in a phrase
+articles = {'nl': {}, 'de': {'eine': 1}, 'fr': {}}
+
+
+def plurals(lang, text):
+    """:return: list holding the plural of scale word text, if it has one"""
+    if lang == 'de':
+        return [text + ('n' if text.endswith('e') else 'en')]
+    if lang == 'fr' and text != 'mille':
+        return [text + 's']
+    return []
+
+
+def ordinal_form(lang, text):
+    """:return: the ordinal of scale word text"""
+    suffix, replaces_e = ordinal_suffixes[lang]
+    return (text[:-1] if replaces_e and text.endswith('e') else text) + suffix
+
+
+_scales = {}
+
+
+def scale_words(lang):
+    """:param lang: language code
+       :return: dict mapping the scale words of the language, the powers of ten from 100 up in numeric_lookup,
+                with their plural and ordinal forms, to a tuple consisting of their value and ordinal flag"""
+    lang = resolve_language(lang)
+    try:
+        return _scales[lang]
+    except KeyError:
+        pass
+    scales = {}
+    for number, texts in load_language(lang).numeric_lookup.items():
+        if number < 100 or str(number).rstrip('0') != '1':
+            continue
+        for text in (texts if type(texts) in (list, tuple) else [texts]):
+            scales[text] = number, False
+            for plural in plurals(lang, text):
+                scales[plural] = number, False
+            scales[ordinal_form(lang, text)] = number, True
+    _scales[lang] = scales
+    return scales
+
+
+def _place(number):
+    """:return: the largest power of ten dividing number"""
+    place = 1
+    while number % (place * 10) == 0:
+        place *= 10
+    return place
+
+
+def parse_phrase(text, lang, determine_value=False, **options):
+    """Accepts text representing a number written in several words separated by spaces,
+       e.g. drie miljoen tweehonderdduizend, only the last of which may be an ordinal
+       :param text:            text string that may be a number
+       :param lang:            language code
+       :param determine_value: calculate the value it represents as well
+       :param options:         extra keyword arguments for parse_number, e.g. strict_AN_spelling
+       :return: the same as parse_number of the language module"""
+    lang = resolve_language(lang)
+    module = load_language(lang)
+    parse_word = module.parse_number
+    scales = _scales.get(lang) or scale_words(lang)
+    joining = conjunctions[lang]
+    known = articles[lang]
+    rejected = (None, None) if determine_value else False
+
+    words = text.split()
+    total = 0
+    # Value of the group being read, None until a number was seen since the last scale word closing a group
+    current = None
+    last_scale = None
+    # Number of scale words that closed a group, e.g. 2 in drie miljoen tweehonderdduizend
+    closed = 0
+    # Whether the previous word was a conjunction, e.g. vingt et un
+    joined = False
+    ordinal = None
+    for position, word in enumerate(words):
+        if ordinal:
+            return rejected
+        if word in joining and 0 < position < len(words) - 1:
+            joined = True
+            continue
+        if word in scales:
+            value, ordinal = scales[word]
+            if value == 100:
+                # Only multiplies what comes after the thousands, e.g. tweeduizend honderd
+                current = current or 0
+                below_1000 = current % 1000
+                if below_1000 >= 100:
+                    return rejected
+                current += (below_1000 or 1) * 100 - below_1000
+            elif last_scale is None or value < last_scale:
+                total += (1 if current is None else current) * value
+                last_scale, current = value, None
+                closed += 1
+            elif value > last_scale and last_scale == 1000 and closed == 1:
+                # A larger scale after the thousands only multiplies them when nothing else came before,
+                # e.g. duizend miljoen, not twee miljoen drie miljard
+                total = (total + (current or 0)) * value
+                last_scale, current = value, None
+            else:
+                return rejected
+        else:
+            if word in known:
+                value, ordinal = known[word], False
+            else:
+                try:
+                    value, ordinal = parse_word(word, determine_value=True, **options)
+                except (KeyError, ValueError):
+                    # The parser can't value every word it accepts, e.g. quatre-vingt-deux in fr,
+                    # which numeric_lookup may still hold as a cardinal
+                    value, ordinal = module.text_lookup.get(word), False
+            if value is None or value == 0 and len(words) > 1:
+                return rejected
+            if current is not None:
+                # Only a hundred or more may be followed by a smaller number, tens and units only after a conjunction
+                place = None if type(current) is float else _place(current)
+                if place is None or value >= place or place < 100 and not joined:
+                    return rejected
+                current += value
+            else:
+                current = value
+        joined = False
+    if ordinal is None:
+        return rejected
+    if determine_value:
+        return total + (current or 0), ordinal
+    return True
@@ -0,0 +1,237 @@
+# coding: utf8
+"""Differential fuzzing of the fast paths against parse_number of the language modules, the reference.
+
+   The inputs are composed from the morphemes in numeric_lookup, joined, suffixed and then mutated,
+   and from the spellings of the lookup tables with small mutations, so most land near a valid numeral.
+   Every implementation has to give the result the reference gives, including the exception it raises,
+   except those answering from the lookup table only, which have to give the reference result
+   for the spellings in the table and reject everything else.
+   A mismatch is shrunk to a shortest input that still disagrees.
+
+   Run it with: python -m parse_numeric_value.differential [budget]
+   The budget is the number of inputs per language, by default $PARSE_NUMERIC_VALUE_FUZZ_BUDGET or 2000,
+   and the seed $PARSE_NUMERIC_VALUE_FUZZ_SEED or 0."""
+from __future__ import unicode_literals
+
+import collections
+import os
+import random
+import sys
+
+from parse_numeric_value.batch import parse_numbers
+from parse_numeric_value.cache import cached_parser
+from parse_numeric_value.engines import get_parser, lookup_table
+from parse_numeric_value.prefilter import prefiltered_parser
+from parse_numeric_value import registry
+from parse_numeric_value.registry import load_language, resolve_language
+
+DEFAULT_BUDGET = 2000
+
+# Strings joining morphemes, and suffixes, besides the morphemes themselves,
+# languages registered later on get DEFAULT_JOINERS and DEFAULT_SUFFIXES
+DEFAULT_JOINERS = ('', ' ')
+DEFAULT_SUFFIXES = ('',)
+joiners = {'nl': ('', '', '', 'en', 'ën', '-', ' '),
+           'de': ('', '', '', 'und', '-', ' '),
+           'fr': ('-', '-', '', '-et-', ' ', 's-')}
+suffixes = {'nl': ('', '', 'ste', 'de', 'e', 's'),
+            'de': ('', '', 'te', 'ste', 'ter', 's', 'n'),
+            'fr': ('', '', 'ième', 's', 'e', 'er', 'ère')}
+
+# Options parse_number is checked with per language, by default none
+option_sets = {'nl': ({}, {'strict_AN_spelling': True}),
+               'de': ({},),
+               'fr': ({},)}
+
+# Outcome of a call that raised, by the name of the exception
+Raised = collections.namedtuple('Raised', 'exception')
+
+Mismatch = collections.namedtuple('Mismatch', 'lang implementation options text expected actual shrunk')
+
+
+def budget_from_environment():
+    """:return: the number of inputs per language, $PARSE_NUMERIC_VALUE_FUZZ_BUDGET or DEFAULT_BUDGET"""
+    return int(os.environ.get('PARSE_NUMERIC_VALUE_FUZZ_BUDGET') or DEFAULT_BUDGET)
+
+
+def morphemes(lang):
+    """:return: sorted list of the spellings in numeric_lookup of lang"""
+    found = set()
+    for text in load_language(lang).numeric_lookup.values():
+        found.update(text if type(text) in (list, tuple) else [text])
+    return sorted(found)
+
+
+def mutate(text, rng, alphabet):
+    """:return: text with a character deleted, doubled, swapped, inserted, replaced or upper cased,
+                or cut short"""
+    if not text:
+        return rng.choice(alphabet)
+    position = rng.randrange(len(text))
+    mutation = rng.randrange(7)
+    if mutation == 0:
+        return text[:position] + text[position + 1:]
+    if mutation == 1:
+        return text[:position] + text[position] + text[position:]
+    if mutation == 2 and position + 1 < len(text):
+        return text[:position] + text[position + 1] + text[position] + text[position + 2:]
+    if mutation == 3:
+        return text[:position] + rng.choice(alphabet) + text[position:]
+    if mutation == 4:
+        return text[:position] + rng.choice(alphabet) + text[position + 1:]
+    if mutation == 5:
+        return text[:position] + text[position].upper() + text[position + 1:]
+    return text[:position]
+
+
+def generate_inputs(lang, count, seed=0):
+    """:param lang:  language code
+       :param count: number of inputs
+       :param seed:  seed of the random generator, the same seed gives the same inputs
+       :return: list of count strings, half composed from morphemes, half mutated table spellings"""
+    lang = resolve_language(lang)
+    rng = random.Random('{}-{}'.format(seed, lang))
+    words = morphemes(lang)
+    spellings = sorted(lookup_table(lang))
+    alphabet = sorted(set(''.join(words + spellings)))
+    inputs = []
+    for index in range(count):
+        if index % 2:
+            text = rng.choice(spellings)
+        else:
+            parts = [rng.choice(words)]
+            for _ in range(rng.randrange(4)):
+                parts += [rng.choice(joiners.get(lang, DEFAULT_JOINERS)), rng.choice(words)]
+            text = ''.join(parts) + rng.choice(suffixes.get(lang, DEFAULT_SUFFIXES))
+        for _ in range(rng.choice((0, 0, 1, 1, 2, 3))):
+            text = mutate(text, rng, alphabet)
+        inputs.append(text)
+    return inputs
+
+
+def outcome(parse_number, text, determine_value, options):
+    """:return: what parse_number returns for text, or the Raised naming the exception it raises"""
+    try:
+        return parse_number(text, determine_value=determine_value, **options)
+    except Exception as e:
+        return Raised(type(e).__name__)
+
+
+def implementations(lang):
+    """:return: dict mapping names to a tuple consisting of a function with the signature of parse_number
+                and whether it answers from the lookup table only"""
+    found = {}
+    for engine in ('hybrid', 'table', 'trie', 'mmap'):
+        found[engine] = (get_parser(lang, engine), engine != 'hybrid')
+    for engine in ('regex', 'hybrid'):
+        found['cache-' + engine] = (cached_parser(lang, engine=engine), False)
+        found['prefilter-' + engine] = (prefiltered_parser(lang, engine), False)
+    return found
+
+
+def batch_implementations(lang, parallel=False):
+    """:param parallel: include parse_numbers_parallel, which starts worker processes
+       :return: dict mapping names to functions parsing a list of texts
+                with the signature of parse_numbers after the language"""
+    from parse_numeric_value.persistent import PersistentCache
+
+    def persistent(texts, determine_value, **options):
+        with PersistentCache(':memory:') as cache:
+            return cache.parse_numbers(texts, lang, determine_value, **options)
+
+    found = {'batch-regex': lambda texts, determine_value, **options:
+             parse_numbers(texts, lang, determine_value, **options),
+             'batch-hybrid-compact': lambda texts, determine_value, **options:
+             list(parse_numbers(texts, lang, determine_value, compact=True, engine='hybrid', **options)),
+             'persistent': persistent}
+    if parallel:
+        from parse_numeric_value.parallel import parse_numbers_parallel
+        found['parallel'] = lambda texts, determine_value, **options: parse_numbers_parallel(
+            texts, lang, determine_value, workers=2, chunk_size=max(1, len(texts) // 4), **options)
+    return found
+
+
+def shrink(text, disagrees):
+    """:param text:      input on which an implementation disagrees with the reference
+       :param disagrees: function telling whether that's still the case for another input
+       :return: a shortest input found by deleting runs of characters from text, the longest runs first,
+                until no deletion of a single run disagrees anymore"""
+    size = len(text)
+    while size > 0:
+        for start in range(0, len(text) - size + 1):
+            candidate = text[:start] + text[start + size:]
+            if disagrees(candidate):
+                text = candidate
+                size = len(text)
+                break
+        else:
+            size -= 1
+    return text
+
+
+def check(lang, texts, parallel=False):
+    """Compares every implementation for lang with the reference on texts
+       :return: list of Mismatch, one per implementation, options and determine_value that disagree"""
+    lang = resolve_language(lang)
+    reference = load_language(lang).parse_number
+    mismatches = []
+    for options in option_sets.get(lang, ({},)):
+        table = lookup_table(lang, **options)
+
+        def expected(text, determine_value, table_only):
+            if table_only and text not in table:
+                return (None, None) if determine_value else False
+            return outcome(reference, text, determine_value, options)
+
+        for determine_value in (True, False):
+            for name, (parse_number, table_only) in sorted(implementations(lang).items()):
+                def disagrees(text):
+                    return outcome(parse_number, text, determine_value, options) != \
+                        expected(text, determine_value, table_only)
+
+                for text in texts:
+                    if disagrees(text):
+                        mismatches.append(Mismatch(lang, name, options, text, expected(text, determine_value, table_only),
+                                                   outcome(parse_number, text, determine_value, options),
+                                                   shrink(text, disagrees)))
+                        break
+
+            # Batches raise for the whole batch, so they only get the texts the reference accepts or rejects
+            valid = [text for text in texts
+                     if not isinstance(outcome(reference, text, determine_value, options), Raised)]
+            references = [reference(text, determine_value=determine_value, **options) for text in valid]
+            for name, parse_batch in sorted(batch_implementations(lang, parallel).items()):
+                results = parse_batch(valid, determine_value, **options)
+                for text, result, reference_result in zip(valid, results, references):
+                    if result != reference_result:
+                        def disagrees(text):
+                            return not isinstance(outcome(reference, text, determine_value, options), Raised) and \
+                                parse_batch([text], determine_value, **options)[0] != \
+                                reference(text, determine_value=determine_value, **options)
+
+                        mismatches.append(Mismatch(lang, name, options, text, reference_result, result,
+                                                   shrink(text, disagrees)))
+                        break
+    return mismatches
+
+
+def run(budget=None, seed=None, languages=None, parallel=False):
+    """:param budget:    number of inputs per language, by default see budget_from_environment
+       :param seed:      seed of the random generator, by default $PARSE_NUMERIC_VALUE_FUZZ_SEED or 0
+       :param languages: language codes, by default all of them
+       :param parallel:  compare parse_numbers_parallel as well
+       :return: list of Mismatch"""
+    budget = budget_from_environment() if budget is None else budget
+    seed = int(os.environ.get('PARSE_NUMERIC_VALUE_FUZZ_SEED') or 0) if seed is None else seed
+    mismatches = []
+    for lang in languages or registry.languages():
+        mismatches += check(lang, generate_inputs(lang, budget, seed), parallel)
+    return mismatches
+
+
+if __name__ == '__main__':
+    found = run(int(sys.argv[1]) if len(sys.argv) > 1 else None, parallel=True)
+    for mismatch in found:
+        print('{0.lang} {0.implementation} {0.options}: {0.shrunk!r} (found as {0.text!r}) '
+              'gives {0.actual!r} instead of {0.expected!r}'.format(mismatch))
+    sys.exit(1 if found else 0)
@@ -0,0 +1,81 @@
+# coding: utf8
+"""Alternative engines behind the parse_number signature of the language modules.
+
+   regex:  the parse_number function of the language module itself
+   table:  a single dictionary lookup in a table holding every spelling
+           the language module generates, anything else is rejected
+   hybrid: the table, falling back to the regex for strings it doesn't cover
+   trie:   the same as table, a character trie walk gave the same results several times slower
+   mmap:   the table in a memory-mapped file shared by all processes, see parse_numeric_value.mapped"""
+from __future__ import unicode_literals
+
+from parse_numeric_value.registry import load_language, resolve_language
+
+ENGINES = ('regex', 'table', 'hybrid', 'trie', 'mmap')
+# Engines rejecting whatever the lookup table lacks, so their results differ from the regex for such strings
+TABLE_ONLY_ENGINES = ('table', 'trie', 'mmap')
+
+_tables = {}
+
+
+def build_table(lang, **options):
+    """Runs every candidate spelling of a language through its parse_number once
+       :param lang:    language code
+       :param options: extra keyword arguments for parse_number, e.g. strict_AN_spelling
+       :return: dict mapping the accepted spellings to a tuple consisting of
+                  * the result of parse_number with determine_value=True
+                  * the result of parse_number with determine_value=False"""
+    module = load_language(lang)
+    table = {}
+    for text in module.candidate_spellings():
+        try:
+            value = module.parse_number(text, determine_value=True, **options)
+            match = module.parse_number(text, determine_value=False, **options)
+        except (KeyError, TypeError):
+            # Left to the regex path, which fails the same way
+            continue
+        if match or value[1] is not None:
+            table[text] = (value, match)
+    return table
+
+
+def lookup_table(lang, **options):
+    """:return: the table for lang and options, read from its prebuilt file or built at first use,
+                see parse_numeric_value.artifacts"""
+    key = (resolve_language(lang), tuple(sorted(options.items())))
+    try:
+        return _tables[key]
+    except KeyError:
+        from parse_numeric_value.artifacts import load_table
+        table = _tables[key] = load_table(lang, **options)
+        return table
+
+
+def get_parser(lang, engine='regex'):
+    """:param lang:   language code
+       :param engine: one of ENGINES
+       :return: a function with the same signature and results as parse_number of the language module"""
+    lang = resolve_language(lang)
+    module = load_language(lang)
+    if engine == 'regex':
+        return module.parse_number
+    if engine not in ENGINES:
+        raise ValueError('Unknown engine {!r}, expected one of {}'.format(engine, ', '.join(ENGINES)))
+    if engine == 'mmap':
+        from parse_numeric_value.mapped import parse_number_with_mapped_table
+        parse_number = parse_number_with_mapped_table(lang)
+        parse_number.__doc__ = module.parse_number.__doc__
+        return parse_number
+    fallback = engine == 'hybrid'
+
+    def parse_number(number, determine_value=False, **options):
+        table = lookup_table(lang, **options) if options else _tables.get((lang, ())) or lookup_table(lang)
+        entry = table.get(number)
+        if entry is not None:
+            return entry[0] if determine_value else entry[1]
+        if fallback:
+            return module.parse_number(number, determine_value=determine_value, **options)
+        return (None, None) if determine_value else False
+
+    parse_number.__doc__ = module.parse_number.__doc__
+    return parse_number
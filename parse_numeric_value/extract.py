@@ -0,0 +1,57 @@
+# coding: utf8
+"""Find the numerals in running text, e.g. street names and descriptions, in a single pass."""
+from __future__ import unicode_literals
+
+import collections
+import re
+
+from parse_numeric_value.trie import get_trie
+
+Numeral = collections.namedtuple('Numeral', 'start end value ordinal')
+
+# A numeral can only start where a word does, e.g. after a space, a hyphen or an apostrophe
+word_start_re = re.compile(r"(?<![^\W\d_])[^\W\d_]")
+
+
+def _lower(text):
+    """Lower case keeping every character at its offset"""
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    return ''.join(c if len(c.lower()) != 1 else c.lower() for c in text)
+
+
+def extract_numerals(text, lang, compounds=False, **options):
+    """Walks the character trie of the language from the start of every word,
+       reporting the longest spelling found there
+       :param text:      running text
+       :param lang:      language code
+       :param compounds: also report numerals at the start of a longer word, e.g. tweede in Tweedestraat,
+                         which also finds acht in Achterweg
+       :param options:   extra keyword arguments for parse_number, e.g. strict_AN_spelling
+       :return: list of Numeral tuples consisting of start and end offset, value and ordinal flag"""
+    trie = get_trie(lang, **options)
+    lowered = _lower(text)
+    length = len(lowered)
+    numerals = []
+    end_of_last = 0
+    for match in word_start_re.finditer(lowered):
+        start = match.start()
+        if start < end_of_last:
+            continue
+        node = trie
+        found = None
+        position = start
+        while position < length:
+            node = node.get(lowered[position])
+            if node is None:
+                break
+            position += 1
+            entry = node.get(None)
+            if entry is not None and (compounds or position == length or not lowered[position].isalpha()):
+                found = position, entry
+        if found is not None:
+            end, ((value, ordinal), _) = found
+            numerals.append(Numeral(start, end, value, ordinal))
+            end_of_last = end
+    return numerals
@@ -0,0 +1,93 @@
+# coding: utf8
+"""Typo tolerant matching of numerals, e.g. vierhonderdvyftig for vierhonderdvijftig.
+
+   A Levenshtein automaton runs over the trie of the lookup table spellings, see parse_numeric_value.trie:
+   going down the trie it computes one row of the edit distance matrix per character,
+   only the band of cells near the diagonal that can stay within the maximum distance,
+   and abandons a branch as soon as every cell of its row exceeds the maximum distance,
+   so only the few branches near the text are visited instead of the whole vocabulary."""
+from __future__ import unicode_literals
+
+import collections
+import functools
+
+from parse_numeric_value.trie import get_trie, recognize
+
+DEFAULT_MAX_DISTANCE = 1
+DEFAULT_MIN_LENGTH = 4
+DEFAULT_MAXSIZE = 2 ** 16
+
+FuzzyMatch = collections.namedtuple('FuzzyMatch', 'text value ordinal distance')
+
+
+def search(trie, text, max_distance):
+    """:param trie:         root node of a trie
+       :param text:         text string to match
+       :param max_distance: maximum number of inserted, deleted or substituted characters
+       :return: list of tuples consisting of a spelling within max_distance of text, its entry and its distance"""
+    found = []
+    length = len(text)
+    beyond = max_distance + 1
+    first_row = [min(column, beyond) for column in range(length + 1)]
+    if None in trie and first_row[-1] <= max_distance:
+        found.append(('', trie[None], first_row[-1]))
+    stack = [('', trie, first_row)]
+    while stack:
+        prefix, node, row = stack.pop()
+        depth = len(prefix) + 1
+        # Only the cells within max_distance of the diagonal can stay within max_distance
+        start = max(1, depth - max_distance)
+        stop = min(length, depth + max_distance)
+        for char, child in node.items():
+            if char is None:
+                continue
+            next_row = [beyond] * (length + 1)
+            next_row[0] = min(depth, beyond)
+            best = next_row[0]
+            left = next_row[start - 1]
+            for column in range(start, stop + 1):
+                left = min(left + 1, row[column] + 1, row[column - 1] + (text[column - 1] != char), beyond)
+                next_row[column] = left
+                if left < best:
+                    best = left
+            if best > max_distance:
+                continue
+            spelling = prefix + char
+            if None in child and next_row[-1] <= max_distance:
+                found.append((spelling, child[None], next_row[-1]))
+            stack.append((spelling, child, next_row))
+    return found
+
+
+def fuzzy_matches(text, lang='nl', max_distance=DEFAULT_MAX_DISTANCE, **options):
+    """:param text:         text string that may be a misspelled number
+       :param lang:         language code
+       :param max_distance: maximum edit distance from text
+       :param options:      extra keyword arguments for parse_number, e.g. strict_AN_spelling
+       :return: list of FuzzyMatch for the numerals within max_distance of text, the closest first"""
+    matches = [FuzzyMatch(spelling, value, ordinal, distance)
+               for spelling, ((value, ordinal), match), distance in search(get_trie(lang, **options), text, max_distance)
+               if ordinal is not None]
+    matches.sort(key=lambda match: (match.distance, match.text))
+    return matches
+
+
+@functools.lru_cache(maxsize=DEFAULT_MAXSIZE)
+def fuzzy_parse_number(text, lang='nl', max_distance=DEFAULT_MAX_DISTANCE, min_length=DEFAULT_MIN_LENGTH,
+                       **options):
+    """:param text:         text string that may be a misspelled number
+       :param lang:         language code
+       :param max_distance: maximum edit distance from text
+       :param min_length:   shorter texts only match exactly, since e.g. en is a single edit away from een
+       :param options:      extra keyword arguments for parse_number, e.g. strict_AN_spelling
+       :return: the FuzzyMatch of the closest numeral, with distance 0 when text is spelled correctly,
+                or None when there's none within max_distance.
+                The results are memoized, cache_clear() empties the cache"""
+    trie = get_trie(lang, **options)
+    entry = recognize(trie, text)
+    if entry is not None and entry[0][1] is not None:
+        return FuzzyMatch(text, entry[0][0], entry[0][1], 0)
+    if len(text) < min_length:
+        return None
+    matches = fuzzy_matches(text, lang, max_distance, **options)
+    return matches[0] if matches else None
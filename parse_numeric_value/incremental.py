@@ -0,0 +1,175 @@
+# coding: utf8
+"""Store of the numerals in the tags of an OSM dataset, kept up to date by applying change files (.osc).
+
+   The SQLite database holds a row per scanned tag: its element, key, language, value and numerals,
+   and the version of the library and of the lookup table of its language that produced them.
+   Applying a change file parses only the tags whose value changed, and an upgrade of the library
+   or of one language makes refresh() parse only the rows produced by an older version.
+   The version also tells the engines that reject what the lookup table lacks apart, so opening the store
+   with an engine of the other kind makes refresh() parse every row again."""
+from __future__ import unicode_literals
+
+import json
+import sqlite3
+
+from parse_numeric_value.artifacts import result_version
+from parse_numeric_value.engines import TABLE_ONLY_ENGINES
+from parse_numeric_value.osm import DEFAULT_KEYS, iter_changes, iter_tags, relevant_tags, tag_numerals
+from parse_numeric_value.prefilter import prefiltered_parser
+from parse_numeric_value.registry import resolve_language
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS settings (name TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS tags (
+    element TEXT NOT NULL,
+    key TEXT NOT NULL,
+    lang TEXT NOT NULL,
+    text TEXT NOT NULL,
+    numerals TEXT NOT NULL,
+    version TEXT NOT NULL,
+    PRIMARY KEY (element, key)
+);
+CREATE INDEX IF NOT EXISTS tags_lang_version ON tags (lang, version);
+'''
+
+
+class ResultStore(object):
+    """The numerals in the tags of an OSM dataset, see the module docstring.
+       Each change is applied in one transaction, so an interrupted run leaves the previous state."""
+
+    def __init__(self, path, keys=DEFAULT_KEYS, default_lang=None, engine='regex'):
+        """:param path:         file name of the SQLite database, created when it doesn't exist
+           :param keys:         keys to scan, both as such and with a language suffix, e.g. name and name:nl
+           :param default_lang: language for keys without language suffix, None skips them
+           :param engine:       see parse_numeric_value.engines, its kind is part of the version of the rows
+           The keys and default_lang are stored with the database and can't differ when it's opened again"""
+        self.keys = set(keys)
+        self.default_lang = default_lang and resolve_language(default_lang)
+        self.engine = engine
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(SCHEMA)
+        settings = {'keys': json.dumps(sorted(self.keys)), 'default_lang': json.dumps(self.default_lang)}
+        with self.connection:
+            for name, value in settings.items():
+                self.connection.execute('INSERT OR IGNORE INTO settings VALUES (?, ?)', (name, value))
+        stored = dict(self.connection.execute(
+            "SELECT name, value FROM settings WHERE name IN ('keys', 'default_lang')"))
+        if stored != settings:
+            self.connection.close()
+            raise ValueError('{} was created for keys {} and default_lang {}'.format(
+                path, ', '.join(json.loads(stored['keys'])), json.loads(stored['default_lang'])))
+        self._parsers = {}
+        self._versions = {}
+
+    def _version(self, lang):
+        try:
+            return self._versions[lang]
+        except KeyError:
+            version = result_version(lang)
+            if self.engine in TABLE_ONLY_ENGINES:
+                version += '/table'
+            self._versions[lang] = version
+            return version
+
+    def _parse(self, text, lang, counts):
+        """:param counts: dict counting the tokens parse_number raised for as errors
+           :return: a tuple consisting of the numerals in text as JSON and the version that produced them"""
+        try:
+            parse_number = self._parsers[lang]
+        except KeyError:
+            parse_number = self._parsers[lang] = prefiltered_parser(lang, self.engine)
+        errors = []
+        numerals = tag_numerals(text, lang, parse_number, errors)
+        counts['errors'] += len(errors)
+        return json.dumps(numerals, ensure_ascii=False), self._version(lang)
+
+    def _update(self, element_id, tags, counts):
+        stored = {key: (lang, text, version) for key, lang, text, version in self.connection.execute(
+            'SELECT key, lang, text, version FROM tags WHERE element = ?', (element_id,))}
+        for key, lang, text in relevant_tags(tags, self.keys, self.default_lang):
+            if stored.pop(key, None) == (lang, text, self._version(lang)):
+                counts['unchanged'] += 1
+                continue
+            numerals, version = self._parse(text, lang, counts)
+            self.connection.execute('INSERT OR REPLACE INTO tags VALUES (?, ?, ?, ?, ?, ?)',
+                                    (element_id, key, lang, text, numerals, version))
+            counts['parsed'] += 1
+        for key in stored:
+            self.connection.execute('DELETE FROM tags WHERE element = ? AND key = ?', (element_id, key))
+            counts['deleted'] += 1
+
+    def load(self, source):
+        """Adds or updates the elements of an OSM file, see parse_numeric_value.osm.iter_tags
+           :return: dict with the number of tags parsed, unchanged and deleted,
+                    and the number of tokens parse_number raised for, which are taken not to be numerals"""
+        counts = {'parsed': 0, 'unchanged': 0, 'deleted': 0, 'errors': 0}
+        with self.connection:
+            for element_id, tags in iter_tags(source):
+                self._update(element_id, tags, counts)
+        return counts
+
+    def apply_change(self, source, sequence=None):
+        """Applies an OSM change file, parsing only the tags that were created or whose value was modified
+           :param source:   file name of an .osc file, optionally compressed, or a binary file object
+           :param sequence: sequence number of the change file, stored as self.sequence
+           :return: dict with the number of tags parsed, unchanged and deleted, and of errors, see load"""
+        counts = {'parsed': 0, 'unchanged': 0, 'deleted': 0, 'errors': 0}
+        with self.connection:
+            for action, element_id, tags in iter_changes(source):
+                self._update(element_id, {} if action == 'delete' else tags, counts)
+            if sequence is not None:
+                self.connection.execute("INSERT OR REPLACE INTO settings VALUES ('sequence', ?)", (str(sequence),))
+        return counts
+
+    @property
+    def sequence(self):
+        """The sequence number of the last change file applied, or None"""
+        row = self.connection.execute("SELECT value FROM settings WHERE name = 'sequence'").fetchone()
+        return row and int(row[0])
+
+    def stale(self):
+        """:return: dict mapping languages to the number of rows produced by another version than the current one"""
+        counts = {}
+        for lang, version, count in self.connection.execute(
+                'SELECT lang, version, COUNT(*) FROM tags GROUP BY lang, version'):
+            if version != self._version(lang):
+                counts[lang] = counts.get(lang, 0) + count
+        return counts
+
+    def refresh(self):
+        """Parses the rows produced by another version than the current one again, from their stored value
+           :return: number of rows parsed"""
+        parsed = 0
+        counts = {'errors': 0}
+        with self.connection:
+            for lang in list(self.stale()):
+                rows = self.connection.execute('SELECT element, key, text FROM tags WHERE lang = ? AND version != ?',
+                                               (lang, self._version(lang))).fetchall()
+                for element_id, key, text in rows:
+                    numerals, version = self._parse(text, lang, counts)
+                    self.connection.execute('UPDATE tags SET numerals = ?, version = ? WHERE element = ? AND key = ?',
+                                            (numerals, version, element_id, key))
+                parsed += len(rows)
+        return parsed
+
+    def numerals(self, element_id=None):
+        """:param element_id: only the numerals of this element, e.g. node/42, None for all of them
+           :return: iterator over tuples consisting of the element id, the key, the token holding the numeral,
+                    the value it represents and whether it's an ordinal, as scan_tags yields them"""
+        if element_id is None:
+            rows = self.connection.execute("SELECT element, key, numerals FROM tags WHERE numerals != '[]'")
+        else:
+            rows = self.connection.execute("SELECT element, key, numerals FROM tags WHERE element = ? "
+                                           "AND numerals != '[]'", (element_id,))
+        for element, key, numerals in rows:
+            for token, value, ordinal in json.loads(numerals):
+                yield element, key, token, value, ordinal
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
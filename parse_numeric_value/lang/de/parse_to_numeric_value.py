@@ -1,8 +1,8 @@
 # coding: utf8
 from __future__ import unicode_literals
 import re
-# from pprint import pprint
 
+from parse_numeric_value.compose import parse_phrase
 
 wrong_ordinals_re = re.compile(r"""(?x)
 .*(?P<wrong>einte|dreite|siebente|achtte)
@@ -95,6 +95,57 @@ for number, text in numeric_lookup.items():
         text_lookup[text] = number
 
 
+def candidate_spellings():
+    """Generates single word spellings composed from the morphemes above,
+       covering the range parse_number supports: 0-999, their multiples of 1 thousand
+       and the scale words, both as cardinal and as ordinal.
+       Not every candidate is valid, parse_number has the final say.
+       :return: iterator over text strings that may be a number"""
+    units = ['ein', 'eins', 'zwei', 'drei', 'vier', 'fünf', 'sechs', 'sieben', 'acht', 'neun']
+    below_13 = units + ['zehn', 'elf', 'zwölf']
+    teens = ['dreizehn', 'vierzehn', 'fünfzehn', 'sechzehn', 'siebzehn', 'achtzehn', 'neunzehn']
+    tens = ['zwanzig', 'dreizig', 'dreißig', 'vierzig', 'fünfzig', 'sechzig', 'siebzig', 'achtzig', 'neunzig']
+    below_100 = below_13 + teens + tens + [u + 'und' + t for u in units if u != 'eins' for t in tens]
+    hundreds = ['hundert'] + [u + 'hundert' for u in units if u != 'eins']
+
+    cardinals = ['null'] + below_100 + hundreds
+    cardinals += [h + b for h in hundreds for b in below_100]
+    cardinals += [c + 'tausend' for c in cardinals[1:] if not c.endswith('eins')] + ['tausend']
+    for cardinal in cardinals:
+        yield cardinal
+        for suffix in ('te', 'ste'):
+            for gender in ('', 'r', 's'):
+                yield cardinal + suffix + gender
+        for irregular, ordinal in (('eins', 'erste'), ('ein', 'erste'), ('drei', 'dritte'),
+                                   ('sieben', 'siebte'), ('acht', 'achte')):
+            if cardinal.endswith(irregular):
+                for gender in ('', 'r', 's'):
+                    yield cardinal[:-len(irregular)] + ordinal + gender
+    for number, text in numeric_lookup.items():
+        if number >= 1000000:
+            yield text
+            yield text + 'ste'
+
+
+# Called as trace(text, path, groups) for every call of parse_number while set, see set_trace
+trace = None
+
+
+def set_trace(callback):
+    """Reports which path parse_number takes for each text it is called with
+       :param callback: function accepting
+                         * the text parse_number is called with
+                         * the path it takes: empty, special_case, dict, ordinal_reject, regex
+                                                   or multi_word
+                         * a dict with the groups the regex matched on the regex path, otherwise None
+                        or None to stop tracing
+       :return: the callback that was set before"""
+    global trace
+    previous = trace
+    trace = callback
+    return previous
+
+
 def parse_number(number, determine_value=False):
     """Accepts German text representing a number which can be written as a single word
        in the range of 0-999 and their multiples of 1 thousand.
@@ -109,11 +160,19 @@ def parse_number(number, determine_value=False):
                 otherwise a boolean
                   * True:  This string represents a numeral
                   * False: Can't be a correctly spelled numeral in German"""
+    if ' ' in number:
+        if trace is not None:
+            trace(number, 'multi_word', None)
+        return parse_phrase(number, 'de', determine_value=determine_value)
+
     result = None
+    path = None
     if number == '':
         result = None, None
+        path = 'empty'
     elif number == 'eins':
         result = 1, False
+        path = 'special_case'
 
     # First a simple check using dictionary lookup
     ordinal = False
@@ -126,14 +185,18 @@ def parse_number(number, determine_value=False):
         ordinal = True
     if base in text_lookup:
         result = text_lookup[base], ordinal
+        path = 'dict'
 
     # But that naive approach needs to be counteracted
     # using a lightweight regex
     test_ordinals = wrong_ordinals_re.match(number)
     if test_ordinals and test_ordinals.group('wrong'):
         result = None, None
+        path = 'ordinal_reject'
 
     if result:
+        if trace is not None:
+            trace(number, path, None)
         if determine_value:
             return result
         else:
@@ -142,6 +205,8 @@ def parse_number(number, determine_value=False):
     # And then we can bring out the heavyweight regex
     value = 0
     m = hundreds_units_and_tens_thousand_re.match(number)
+    if trace is not None:
+        trace(number, 'regex', m.groupdict())
     if m:
         if m.group('ordinal'):
             ordinal = True
@@ -2,7 +2,8 @@
 from __future__ import unicode_literals
 
 import re
-#from pprint import pprint
+
+from parse_numeric_value.compose import parse_phrase
 
 hundreds_tens_units_re = re.compile(r"""(?x)
       (
@@ -93,6 +94,68 @@ for number, text in numeric_lookup.items():
         text_lookup[text] = number
 
 
+def candidate_spellings():
+    """Generates spellings composed from the morphemes above, covering the range
+       parse_number supports: 0-999, including the regional variants for 70-99,
+       and the scale words, both as cardinal and as ordinal.
+       Not every candidate is valid, parse_number has the final say.
+       :return: iterator over text strings that may be a number"""
+    below_100 = []
+    for number, text in numeric_lookup.items():
+        if number < 100:
+            below_100.extend(text if type(text) in (list, tuple) else [text])
+    for tens in ('vingt', 'trente', 'quarante', 'cinquante', 'soixante'):
+        below_100 += [tens + '-et-un', tens + '-et-une']
+        below_100 += [tens + '-' + units for units in ('deux', 'trois', 'quatre', 'cinq',
+                                                       'six', 'sept', 'huit', 'neuf')]
+    below_100 += ['quatre-vingt']
+    hundreds = ['cent', 'cents']
+    hundreds += [units + separator + hundred
+                 for units in ('deux', 'trois', 'quatre', 'cinq', 'six', 'sept', 'huit', 'neuf')
+                 for separator in ('-', ' ')
+                 for hundred in ('cent', 'cents')]
+
+    cardinals = below_100 + hundreds
+    cardinals += [h + separator + b for h in hundreds for separator in ('-', ' ') for b in below_100]
+    for cardinal in cardinals:
+        yield cardinal
+        if cardinal.endswith('e'):
+            yield cardinal[:-1] + 'ième'
+        elif cardinal.endswith('cinq'):
+            yield cardinal + 'uième'
+        elif cardinal.endswith('neuf'):
+            yield cardinal[:-1] + 'vième'
+        elif cardinal.endswith('s'):
+            yield cardinal[:-1] + 'ième'
+        else:
+            yield cardinal + 'ième'
+    for ordinal in ('premier', 'première', 'premiers', 'premières'):
+        yield ordinal
+    for number, text in numeric_lookup.items():
+        if number >= 1000:
+            for item in (text if type(text) in (list, tuple) else [text]):
+                yield item
+                yield item[:-1] + 'ième' if item.endswith('e') else item + 'ième'
+
+
+# Called as trace(text, path, groups) for every call of parse_number while set, see set_trace
+trace = None
+
+
+def set_trace(callback):
+    """Reports which path parse_number takes for each text it is called with
+       :param callback: function accepting
+                         * the text parse_number is called with
+                         * the path it takes: empty, special_case, regex or multi_word
+                         * a dict with the groups the regex matched on the regex path, otherwise None
+                        or None to stop tracing
+       :return: the callback that was set before"""
+    global trace
+    previous = trace
+    trace = callback
+    return previous
+
+
 def parse_number(number, determine_value=False):
     """Accepts French text representing a number which can be written, usually separated by hyphens
        :param number:             text string that may be a number
@@ -107,13 +170,22 @@ def parse_number(number, determine_value=False):
                  a tuple consisting of
                   * True:  This string can represent a numeral
                   * False: Can't be a numeral in French"""
+    if ' ' in number:
+        if trace is not None:
+            trace(number, 'multi_word', None)
+        return parse_phrase(number, 'fr', determine_value=determine_value)
+
     result = None
     if number == '':
         result = None, None
+        path = 'empty'
     elif number in ['un', 'une']:
         result = 1, False
+        path = 'special_case'
 
     if result:
+        if trace is not None:
+            trace(number, path, None)
         if determine_value:
             return result
         else:
@@ -122,8 +194,8 @@ def parse_number(number, determine_value=False):
     value = 0
     ordinal = False
     m = hundreds_tens_units_re.match(number)
-    # print(number)
-    # pprint(m.groupdict())
+    if trace is not None:
+        trace(number, 'regex', m.groupdict())
 
     if m:
         if m.group('ordinal'):
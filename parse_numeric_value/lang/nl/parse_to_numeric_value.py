@@ -1,7 +1,8 @@
 # coding: utf8
 from __future__ import unicode_literals
 import re
-from pprint import pprint
+
+from parse_numeric_value.compose import parse_phrase
 
 wrong_ordinals_re = re.compile(r"""(?x)
 .*(?P<wrong>nulste|eende|tweeste|driede|vierste|vijfste|
@@ -87,6 +88,58 @@ for number, text in numeric_lookup.items():
     else:
         text_lookup[text] = number
 
+
+def candidate_spellings():
+    """Generates single word spellings composed from the morphemes above,
+       covering the range parse_number supports: 0-999, their multiples of 1 thousand
+       and the scale words, both as cardinal and as ordinal.
+       Not every candidate is valid, parse_number has the final say.
+       :return: iterator over text strings that may be a number"""
+    units = ['een', 'één', 'twee', 'drie', 'vier', 'vijf', 'zes', 'zeven', 'acht', 'negen']
+    below_13 = units + ['tien', 'elf', 'twaalf']
+    teens = ['dertien', 'veertien', 'vijftien', 'zestien', 'zeventien', 'achttien', 'negentien']
+    tens = ['twintig', 'dertig', 'veertig', 'vijftig', 'zestig', 'zeventig', 'tachtig', 'negentig']
+    units_and = ['eenen', 'tweeën', 'drieën', 'vieren', 'vijfen', 'zesen', 'zevenen', 'achten', 'negenen']
+    below_100 = below_13 + teens + tens + [u + t for u in units_and for t in tens]
+    hundreds = ['honderd'] + [u + 'honderd' for u in units[2:]]
+
+    cardinals = ['nul'] + below_100 + hundreds
+    cardinals += [h + conjunction + b for h in hundreds for conjunction in ('', 'en') for b in below_100]
+    cardinals += [c + 'duizend' for c in cardinals[1:]] + ['duizend']
+    for cardinal in cardinals:
+        yield cardinal
+        yield cardinal + 'ste'
+        yield cardinal + 'de'
+        for irregular, ordinal in (('een', 'eerste'), ('één', 'eerste'), ('drie', 'derde')):
+            if cardinal.endswith(irregular):
+                yield cardinal[:-len(irregular)] + ordinal
+    for number, text in numeric_lookup.items():
+        if number >= 1000000:
+            yield text
+            yield text + 'ste'
+    yield 'driekwart'
+    yield 'driekwartste'
+
+
+# Called as trace(text, path, groups) for every call of parse_number while set, see set_trace
+trace = None
+
+
+def set_trace(callback):
+    """Reports which path parse_number takes for each text it is called with
+       :param callback: function accepting
+                         * the text parse_number is called with
+                         * the path it takes: empty, special_case, dict, ordinal_reject, regex
+                                                   or multi_word
+                         * a dict with the groups the regex matched on the regex path, otherwise None
+                        or None to stop tracing
+       :return: the callback that was set before"""
+    global trace
+    previous = trace
+    trace = callback
+    return previous
+
+
 def parse_number(number_text, determine_value=False, strict_AN_spelling=False):
     """Accepts Dutch text representing a number which can be written as a single word
        in the range of 0-999 and their multiples of 1 thousand.
@@ -105,22 +158,22 @@ def parse_number(number_text, determine_value=False, strict_AN_spelling=False):
                   * True:  This string represents a numeral
                   * False: Can't be a correctly spelled numeral in Standard Dutch"""
     if ' ' in number_text:
-        value = 0
-        for word in number_text.split(' '):
-            print(word)
-            v = parse_number(word, determine_value=determine_value, strict_AN_spelling=strict_AN_spelling)
-            print(v)
-            if v and v[0]:
-                value += v[0]
-        return value, v[1]
+        if trace is not None:
+            trace(number_text, 'multi_word', None)
+        return parse_phrase(number_text, 'nl', determine_value=determine_value,
+                            strict_AN_spelling=strict_AN_spelling)
 
     result = None
+    path = None
     if number_text == '':
         result = None, None
+        path = 'empty'
     elif number_text == 'driekwart':  # '3/4 is the only fraction that can be written in one word in Dutch
         result = 0.75, False
+        path = 'special_case'
     elif number_text == 'driekwartste':  # Farfetched indeed, except maybe in Harry Potter book
         result = 0.75, True
+        path = 'special_case'
 
     # First a simple check using dictionary lookup
     ordinal = False
@@ -133,6 +186,7 @@ def parse_number(number_text, determine_value=False, strict_AN_spelling=False):
         ordinal = True
     if base in text_lookup:
         result = text_lookup[base], ordinal
+        path = 'dict'
 
     # But that naive approach needs to be counteracted
     # using a lightweight regex in case strict adherence to
@@ -141,8 +195,11 @@ def parse_number(number_text, determine_value=False, strict_AN_spelling=False):
         test_ordinals = wrong_ordinals_re.match(number_text)
         if test_ordinals and test_ordinals.group('wrong'):
             result = None, None
+            path = 'ordinal_reject'
 
     if result:
+        if trace is not None:
+            trace(number_text, path, None)
         if determine_value:
             return result
         else:
@@ -151,7 +208,8 @@ def parse_number(number_text, determine_value=False, strict_AN_spelling=False):
     # And then we can bring out the heavyweight regex
     value = 0
     m = hundreds_units_and_tens_thousand_re.match(number_text)
-    pprint(m.groupdict())
+    if trace is not None:
+        trace(number_text, 'regex', m.groupdict())
 
     if m:
         if m.group('ordinal'):
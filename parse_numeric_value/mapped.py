@@ -0,0 +1,236 @@
+# coding: utf8
+"""Lookup tables in a read-only file format that is memory-mapped instead of read,
+   so every process on a machine shares the one copy in the page cache.
+
+   The file consists of
+     * a header: magic, format version, number of entries, number of slots, table_version
+     * the slots of an open addressing hash table on the CRC-32 of the UTF-8 key,
+       each holding the index of an entry or EMPTY
+     * the entries: offset and length of the key, kind of the value, ordinal, match and 8 bytes of value
+     * the keys, and the decimal digits of values that don't fit in 8 bytes
+   A lookup unpacks a few fields straight from the mapping and builds nothing but its result."""
+from __future__ import unicode_literals
+
+import mmap
+import os
+import struct
+import tempfile
+import zlib
+
+from parse_numeric_value.artifacts import PACKAGE_DIRECTORY, artifact_path, cache_directory, table_version
+from parse_numeric_value.registry import resolve_language
+
+MAGIC = b'PNVM'
+FORMAT_VERSION = 1
+
+HEADER = struct.Struct('<4sIII40s')
+SLOT = struct.Struct('<I')
+ENTRY = struct.Struct('<IHBbB')
+ENTRY_SIZE = ENTRY.size + 8
+INT64 = struct.Struct('<q')
+FLOAT64 = struct.Struct('<d')
+DIGITS = struct.Struct('<II')
+
+EMPTY = 0xFFFFFFFF
+
+# Kinds of value
+NONE, INT, FLOAT, BIG_INT = range(4)
+
+_mapped = {}
+
+
+def _encode_value(value, blob):
+    if value is None:
+        return NONE, INT64.pack(0)
+    if type(value) is float:
+        return FLOAT, FLOAT64.pack(value)
+    if -2 ** 63 <= value < 2 ** 63:
+        return INT, INT64.pack(value)
+    digits = str(value).encode('ascii')
+    blob += digits
+    return BIG_INT, DIGITS.pack(len(blob) - len(digits), len(digits))
+
+
+def write_mapped_table(table, path, version):
+    """Writes table in the memory-mappable format, replacing path atomically
+       :param table:   dict mapping spellings to their entries, see parse_numeric_value.engines.build_table
+       :param path:    file name
+       :param version: see parse_numeric_value.artifacts.table_version"""
+    items = sorted(table.items())
+    slot_count = 2
+    while slot_count < 2 * len(items):
+        slot_count *= 2
+    mask = slot_count - 1
+    slots = [EMPTY] * slot_count
+    entries = bytearray()
+    blob = bytearray()
+    for index, (text, ((value, ordinal), match)) in enumerate(items):
+        key = text.encode('utf8')
+        key_offset = len(blob)
+        blob += key
+        kind, payload = _encode_value(value, blob)
+        entries += ENTRY.pack(key_offset, len(key), kind, -1 if ordinal is None else int(ordinal), int(bool(match)))
+        entries += payload
+        slot = zlib.crc32(key) & mask
+        while slots[slot] != EMPTY:
+            slot = (slot + 1) & mask
+        slots[slot] = index
+
+    directory = os.path.dirname(path)
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+    fd, temporary = tempfile.mkstemp(dir=directory, prefix='.parse_numeric_value', suffix='.mmap')
+    try:
+        with os.fdopen(fd, 'wb') as fh:
+            fh.write(HEADER.pack(MAGIC, FORMAT_VERSION, len(items), slot_count, version.encode('ascii')))
+            fh.write(struct.pack('<{}I'.format(slot_count), *slots))
+            fh.write(entries)
+            fh.write(blob)
+        os.chmod(temporary, 0o644)
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+
+
+class MappedTable(object):
+    """Read-only view of a table written by write_mapped_table, with the interface of a dict"""
+
+    def __init__(self, path):
+        with open(path, 'rb') as fh:
+            self._map = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, format_version, self._count, slot_count, version = HEADER.unpack_from(self._map, 0)
+        except struct.error:
+            magic = format_version = None
+        if magic != MAGIC or format_version != FORMAT_VERSION:
+            self._map.close()
+            raise ValueError('{} is not a table in format {}'.format(path, FORMAT_VERSION))
+        self.path = path
+        self.version = version.decode('ascii')
+        self._mask = slot_count - 1
+        self._slots = HEADER.size
+        self._entries = self._slots + SLOT.size * slot_count
+        self._blob = self._entries + ENTRY_SIZE * self._count
+
+    def _entry(self, position):
+        key_offset, key_length, kind, ordinal, match = ENTRY.unpack_from(self._map, position)
+        if kind == INT:
+            value = INT64.unpack_from(self._map, position + ENTRY.size)[0]
+        elif kind == FLOAT:
+            value = FLOAT64.unpack_from(self._map, position + ENTRY.size)[0]
+        elif kind == BIG_INT:
+            offset, length = DIGITS.unpack_from(self._map, position + ENTRY.size)
+            value = int(self._map[self._blob + offset:self._blob + offset + length])
+        else:
+            value = None
+        return (value, None if ordinal < 0 else bool(ordinal)), bool(match)
+
+    def get(self, text, default=None):
+        """:return: the entry of text, or default when the table doesn't hold it"""
+        key = text.encode('utf8')
+        data, mask, blob = self._map, self._mask, self._blob
+        slot = zlib.crc32(key) & mask
+        while True:
+            index = SLOT.unpack_from(data, self._slots + SLOT.size * slot)[0]
+            if index == EMPTY:
+                return default
+            position = self._entries + ENTRY_SIZE * index
+            key_offset, key_length = ENTRY.unpack_from(data, position)[:2]
+            if key_length == len(key) and data[blob + key_offset:blob + key_offset + key_length] == key:
+                return self._entry(position)
+            slot = (slot + 1) & mask
+
+    def __getitem__(self, text):
+        entry = self.get(text)
+        if entry is None:
+            raise KeyError(text)
+        return entry
+
+    def __contains__(self, text):
+        return self.get(text) is not None
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        for index in range(self._count):
+            key_offset, key_length = ENTRY.unpack_from(self._map, self._entries + ENTRY_SIZE * index)[:2]
+            yield self._map[self._blob + key_offset:self._blob + key_offset + key_length].decode('utf8')
+
+    def items(self):
+        for index, text in enumerate(self):
+            yield text, self._entry(self._entries + ENTRY_SIZE * index)
+
+    def close(self):
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def mapped_path(lang, directory=PACKAGE_DIRECTORY, **options):
+    """:return: the file name of the memory-mappable table of lang in directory"""
+    return artifact_path(lang, directory, **options)[:-len('.table')] + '.mmap'
+
+
+def _open_current(path, version):
+    try:
+        table = MappedTable(path)
+    except (OSError, ValueError):
+        return None
+    if table.version != version:
+        table.close()
+        return None
+    return table
+
+
+def mapped_table(lang, directories=None, **options):
+    """:param lang:        language code
+       :param directories: directories to look in, by default the package data and the cache directory
+       :param options:     extra keyword arguments for parse_number, e.g. strict_AN_spelling
+       :return: the MappedTable of lang, opened once per process, written first when there's no current one"""
+    key = (resolve_language(lang), tuple(sorted(options.items())), tuple(directories or ()))
+    try:
+        return _mapped[key]
+    except KeyError:
+        pass
+    from parse_numeric_value.engines import lookup_table
+    version = table_version(lang, **options)
+    directories = directories or (PACKAGE_DIRECTORY, cache_directory())
+    for directory in directories:
+        table = _open_current(mapped_path(lang, directory, **options), version)
+        if table is not None:
+            break
+    else:
+        table = None
+        for directory in directories:
+            path = mapped_path(lang, directory, **options)
+            try:
+                write_mapped_table(lookup_table(lang, **options), path, version)
+            except OSError:
+                continue
+            table = MappedTable(path)
+            break
+        if table is None:
+            raise OSError('None of {} is writable'.format(', '.join(directories)))
+    _mapped[key] = table
+    return table
+
+
+def parse_number_with_mapped_table(lang):
+    """:return: a function with the signature of parse_number of the language module,
+                rejecting every string the memory-mapped table doesn't hold"""
+    lang = resolve_language(lang)
+
+    def parse_number(number, determine_value=False, **options):
+        table = mapped_table(lang, **options) if options else _mapped.get((lang, (), ())) or mapped_table(lang)
+        entry = table.get(number)
+        if entry is None:
+            return (None, None) if determine_value else False
+        return entry[0] if determine_value else entry[1]
+
+    return parse_number
@@ -0,0 +1,127 @@
+# coding: utf8
+"""Per-path call counters and latency histograms for parse_number.
+
+   The path each call takes is reported by the trace hook of the language modules,
+   calls answered without reaching parse_number of the module are counted under the engine name."""
+from __future__ import unicode_literals
+
+import bisect
+import os
+import tempfile
+import time
+
+from parse_numeric_value.engines import get_parser
+from parse_numeric_value.registry import load_language, resolve_language
+
+# Upper bounds of the latency buckets in seconds
+BUCKETS = (1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 1e-3, 1e-2)
+
+PREFIX = 'parse_numeric_value'
+
+
+class ParseMetrics(object):
+    """Collects the number of calls and their latencies per language and path"""
+
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = tuple(buckets)
+        # (lang, path) -> [count per bucket, the last one for slower calls, sum of the latencies]
+        self.histograms = {}
+        self._installed = {}
+
+    def observe(self, lang, path, seconds):
+        """Records a call of parse_number taking seconds"""
+        try:
+            histogram = self.histograms[(lang, path)]
+        except KeyError:
+            histogram = self.histograms[(lang, path)] = [0] * (len(self.buckets) + 1) + [0.0]
+        histogram[bisect.bisect_left(self.buckets, seconds)] += 1
+        histogram[-1] += seconds
+
+    def instrument(self, lang, engine='regex'):
+        """:param lang:   language code
+           :param engine: see parse_numeric_value.engines
+           :return: a function with the same signature and results as parse_number of the language module,
+                    recording every call in these metrics"""
+        lang = resolve_language(lang)
+        module = load_language(lang)
+        parse = get_parser(lang, engine)
+        # Builds the tables of the engine before anything is recorded
+        parse('')
+        if lang in self._installed:
+            last_path = self._installed[lang][3]
+        else:
+            last_path = [None]
+            previous = module.trace
+
+            def trace(text, path, groups):
+                if last_path[0] is None:
+                    last_path[0] = path
+                if previous is not None:
+                    previous(text, path, groups)
+
+            self._installed[lang] = (module, previous, trace, last_path)
+            module.set_trace(trace)
+        observe = self.observe
+        clock = time.perf_counter
+
+        def parse_number(number, determine_value=False, **options):
+            last_path[0] = None
+            start = clock()
+            result = parse(number, determine_value=determine_value, **options)
+            observe(lang, last_path[0] or engine, clock() - start)
+            return result
+
+        parse_number.__doc__ = parse.__doc__
+        return parse_number
+
+    def uninstall(self):
+        """Restores the trace hooks the language modules had before instrument was called"""
+        for module, previous, trace, last_path in self._installed.values():
+            if module.trace is trace:
+                module.set_trace(previous)
+        self._installed = {}
+
+    def counts(self):
+        """:return: dict mapping (lang, path) to the number of calls"""
+        return {key: sum(histogram[:-1]) for key, histogram in self.histograms.items()}
+
+    def as_dict(self):
+        """:return: the metrics as a plain dict, suitable for JSON"""
+        result = {}
+        for (lang, path), histogram in sorted(self.histograms.items()):
+            result.setdefault(lang, {})[path] = {
+                'count': sum(histogram[:-1]),
+                'sum_seconds': histogram[-1],
+                'buckets': dict(zip([repr(bound) for bound in self.buckets] + ['+Inf'], histogram[:-1])),
+            }
+        return result
+
+    def to_prometheus(self):
+        """:return: the metrics in the Prometheus text exposition format"""
+        lines = ['# HELP {}_calls_total Calls of parse_number per language and path'.format(PREFIX),
+                 '# TYPE {}_calls_total counter'.format(PREFIX)]
+        for (lang, path), count in sorted(self.counts().items()):
+            lines.append('{}_calls_total{{lang="{}",path="{}"}} {}'.format(PREFIX, lang, path, count))
+        lines += ['# HELP {}_seconds Latency of parse_number per language and path'.format(PREFIX),
+                  '# TYPE {}_seconds histogram'.format(PREFIX)]
+        for (lang, path), histogram in sorted(self.histograms.items()):
+            labels = 'lang="{}",path="{}"'.format(lang, path)
+            cumulative = 0
+            for bound, count in zip([repr(bound) for bound in self.buckets] + ['+Inf'], histogram[:-1]):
+                cumulative += count
+                lines.append('{}_seconds_bucket{{{},le="{}"}} {}'.format(PREFIX, labels, bound, cumulative))
+            lines.append('{}_seconds_sum{{{}}} {!r}'.format(PREFIX, labels, histogram[-1]))
+            lines.append('{}_seconds_count{{{}}} {}'.format(PREFIX, labels, cumulative))
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, path):
+        """Writes the metrics in the Prometheus text format to path, replacing it atomically
+           so a textfile collector never reads a partial file"""
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, temporary = tempfile.mkstemp(dir=directory, prefix='.parse_numeric_value', suffix='.prom')
+        with os.fdopen(fd, 'w') as fh:
+            fh.write(self.to_prometheus())
+        os.replace(temporary, path)
+
+    def reset(self):
+        self.histograms = {}
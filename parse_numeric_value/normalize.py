@@ -0,0 +1,55 @@
+# coding: utf8
+"""Normalization of text before it's parsed, so spellings as found in the wild reach the dictionary lookups:
+   NFC, lower case, - for every kind of hyphen and dash, single spaces
+   and optionally diacritics restored where they're left out or written as in fuenf.
+
+   The results are memoized, so text that repeats costs a single cache lookup."""
+from __future__ import unicode_literals
+
+import functools
+import unicodedata
+
+from parse_numeric_value.registry import resolve_language
+
+DEFAULT_MAXSIZE = 2 ** 16
+
+# Hyphens, dashes and minus signs, all written as -, soft hyphens are dropped
+_dashes = dict.fromkeys(map(ord, '\u2010\u2011\u2012\u2013\u2014\u2015\u2212\ufe58\ufe63\uff0d'), '-')
+_dashes[0xad] = None
+
+# Per language the morphemes without their diacritics, or spelled out, and the form the parser accepts,
+# applied in this order to text stripped of its diacritics, the German parser knows 30 as dreizig only
+morphemes = {'nl': (('eeen', 'eeën'), ('ieen', 'ieën')),
+             'de': (('fuenf', 'fünf'), ('funf', 'fünf'), ('zwoelf', 'zwölf'), ('zwolf', 'zwölf'),
+                    ('dreissig', 'dreizig'), ('dreißig', 'dreizig')),
+             'fr': (('zero', 'zéro'), ('ieme', 'ième'), ('premiere', 'première'), ('decilli', 'décilli'))}
+
+
+def strip_diacritics(text):
+    """:return: text without combining marks, e.g. een for één"""
+    return ''.join(c for c in unicodedata.normalize('NFD', text) if not unicodedata.combining(c))
+
+
+@functools.lru_cache(maxsize=DEFAULT_MAXSIZE)
+def normalize(text, lang='nl', fold_diacritics=False):
+    """:param text:            text string that may be a number
+       :param lang:            language code, see parse_numeric_value.registry.resolve_language
+       :param fold_diacritics: accept the number words of lang without their diacritics,
+                               or with the umlauts spelled out, as in fuenf or tweeenveertig
+       :return: text in the form the parsers of lang expect"""
+    text = ' '.join(unicodedata.normalize('NFC', text).lower().translate(_dashes).split())
+    if fold_diacritics:
+        text = strip_diacritics(text)
+        for folded, canonical in morphemes.get(resolve_language(lang), ()):
+            text = text.replace(folded, canonical)
+    return text
+
+
+def normalizing_parser(parse_number, lang, fold_diacritics=False):
+    """:param parse_number:    function with the signature of parse_number of the language module
+       :return: parse_number applied to normalized text"""
+    def parse_normalized(number, determine_value=False, **options):
+        return parse_number(normalize(number, lang, fold_diacritics), determine_value=determine_value, **options)
+
+    parse_normalized.__doc__ = parse_number.__doc__
+    return parse_normalized
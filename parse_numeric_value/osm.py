@@ -0,0 +1,176 @@
+# coding: utf8
+"""Stream the tags of OSM files and yield the numerals found in their values."""
+from __future__ import unicode_literals
+
+import bz2
+import gzip
+import re
+import xml.etree.ElementTree as ElementTree
+
+from parse_numeric_value.prefilter import prefiltered_parser
+from parse_numeric_value.registry import resolve_language
+
+DEFAULT_KEYS = ('name', 'addr:street', 'ref')
+ELEMENTS = ('node', 'way', 'relation')
+ACTIONS = ('create', 'modify', 'delete')
+
+# In French hyphens are part of the numerals, in Dutch and German they separate words
+words_re = {'fr': re.compile(r"[^\W\d_]+(?:-[^\W\d_]+)*"),
+            'nl': re.compile(r"[^\W\d_]+"),
+            'de': re.compile(r"[^\W\d_]+")}
+
+
+def split_key(key):
+    """:param key: OSM key, e.g. name:nl or addr:street
+       :return: a tuple consisting of
+                 * the key without language suffix
+                 * the language of the suffix, or None when there is no suffix for a supported language"""
+    base, separator, suffix = key.rpartition(':')
+    if separator:
+        try:
+            return base, resolve_language(suffix)
+        except ValueError:
+            pass
+    return key, None
+
+
+def _open(path):
+    if path.endswith('.bz2'):
+        return bz2.open(path, 'rb')
+    if path.endswith('.gz'):
+        return gzip.open(path, 'rb')
+    return open(path, 'rb')
+
+
+def iter_xml_tags(source):
+    """Reads OSM XML incrementally, keeping only the element at hand in memory
+       :param source: file name or binary file object
+       :return: iterator over tuples consisting of the element id, e.g. node/42, and its tags as a dict"""
+    if isinstance(source, str):
+        with _open(source) as fh:
+            for element in iter_xml_tags(fh):
+                yield element
+        return
+    events = ElementTree.iterparse(source, events=('start', 'end'))
+    event, root = next(events)
+    for event, element in events:
+        if event == 'end' and element.tag in ELEMENTS:
+            tags = {tag.get('k'): tag.get('v') for tag in element.iter('tag')}
+            yield '{}/{}'.format(element.tag, element.get('id')), tags
+            root.clear()
+
+
+def iter_pbf_tags(path):
+    """Reads an .osm.pbf file incrementally, this requires pyosmium
+       :param path: file name
+       :return: iterator over tuples consisting of the element id, e.g. node/42, and its tags as a dict"""
+    try:
+        import osmium
+    except ImportError:
+        raise ImportError('Reading .osm.pbf files requires pyosmium: pip install osmium')
+    element_types = {'n': 'node', 'w': 'way', 'r': 'relation'}
+    for element in osmium.FileProcessor(path):
+        if element.tags:
+            yield ('{}/{}'.format(element_types[element.type_str()], element.id),
+                   {tag.k: tag.v for tag in element.tags})
+
+
+def iter_tags(source):
+    """:param source: file name of an OSM XML file, optionally compressed, or of an .osm.pbf file,
+                      or a binary file object holding OSM XML
+       :return: iterator over tuples consisting of the element id and its tags as a dict"""
+    if isinstance(source, str) and source.endswith('.pbf'):
+        return iter_pbf_tags(source)
+    return iter_xml_tags(source)
+
+
+def iter_changes(source):
+    """Reads an OSM change file (.osc) incrementally
+       :param source: file name, optionally compressed, or binary file object
+       :return: iterator over tuples consisting of the action: create, modify or delete,
+                the element id, e.g. node/42, and its tags as a dict, in the order of the file"""
+    if isinstance(source, str):
+        with _open(source) as fh:
+            for change in iter_changes(fh):
+                yield change
+        return
+    events = ElementTree.iterparse(source, events=('start', 'end'))
+    event, root = next(events)
+    action = None
+    for event, element in events:
+        if element.tag in ACTIONS:
+            action = element if event == 'start' else None
+        elif event == 'end' and element.tag in ELEMENTS and action is not None:
+            tags = {tag.get('k'): tag.get('v') for tag in element.iter('tag')}
+            yield action.tag, '{}/{}'.format(element.tag, element.get('id')), tags
+            # The elements are children of the action, not of the root
+            action.clear()
+            root.clear()
+
+
+def relevant_tags(tags, keys=DEFAULT_KEYS, default_lang=None):
+    """:param tags:         dict of the tags of an element
+       :param keys:         set of keys to scan, both as such and with a language suffix
+       :param default_lang: language code for keys without language suffix, None skips them
+       :return: iterator over tuples consisting of the key, the language and the value of the tags to scan"""
+    for key, text in tags.items():
+        base, lang = split_key(key)
+        if base in keys:
+            lang = lang or default_lang
+            if lang is not None:
+                yield key, lang, text
+
+
+def tag_numerals(text, lang, parse_number, errors=None):
+    """:param text:         value of a tag
+       :param lang:         language code as returned by resolve_language
+       :param parse_number: parse_number for lang
+       :param errors:       list to which tuples consisting of the token and the exception are appended
+                            for the tokens parse_number raises for, e.g. French quatre-vingt,
+                            those tokens are taken not to be numerals
+       :return: list of tuples consisting of the token holding a numeral, its value and whether it's an ordinal"""
+    numerals = []
+    for token in words_re[lang].findall(text):
+        try:
+            value, ordinal = parse_number(token.lower(), determine_value=True)
+        except Exception as e:
+            if errors is not None:
+                errors.append((token, e))
+            continue
+        if value is not None:
+            numerals.append((token, value, ordinal))
+    return numerals
+
+
+def scan_tags(source, keys=DEFAULT_KEYS, default_lang=None, engine='regex', errors=None):
+    """Yields the numerals in the values of the tags of an OSM file
+       :param source:       see iter_tags
+       :param keys:         keys to scan, both as such and with a language suffix, e.g. name and name:nl
+       :param default_lang: language for keys without language suffix, None skips them
+       :param engine:       see parse_numeric_value.engines
+       :param errors:       list to which tuples consisting of the element id, the key, the token
+                            and the exception are appended for the tokens parse_number raises for,
+                            those are skipped
+       :return: iterator over tuples consisting of
+                 * the element id, e.g. node/42
+                 * the key of the tag
+                 * the token holding the numeral
+                 * the value the token represents
+                 * whether the token is an ordinal"""
+    keys = set(keys)
+    if default_lang is not None:
+        default_lang = resolve_language(default_lang)
+    parsers = {}
+    failed = []
+    for element_id, tags in iter_tags(source):
+        for key, lang, text in relevant_tags(tags, keys, default_lang):
+            try:
+                parse_number = parsers[lang]
+            except KeyError:
+                parse_number = parsers[lang] = prefiltered_parser(lang, engine)
+            for token, value, ordinal in tag_numerals(text, lang, parse_number, failed):
+                yield element_id, key, token, value, ordinal
+            if failed:
+                if errors is not None:
+                    errors += [(element_id, key, token, e) for token, e in failed]
+                del failed[:]
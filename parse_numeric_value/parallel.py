@@ -0,0 +1,64 @@
+# coding: utf8
+"""Parse large collections of text strings on all cores with a process pool."""
+from __future__ import unicode_literals
+
+import itertools
+import multiprocessing
+
+from parse_numeric_value.cache import DEFAULT_MAXSIZE, cached_parser
+
+DEFAULT_CHUNK_SIZE = 20000
+
+# Set in each worker process by _init_worker
+_parse_number = None
+
+
+def _init_worker(lang, engine, cache_size):
+    """Loads the language module and warms its tables once per worker"""
+    global _parse_number
+    _parse_number = cached_parser(lang, maxsize=cache_size, engine=engine)
+    _parse_number('')
+
+
+def _parse_chunk(job):
+    texts, determine_value, options = job
+    parse_number = _parse_number
+    return [parse_number(text, determine_value, **options) for text in texts]
+
+
+def chunked(texts, chunk_size):
+    """:return: iterator over lists of at most chunk_size consecutive texts"""
+    texts = iter(texts)
+    while True:
+        chunk = list(itertools.islice(texts, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def imap_parse_numbers(texts, lang='nl', determine_value=False, workers=None, chunk_size=DEFAULT_CHUNK_SIZE,
+                       engine='regex', cache_size=DEFAULT_MAXSIZE, **options):
+    """Like parse_numeric_value.batch.parse_numbers, but spread over a pool of worker processes
+       and yielding the results as the chunks come back, in input order
+       :param texts:           iterable of text strings that may be numbers
+       :param lang:            language code: nl, de or fr
+       :param determine_value: calculate the values they represent as well
+       :param workers:         number of worker processes, None for one per core
+       :param chunk_size:      number of texts sent to a worker at once
+       :param engine:          see parse_numeric_value.engines
+       :param cache_size:      size of the LRU cache of each worker, see parse_numeric_value.cache
+       :param options:         extra keyword arguments for parse_number, e.g. strict_AN_spelling
+       :return: iterator over the results parse_number gives for each of the texts"""
+    jobs = ((chunk, determine_value, options) for chunk in chunked(texts, chunk_size))
+    with multiprocessing.Pool(workers, initializer=_init_worker, initargs=(lang, engine, cache_size)) as pool:
+        for results in pool.imap(_parse_chunk, jobs):
+            for result in results:
+                yield result
+
+
+def parse_numbers_parallel(texts, lang='nl', determine_value=False, workers=None, chunk_size=DEFAULT_CHUNK_SIZE,
+                           engine='regex', cache_size=DEFAULT_MAXSIZE, **options):
+    """See imap_parse_numbers
+       :return: list of the results parse_number gives for each of the texts, in input order"""
+    return list(imap_parse_numbers(texts, lang=lang, determine_value=determine_value, workers=workers,
+                                   chunk_size=chunk_size, engine=engine, cache_size=cache_size, **options))
@@ -0,0 +1,197 @@
+# coding: utf8
+"""Parse results kept on disk across runs, in SQLite, for jobs parsing mostly the same strings every time.
+
+   The key of a result is the language, the (normalized) text, determine_value, the options,
+   whether the engine answers from the lookup table only, and the version of the library
+   and of the lookup table of the language, see artifacts.result_version,
+   so an upgrade never serves an outdated result.
+   parse_numbers looks up all distinct texts of a batch in a few queries before parsing the rest,
+   new results are written in batches of write_batch, and when the database holds more than
+   max_entries results the least recently used ones are evicted.
+   A lookup costs a few microseconds, less than the regex and multi-word paths, but more than
+   the dictionary path, which the in-process caches of parse_numeric_value.cache serve best."""
+from __future__ import unicode_literals
+
+import json
+import os
+import sqlite3
+import time
+
+from parse_numeric_value.artifacts import cache_directory, result_version
+from parse_numeric_value.engines import TABLE_ONLY_ENGINES, get_parser
+from parse_numeric_value.normalize import normalize as normalize_text
+from parse_numeric_value.registry import resolve_language
+
+DEFAULT_MAX_ENTRIES = 2 ** 22
+DEFAULT_WRITE_BATCH = 10000
+
+# Hits are marked as used again only when they were last used longer ago than this, in seconds,
+# so warm runs read without writing
+USED_RESOLUTION = 3600
+
+SCHEMA = '''
+PRAGMA journal_mode = WAL;
+CREATE TABLE IF NOT EXISTS results (
+    lang TEXT NOT NULL,
+    version TEXT NOT NULL,
+    options TEXT NOT NULL,
+    text TEXT NOT NULL,
+    value,
+    ordinal INTEGER,
+    used REAL NOT NULL,
+    PRIMARY KEY (lang, version, options, text)
+);
+CREATE INDEX IF NOT EXISTS results_used ON results (used);
+CREATE TEMPORARY TABLE wanted (text TEXT PRIMARY KEY);
+'''
+
+
+def _encode(result, determine_value):
+    """:return: the value and ordinal columns of result, values beyond 64 bits as decimal digits"""
+    if not determine_value:
+        return None, int(result)
+    value, ordinal = result
+    if type(value) is int and not -2 ** 63 <= value < 2 ** 63:
+        value = str(value)
+    return value, None if ordinal is None else int(ordinal)
+
+
+def _decode(value, ordinal, determine_value):
+    if not determine_value:
+        return bool(ordinal)
+    if type(value) is str:
+        value = int(value)
+    return value, None if ordinal is None else bool(ordinal)
+
+
+def default_path():
+    """:return: the file name of the cache shared by all runs of the user, in the cache directory"""
+    return os.path.join(cache_directory(), 'results.sqlite')
+
+
+class PersistentCache(object):
+    """Parse results in a SQLite database, see the module docstring.
+       Call flush() or close() to write the results still held back, or use it as a context manager."""
+
+    def __init__(self, path=None, max_entries=DEFAULT_MAX_ENTRIES, write_batch=DEFAULT_WRITE_BATCH, engine='regex'):
+        """:param path:        file name of the database, by default see default_path
+           :param max_entries: number of results kept, the least recently used are evicted first
+           :param write_batch: number of new results held back before they're written
+           :param engine:      see parse_numeric_value.engines, for parsing what the cache doesn't hold"""
+        self.path = path or default_path()
+        directory = os.path.dirname(os.path.abspath(self.path))
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        self.max_entries = max_entries
+        self.write_batch = write_batch
+        self.engine = engine
+        self.connection = sqlite3.connect(self.path)
+        self.connection.executescript(SCHEMA)
+        self.hits = 0
+        self.misses = 0
+        # (lang, version, options, text) -> value and ordinal columns, not written yet
+        self._pending = {}
+        self._versions = {}
+
+    def _key(self, lang, determine_value, normalize, fold_diacritics, options):
+        """:return: a tuple consisting of the version and the options part of the key"""
+        options_key = (lang, tuple(sorted(options.items())))
+        try:
+            version = self._versions[options_key]
+        except KeyError:
+            version = self._versions[options_key] = result_version(lang, **options)
+        return version, json.dumps([bool(determine_value), bool(normalize), bool(normalize and fold_diacritics),
+                                    sorted(options.items()), self.engine in TABLE_ONLY_ENGINES])
+
+    def prefetch(self, texts, lang, version, options_key, determine_value):
+        """:param texts: distinct texts, already normalized
+           :return: dict mapping the texts the cache holds to their results"""
+        found = {}
+        for text in texts:
+            columns = self._pending.get((lang, version, options_key, text))
+            if columns is not None:
+                found[text] = _decode(columns[0], columns[1], determine_value)
+        missing = [(text,) for text in texts if text not in found]
+        if not missing:
+            return found
+        now = time.time()
+        stale = []
+        with self.connection:
+            self.connection.execute('DELETE FROM wanted')
+            self.connection.executemany('INSERT OR IGNORE INTO wanted VALUES (?)', missing)
+            rows = self.connection.execute(
+                'SELECT results.text, value, ordinal, used FROM wanted JOIN results ON lang = ? AND version = ? '
+                'AND options = ? AND results.text = wanted.text', (lang, version, options_key))
+            for text, value, ordinal, used in rows:
+                found[text] = _decode(value, ordinal, determine_value)
+                if used < now - USED_RESOLUTION:
+                    stale.append((now, lang, version, options_key, text))
+            self.connection.executemany('UPDATE results SET used = ? WHERE lang = ? AND version = ? AND options = ? '
+                                        'AND text = ?', stale)
+            self.connection.execute('DELETE FROM wanted')
+        return found
+
+    def parse_numbers(self, texts, lang='nl', determine_value=False, normalize=False, fold_diacritics=False,
+                      **options):
+        """Like parse_numeric_value.batch.parse_numbers, parsing only the texts the cache doesn't hold
+           :return: list of the results parse_number gives for each of the texts, in input order"""
+        lang = resolve_language(lang)
+        version, options_key = self._key(lang, determine_value, normalize, fold_diacritics, options)
+        keys = [normalize_text(text, lang, fold_diacritics) for text in texts] if normalize else list(texts)
+        distinct = list(dict.fromkeys(keys))
+        results = self.prefetch(distinct, lang, version, options_key, determine_value)
+        self.hits += len(results)
+        parse_number = None
+        for text in distinct:
+            if text not in results:
+                parse_number = parse_number or get_parser(lang, self.engine)
+                result = results[text] = parse_number(text, determine_value=determine_value, **options)
+                self._pending[(lang, version, options_key, text)] = _encode(result, determine_value)
+                self.misses += 1
+        if len(self._pending) >= self.write_batch:
+            self.flush()
+        return [results[key] for key in keys]
+
+    def parse_number(self, text, lang='nl', determine_value=False, normalize=False, fold_diacritics=False,
+                     **options):
+        """Like parse_numeric_value.parse_number, parsing text only when the cache doesn't hold it"""
+        return self.parse_numbers([text], lang, determine_value, normalize, fold_diacritics, **options)[0]
+
+    def flush(self):
+        """Writes the results held back and evicts the least recently used ones beyond max_entries"""
+        if self._pending:
+            used = time.time()
+            with self.connection:
+                self.connection.executemany('INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?)',
+                                            [key + columns + (used,) for key, columns in self._pending.items()])
+            self._pending = {}
+        self.evict()
+
+    def evict(self):
+        """Deletes the least recently used results beyond max_entries
+           :return: the number of results deleted"""
+        excess = len(self) - self.max_entries
+        if excess <= 0:
+            return 0
+        with self.connection:
+            self.connection.execute('DELETE FROM results WHERE rowid IN '
+                                    '(SELECT rowid FROM results ORDER BY used LIMIT ?)', (excess,))
+        return excess
+
+    def __len__(self):
+        return self.connection.execute('SELECT COUNT(*) FROM results').fetchone()[0]
+
+    def clear(self):
+        self._pending = {}
+        with self.connection:
+            self.connection.execute('DELETE FROM results')
+
+    def close(self):
+        self.flush()
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,265 @@
+# coding: utf8
+"""Cheap first stage rejecting most strings that can't be numerals before parse_number runs.
+
+   The filter is derived from the regexes and lookup tables of the language modules, so it only
+   rejects strings parse_number rejects as well: strings with characters no numeral contains,
+   longer than any numeral, or starting or ending in a way no numeral does."""
+from __future__ import unicode_literals
+
+import functools
+import sys
+
+try:
+    from re import _parser as sre_parse
+except ImportError:  # Python < 3.11
+    try:
+        import sre_parse
+    except ImportError:
+        # Neither is public, get_prefilter passes every text then
+        sre_parse = None
+
+from parse_numeric_value.engines import get_parser
+from parse_numeric_value.registry import load_language, resolve_language
+
+AFFIX_LENGTH = 3
+
+# Name of the regex in each language module
+patterns = {'nl': 'hundreds_units_and_tens_thousand_re',
+            'de': 'hundreds_units_and_tens_thousand_re',
+            'fr': 'hundreds_tens_units_re'}
+
+# Suffixes parse_number strips before looking up the rest in text_lookup
+dictionary_suffixes = {'nl': ('', 'ste', 'de'),
+                       'de': ('', 'ste', 'te'),
+                       'fr': ()}
+
+# Strings parse_number handles before anything else
+special_cases = {'nl': ('driekwart', 'driekwartste'),
+                 'de': ('eins',),
+                 'fr': ('un', 'une')}
+
+# Languages of which parse_number looks up a non-empty rest group in text_lookup,
+# with the ordinal suffix removed from it
+rest_lookups = {'fr': 'ième'}
+
+# Languages of which parse_number composes text with spaces from its words, see parse_numeric_value.compose
+multi_word = {'nl', 'de', 'fr'}
+
+
+@functools.lru_cache(maxsize=None)
+def _whitespace():
+    """:return: the characters \\s matches, built at first use as that scans all of Unicode"""
+    return frozenset(chr(c) for c in range(sys.maxunicode + 1) if chr(c).isspace())
+
+
+_prefilters = {}
+
+
+class _Unsupported(Exception):
+    """Raised for regex constructs the filter doesn't model, which turn it off"""
+
+
+def _concat(left, right, affix_length):
+    """:return: the affixes of the concatenations of strings with the affixes left and right"""
+    result = set()
+    for a in left:
+        if len(a) >= affix_length:
+            result.add(a)
+        else:
+            for b in right:
+                result.add((a + b)[:affix_length])
+    return result
+
+
+def _charset(items):
+    chars = set()
+    for op, av in items:
+        if op is sre_parse.LITERAL:
+            chars.add(chr(av))
+        elif op is sre_parse.RANGE:
+            chars.update(chr(c) for c in range(av[0], av[1] + 1))
+        elif op is sre_parse.CATEGORY and av in (sre_parse.CATEGORY_SPACE, sre_parse.CATEGORY_UNI_SPACE):
+            chars.update(_whitespace())
+        else:
+            raise _Unsupported(op)
+    return chars
+
+
+def _affixes(items, affix_length, skip_group, reverse=False):
+    """:param items:        parsed regex, see sre_parse
+       :param affix_length: length of the affixes
+       :param skip_group:   number of the group assumed to match the empty string
+       :param reverse:      compute reversed suffixes instead of prefixes
+       :return: set holding the prefixes of length affix_length of the strings the regex matches entirely
+                and those strings themselves when they are shorter"""
+    result = {''}
+    for op, av in (reversed(list(items)) if reverse else items):
+        if op is sre_parse.LITERAL:
+            part = {chr(av)}
+        elif op is sre_parse.IN:
+            part = _charset(av)
+        elif op is sre_parse.AT:
+            part = {''}
+        elif op is sre_parse.SUBPATTERN:
+            part = {''} if av[0] == skip_group else _affixes(av[-1], affix_length, skip_group, reverse)
+        elif op is sre_parse.BRANCH:
+            part = set()
+            for alternative in av[1]:
+                part |= _affixes(alternative, affix_length, skip_group, reverse)
+        elif op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT):
+            minimum, maximum, body = av
+            body = _affixes(body, affix_length, skip_group, reverse)
+            part = {''}
+            for _ in range(minimum):
+                part = _concat(part, body, affix_length)
+            repeated = part
+            count = minimum
+            while count < maximum:
+                repeated = _concat(repeated, body, affix_length)
+                if repeated <= part:
+                    break
+                part |= repeated
+                count += 1
+        else:
+            raise _Unsupported(op)
+        result = _concat(result, part, affix_length)
+    return result
+
+
+def _alphabet(items, skip_group):
+    chars = set()
+    for op, av in items:
+        if op is sre_parse.LITERAL:
+            chars.add(chr(av))
+        elif op is sre_parse.IN:
+            chars |= _charset(av)
+        elif op is sre_parse.SUBPATTERN and av[0] != skip_group:
+            chars |= _alphabet(av[-1], skip_group)
+        elif op is sre_parse.BRANCH:
+            for alternative in av[1]:
+                chars |= _alphabet(alternative, skip_group)
+        elif op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT):
+            chars |= _alphabet(av[2], skip_group)
+    return chars
+
+
+def _max_length(items, skip_group):
+    length = 0
+    for op, av in items:
+        if op in (sre_parse.LITERAL, sre_parse.IN):
+            length += 1
+        elif op is sre_parse.SUBPATTERN and av[0] != skip_group:
+            length += _max_length(av[-1], skip_group)
+        elif op is sre_parse.BRANCH:
+            length += max(_max_length(alternative, skip_group) for alternative in av[1])
+        elif op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT):
+            if av[1] == sre_parse.MAXREPEAT:
+                return float('inf')
+            length += av[1] * _max_length(av[2], skip_group)
+    return length
+
+
+def _rest_affixes(word, inserted, affix_length, reverse=False):
+    """Affixes of the strings which equal word once every occurrence of inserted is removed"""
+    if reverse:
+        word, inserted = word[::-1], inserted[::-1]
+    result = set()
+    stack = [('', 0)]
+    while stack:
+        prefix, position = stack.pop()
+        if len(prefix) >= affix_length or position == len(word):
+            result.add(prefix[:affix_length])
+        if len(prefix) < affix_length:
+            stack.append((prefix + inserted, position))
+            if position < len(word):
+                stack.append((prefix + word[position], position + 1))
+    return result
+
+
+def build_prefilter(lang, affix_length=AFFIX_LENGTH):
+    """:param lang:         language code
+       :param affix_length: number of characters at the start and the end of the text that are checked
+       :return: a function accepting a text string, which returns False when parse_number
+                is sure to reject it and True otherwise"""
+    lang = resolve_language(lang)
+    module = load_language(lang)
+    regex = getattr(module, patterns[lang])
+    parsed = sre_parse.parse(regex.pattern, regex.flags)
+    rest = regex.groupindex['rest']
+    try:
+        prefixes = _affixes(parsed, affix_length, rest)
+        suffixes = {s[::-1] for s in _affixes(parsed, affix_length, rest, reverse=True)}
+        alphabet = _alphabet(parsed, rest)
+    except _Unsupported:
+        return lambda text: True
+    max_length = _max_length(parsed, rest)
+
+    words = set(special_cases[lang])
+    words.update(key + suffix for key in module.text_lookup for suffix in dictionary_suffixes[lang])
+    if lang in rest_lookups:
+        inserted = rest_lookups[lang]
+        rest_prefixes, rest_suffixes = {''}, {''}
+        for key in module.text_lookup:
+            rest_prefixes |= _rest_affixes(key, inserted, affix_length)
+            rest_suffixes |= {s[::-1] for s in _rest_affixes(key, inserted, affix_length, reverse=True)}
+            alphabet.update(key + inserted)
+        prefixes = _concat(prefixes, rest_prefixes, affix_length)
+        suffixes = {s[::-1] for s in _concat({s[::-1] for s in rest_suffixes},
+                                             {s[::-1] for s in suffixes}, affix_length)}
+        max_length = float('inf')
+    for word in words:
+        prefixes.add(word[:affix_length])
+        suffixes.add(word[-affix_length:])
+        alphabet.update(word)
+        max_length = max(max_length, len(word))
+    prefixes.discard('')
+    suffixes.discard('')
+    alphabet = frozenset(alphabet)
+    splits_words = lang in multi_word
+
+    def may_be_numeral(text):
+        if splits_words and ' ' in text:
+            return True
+        return (0 < len(text) <= max_length and
+                text[:affix_length] in prefixes and
+                text[-affix_length:] in suffixes and
+                alphabet.issuperset(text))
+
+    return may_be_numeral
+
+
+def _pass_through(text):
+    return True
+
+
+def get_prefilter(lang):
+    """:return: the prefilter for lang, built at first use,
+                or a function passing every text when the internals of re it's built with have changed"""
+    lang = resolve_language(lang)
+    try:
+        return _prefilters[lang]
+    except KeyError:
+        pass
+    try:
+        prefilter = build_prefilter(lang)
+    except (ImportError, AttributeError, TypeError):
+        prefilter = _pass_through
+    _prefilters[lang] = prefilter
+    return prefilter
+
+
+def prefiltered_parser(lang, engine='regex'):
+    """:param lang:   language code
+       :param engine: see parse_numeric_value.engines
+       :return: a function with the same signature and results as parse_number of the language module,
+                which only calls it for strings passing the prefilter"""
+    may_be_numeral = get_prefilter(lang)
+    parse = get_parser(lang, engine)
+
+    def parse_number(number, determine_value=False, **options):
+        if may_be_numeral(number):
+            return parse(number, determine_value=determine_value, **options)
+        return (None, None) if determine_value else False
+
+    parse_number.__doc__ = parse.__doc__
+    return parse_number
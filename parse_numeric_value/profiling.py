@@ -0,0 +1,345 @@
+# coding: utf8
+"""Profile parse_number over a corpus: where the time and memory go, per language and code path.
+
+   The corpus is run through the parsers in separate passes, so the instruments don't distort each other:
+     * CPU and wall time of each call, attributed to the path the trace hook of the language module reports,
+       which also gives the slowest inputs
+     * the memory allocated during each call, with tracemalloc
+     * cProfile, written as a pstats file for snakeviz, gprof2dot and the like
+     * the call stacks of each call, written as folded stacks for flamegraph.pl, inferno or speedscope,
+       with the language and path as the outermost frames and regex calls named after their module variable,
+       e.g. nl;regex;parse_to_numeric_value.py:parse_number;re:wrong_ordinals_re.match
+
+   Run it with: python -m parse_numeric_value.profiling corpus.txt --pstats nl.prof --folded nl.folded
+   Each line of the corpus is a text, parsed in every language given with --lang,
+   or a language code and a text separated by a tab."""
+from __future__ import unicode_literals
+
+import argparse
+import cProfile
+import collections
+import functools
+import heapq
+import io
+import json
+import os
+import pstats
+import re
+import sys
+import time
+import tracemalloc
+
+from parse_numeric_value.engines import get_parser
+from parse_numeric_value.registry import languages, load_language, resolve_language
+
+DEFAULT_SLOWEST = 20
+
+_pattern_type = type(re.compile(''))
+
+# Path of the calls that raised before the language module reported one
+ERROR_PATH = 'error'
+
+PathStatistics = collections.namedtuple('PathStatistics', 'calls errors cpu_seconds wall_seconds allocated_bytes')
+
+
+def read_corpus(path, languages=('nl',)):
+    """:param path:      file name of the corpus, see the module docstring
+       :param languages: language codes for the lines without one
+       :return: list of tuples consisting of a language code and a text"""
+    languages = [resolve_language(lang) for lang in languages]
+    corpus = []
+    with io.open(path, encoding='utf8') as fh:
+        for line in fh:
+            line = line.rstrip('\r\n')
+            lang, separator, text = line.partition('\t')
+            if separator:
+                try:
+                    corpus.append((resolve_language(lang), text))
+                    continue
+                except ValueError:
+                    pass
+            corpus += [(lang, line) for lang in languages]
+    return corpus
+
+
+def _trace_paths(modules):
+    """Installs a trace hook in each of modules recording the first path parse_number reports
+       :return: a tuple consisting of a list holding that path, reset to None before each call by the caller,
+                and a function restoring the previous hooks"""
+    last_path = [None]
+    previous = {}
+    for module in modules:
+        def trace(text, path, groups, previous_trace=module.trace):
+            if last_path[0] is None:
+                last_path[0] = path
+            if previous_trace is not None:
+                previous_trace(text, path, groups)
+
+        previous[module] = module.set_trace(trace)
+
+    def restore():
+        for module, trace in previous.items():
+            module.set_trace(trace)
+
+    return last_path, restore
+
+
+class ProfileReport(object):
+    """Result of profile_corpus"""
+
+    def __init__(self, engine):
+        self.engine = engine
+        # (lang, path) -> PathStatistics, errors counts the calls that raised, on ERROR_PATH when they raised
+        # before the language module reported a path,
+        # allocated_bytes is None when tracemalloc wasn't run
+        self.paths = {}
+        # List of tuples consisting of the wall seconds, language, path and text of the slowest calls
+        self.slowest = []
+        # pstats.Stats of the cProfile pass, or None
+        self.stats = None
+        # Folded stack -> seconds
+        self.stacks = collections.Counter()
+
+    def as_dict(self):
+        """:return: the breakdown and the slowest inputs as a plain dict, suitable for JSON"""
+        return {'engine': self.engine,
+                'paths': [dict(lang=lang, path=path, **statistics._asdict())
+                          for (lang, path), statistics in sorted(self.paths.items())],
+                'slowest': [{'seconds': seconds, 'lang': lang, 'path': path, 'text': text}
+                            for seconds, lang, path, text in self.slowest]}
+
+    def to_text(self, top=0):
+        """:param top: number of functions of the cProfile pass to list as well
+           :return: the report as a table for the console"""
+        total = sum(statistics.cpu_seconds for statistics in self.paths.values()) or 1.0
+        lines = ['{:<5} {:<16} {:>9} {:>7} {:>10} {:>6} {:>10} {:>12}'.format(
+            'lang', 'path', 'calls', 'errors', 'cpu ms', 'cpu %', 'us/call', 'bytes/call')]
+        for (lang, path), statistics in sorted(self.paths.items(), key=lambda item: -item[1].cpu_seconds):
+            lines.append('{:<5} {:<16} {:>9} {:>7} {:>10.1f} {:>6.1f} {:>10.2f} {:>12}'.format(
+                lang, path, statistics.calls, statistics.errors, statistics.cpu_seconds * 1e3,
+                statistics.cpu_seconds / total * 100, statistics.wall_seconds / statistics.calls * 1e6,
+                '-' if statistics.allocated_bytes is None else statistics.allocated_bytes // statistics.calls))
+        if self.slowest:
+            lines += ['', 'Slowest inputs:']
+            for seconds, lang, path, text in self.slowest:
+                lines.append('{:>10.2f} us  {:<5} {:<16} {!r}'.format(seconds * 1e6, lang, path, text))
+        if top and self.stats is not None:
+            output = io.StringIO()
+            self.stats.stream = output
+            self.stats.sort_stats('tottime').print_stats(top)
+            lines += ['', output.getvalue().strip('\n')]
+        return '\n'.join(lines) + '\n'
+
+    def write_pstats(self, path):
+        """Writes the cProfile pass in the pstats format"""
+        self.stats.dump_stats(path)
+
+    def write_folded(self, path):
+        """Writes the call stacks in the folded format, one stack and its microseconds per line"""
+        with io.open(path, 'w', encoding='utf8') as fh:
+            for stack, seconds in sorted(self.stacks.items()):
+                microseconds = int(round(seconds * 1e6))
+                if microseconds:
+                    fh.write('{} {}\n'.format(stack, microseconds))
+
+
+def _time_pass(calls, last_path, report, slowest):
+    totals = {}
+    heap = []
+    wall_clock, cpu_clock = time.perf_counter, time.process_time
+    for lang, text, parse_number in calls:
+        last_path[0] = None
+        failed = False
+        cpu_start = cpu_clock()
+        start = wall_clock()
+        try:
+            parse_number(text, True)
+        except Exception:
+            failed = True
+        wall = wall_clock() - start
+        cpu = cpu_clock() - cpu_start
+        path = last_path[0] or (ERROR_PATH if failed else report.engine)
+        total = totals.setdefault((lang, path), [0, 0, 0.0, 0.0])
+        total[0] += 1
+        total[1] += failed
+        total[2] += cpu
+        total[3] += wall
+        if slowest:
+            item = (wall, lang, path, text)
+            if len(heap) < slowest:
+                heapq.heappush(heap, item)
+            elif item > heap[0]:
+                heapq.heapreplace(heap, item)
+    report.slowest = sorted(heap, reverse=True)
+    return totals
+
+
+def _allocation_pass(calls, last_path, engine):
+    allocated = collections.Counter()
+    tracemalloc.start()
+    try:
+        for lang, text, parse_number in calls:
+            last_path[0] = None
+            before = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            failed = False
+            try:
+                parse_number(text, True)
+            except Exception:
+                failed = True
+            allocated[(lang, last_path[0] or (ERROR_PATH if failed else engine))] += \
+                tracemalloc.get_traced_memory()[1] - before
+    finally:
+        tracemalloc.stop()
+    return allocated
+
+
+def _frame_namer(modules):
+    """:return: functions naming the frames of Python functions and of builtins for the folded stacks"""
+    pattern_names = {}
+    for module in modules:
+        for name, value in vars(module).items():
+            if isinstance(value, _pattern_type):
+                pattern_names[id(value)] = name
+
+    def python_frame(code):
+        return '{}:{}'.format(os.path.basename(code.co_filename), code.co_name)
+
+    def builtin_frame(function):
+        owner = getattr(function, '__self__', None)
+        if isinstance(owner, _pattern_type):
+            return 're:{}.{}'.format(pattern_names.get(id(owner), 'pattern'), function.__name__)
+        return getattr(function, '__qualname__', None) or function.__name__
+
+    return python_frame, builtin_frame
+
+
+def _stack_pass(calls, last_path, report, modules):
+    python_frame, builtin_frame = _frame_namer(modules)
+    clock = time.perf_counter
+    hook_file = _trace_paths.__code__.co_filename
+    stack = []
+    own = collections.Counter()
+    last = [0.0]
+    # Depth of the trace hooks on the stack, the time spent in them is left out
+    hooked = [0]
+
+    def profiler(frame, event, arg):
+        now = clock()
+        if stack and not hooked[0]:
+            own[tuple(stack)] += now - last[0]
+        if event == 'call':
+            code = frame.f_code
+            if code.co_name == 'trace' and code.co_filename == hook_file:
+                hooked[0] += 1
+                stack.append(None)
+            else:
+                stack.append(python_frame(code))
+        elif event == 'c_call':
+            stack.append(builtin_frame(arg))
+        elif stack and stack.pop() is None:
+            hooked[0] -= 1
+        last[0] = clock()
+
+    for lang, text, parse_number in calls:
+        last_path[0] = None
+        del stack[:]
+        own.clear()
+        hooked[0] = 0
+        last[0] = clock()
+        failed = False
+        sys.setprofile(profiler)
+        try:
+            parse_number(text, True)
+        except Exception:
+            failed = True
+        finally:
+            sys.setprofile(None)
+        prefix = '{};{}'.format(lang, last_path[0] or (ERROR_PATH if failed else report.engine))
+        for frames, seconds in own.items():
+            report.stacks[';'.join((prefix,) + frames)] += seconds
+
+
+def profile_corpus(corpus, engine='regex', slowest=DEFAULT_SLOWEST, allocations=True, cprofile=True, stacks=True,
+                   **options):
+    """:param corpus:      list of tuples consisting of a language code and a text, see read_corpus
+       :param engine:      see parse_numeric_value.engines
+       :param slowest:     number of slowest inputs to keep
+       :param allocations: run the tracemalloc pass
+       :param cprofile:    run the cProfile pass
+       :param stacks:      run the pass collecting folded stacks
+       :param options:     extra keyword arguments for parse_number, e.g. strict_AN_spelling
+       :return: a ProfileReport"""
+    parsers = {}
+    calls = []
+    for lang, text in corpus:
+        lang = resolve_language(lang)
+        if lang not in parsers:
+            parse = get_parser(lang, engine)
+            # Builds the tables of the engine before anything is measured
+            parse('')
+            parsers[lang] = functools.partial(parse, **options)
+        calls.append((lang, text, parsers[lang]))
+    modules = [load_language(lang) for lang in parsers]
+    report = ProfileReport(engine)
+    last_path, restore = _trace_paths(modules)
+    try:
+        totals = _time_pass(calls, last_path, report, slowest)
+        allocated = _allocation_pass(calls, last_path, engine) if allocations else {}
+        if cprofile:
+            profiler = cProfile.Profile()
+            profiler.enable()
+            for lang, text, parse_number in calls:
+                try:
+                    parse_number(text, True)
+                except Exception:
+                    pass
+            profiler.disable()
+            report.stats = pstats.Stats(profiler)
+        if stacks:
+            _stack_pass(calls, last_path, report, modules)
+    finally:
+        restore()
+    for key, (count, errors, cpu, wall) in totals.items():
+        report.paths[key] = PathStatistics(count, errors, cpu, wall, allocated.get(key, 0) if allocations else None)
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('corpus', help='file with a text per line, optionally preceded by a language code and a tab')
+    parser.add_argument('--lang', action='append', help='language of the lines without one, may be repeated, '
+                                                        'by default all of {}'.format(', '.join(languages())))
+    parser.add_argument('--engine', default='regex')
+    parser.add_argument('--strict', action='store_true', help='strict_AN_spelling, only for nl')
+    parser.add_argument('--slowest', type=int, default=DEFAULT_SLOWEST, help='number of slowest inputs to list')
+    parser.add_argument('--top', type=int, default=0, help='number of functions of the cProfile pass to list')
+    parser.add_argument('--pstats', metavar='PATH', help='write the cProfile pass in the pstats format')
+    parser.add_argument('--folded', metavar='PATH', help='write the call stacks in the folded format')
+    parser.add_argument('--json', metavar='PATH', help='write the breakdown and the slowest inputs as JSON')
+    parser.add_argument('--no-allocations', action='store_false', dest='allocations',
+                        help='skip the tracemalloc pass')
+    args = parser.parse_args(argv)
+    try:
+        corpus = read_corpus(args.corpus, args.lang or languages())
+    except ValueError as e:
+        parser.error(str(e))
+    options = {}
+    if args.strict:
+        if {lang for lang, text in corpus} - {'nl'}:
+            parser.error('--strict only applies to nl, profile it with --lang nl and no other languages in the corpus')
+        options['strict_AN_spelling'] = True
+    report = profile_corpus(corpus, args.engine, args.slowest, args.allocations, bool(args.pstats or args.top),
+                            bool(args.folded), **options)
+    sys.stdout.write(report.to_text(args.top))
+    if args.pstats:
+        report.write_pstats(args.pstats)
+    if args.folded:
+        report.write_folded(args.folded)
+    if args.json:
+        with io.open(args.json, 'w', encoding='utf8') as fh:
+            fh.write(json.dumps(report.as_dict(), ensure_ascii=False, indent=1))
+
+
+if __name__ == '__main__':
+    main()
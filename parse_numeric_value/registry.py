@@ -0,0 +1,73 @@
+# coding: utf8
+"""Registry of the supported languages, importing each language module the first time it's needed."""
+from __future__ import unicode_literals
+
+import importlib
+
+# Language code -> module with the parse_number of that language
+modules = {'nl': 'parse_numeric_value.lang.nl.parse_to_numeric_value',
+           'de': 'parse_numeric_value.lang.de.parse_to_numeric_value',
+           'fr': 'parse_numeric_value.lang.fr.parse_to_numeric_value'}
+
+_parsers = {}
+
+# parse_numeric_value.normalize.normalize, imported at first use
+_normalize = None
+
+
+def register_language(lang, module_name):
+    """Makes another language available
+       :param lang:        language code
+       :param module_name: module defining parse_number, numeric_lookup, text_lookup and candidate_spellings"""
+    modules[lang] = module_name
+
+
+def languages():
+    """:return: tuple of the codes of the supported languages, including those added with register_language"""
+    return tuple(modules)
+
+
+def resolve_language(lang):
+    """:param lang: language code, optionally with a region like fr-BE, fr_CH or de-AT
+       :return: the code of the language module handling it"""
+    code = lang.replace('_', '-').split('-')[0].lower()
+    if code not in modules:
+        raise ValueError('Unsupported language {!r}, expected one of {}'.format(lang, ', '.join(modules)))
+    return code
+
+
+def load_language(lang):
+    """:param lang: language code, see resolve_language
+       :return: the module of that language, imported at first use"""
+    return importlib.import_module(modules[resolve_language(lang)])
+
+
+def _import_normalize():
+    global _normalize
+    from parse_numeric_value.normalize import normalize
+    _normalize = normalize
+
+
+def parse_number(number, lang='nl', determine_value=False, engine='regex', normalize=False, fold_diacritics=False,
+                 **options):
+    """Accepts text representing a number in any of the supported languages
+       :param number:          text string that may be a number
+       :param lang:            language code, see resolve_language
+       :param determine_value: calculate the value it represents as well
+       :param engine:          see parse_numeric_value.engines
+       :param normalize:       accept any case, Unicode normal form, dash and spacing,
+                               see parse_numeric_value.normalize
+       :param fold_diacritics: with normalize, accept number words without their diacritics as well
+       :param options:         extra keyword arguments for parse_number of the language module,
+                               e.g. strict_AN_spelling for nl
+       :return: what parse_number of the language module returns"""
+    try:
+        parse = _parsers[(lang, engine)]
+    except KeyError:
+        from parse_numeric_value.engines import get_parser
+        parse = _parsers[(lang, engine)] = get_parser(lang, engine)
+    if normalize:
+        if _normalize is None:
+            _import_normalize()
+        number = _normalize(number, lang, fold_diacritics)
+    return parse(number, determine_value=determine_value, **options)
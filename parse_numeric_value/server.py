@@ -0,0 +1,363 @@
+# coding: utf8
+"""Parse service for other processes, over HTTP on a Unix socket or on localhost.
+
+   POST /parse with a JSON object holding texts, and optionally lang, determine_value and options,
+   answers with a JSON object holding results, one per text.
+   GET /metrics answers with the queue depth and batch sizes in the Prometheus text format.
+   Requests arriving within max_delay of each other are parsed as one batch,
+   each distinct text once, see parse_numeric_value.batch.
+   Texts parse_number raises for are rejected, like by the command line tool, see BatchMetrics.errors.
+
+   Run it with: python -m parse_numeric_value.server --unix /run/parse_numeric_value.sock"""
+from __future__ import unicode_literals
+
+import argparse
+import asyncio
+import bisect
+import http.client
+import json
+import queue
+import socket
+
+from parse_numeric_value.batch import parse_numbers
+from parse_numeric_value.engines import get_parser
+from parse_numeric_value.metrics import PREFIX
+from parse_numeric_value.registry import load_language, resolve_language
+
+DEFAULT_MAX_DELAY = 0.002
+DEFAULT_MAX_BATCH = 4096
+DEFAULT_PORT = 8642
+
+# Upper bounds of the batch size buckets, in texts
+BATCH_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024, 4096)
+
+_reasons = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+            500: 'Internal Server Error'}
+
+
+class BatchMetrics(object):
+    """Queue depth and batch sizes of a ParseServer"""
+
+    def __init__(self, buckets=BATCH_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.batch_sizes = [0] * (len(self.buckets) + 1)
+        self.texts = 0
+        self.requests = 0
+        # Texts parse_number raised for, answered as rejected
+        self.errors = 0
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+
+    def enqueued(self, count):
+        self.requests += 1
+        self.queue_depth += count
+        self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+
+    def observe_batch(self, size):
+        self.queue_depth -= size
+        self.texts += size
+        self.batch_sizes[bisect.bisect_left(self.buckets, size)] += 1
+
+    def to_prometheus(self):
+        """:return: the metrics in the Prometheus text exposition format"""
+        lines = ['# HELP {}_queue_depth Texts waiting for the next batch'.format(PREFIX),
+                 '# TYPE {}_queue_depth gauge'.format(PREFIX),
+                 '{}_queue_depth {}'.format(PREFIX, self.queue_depth),
+                 '# HELP {}_max_queue_depth Most texts that waited for a batch at once'.format(PREFIX),
+                 '# TYPE {}_max_queue_depth gauge'.format(PREFIX),
+                 '{}_max_queue_depth {}'.format(PREFIX, self.max_queue_depth),
+                 '# HELP {}_requests_total Parse requests received'.format(PREFIX),
+                 '# TYPE {}_requests_total counter'.format(PREFIX),
+                 '{}_requests_total {}'.format(PREFIX, self.requests),
+                 '# HELP {}_parse_errors_total Texts parse_number raised for, answered as rejected'.format(PREFIX),
+                 '# TYPE {}_parse_errors_total counter'.format(PREFIX),
+                 '{}_parse_errors_total {}'.format(PREFIX, self.errors),
+                 '# HELP {}_batch_size Texts per batch'.format(PREFIX),
+                 '# TYPE {}_batch_size histogram'.format(PREFIX)]
+        cumulative = 0
+        for bound, count in zip([str(bound) for bound in self.buckets] + ['+Inf'], self.batch_sizes):
+            cumulative += count
+            lines.append('{}_batch_size_bucket{{le="{}"}} {}'.format(PREFIX, bound, cumulative))
+        lines.append('{}_batch_size_sum {}'.format(PREFIX, self.texts))
+        lines.append('{}_batch_size_count {}'.format(PREFIX, cumulative))
+        return '\n'.join(lines) + '\n'
+
+
+class MicroBatcher(object):
+    """Gathers the texts of concurrent requests for one language and set of options into batches"""
+
+    def __init__(self, lang, determine_value, options, engine, max_delay, max_batch, metrics):
+        self.lang = lang
+        self.determine_value = determine_value
+        self.options = options
+        self.engine = engine
+        self.max_delay = max_delay
+        self.max_batch = max_batch
+        self.metrics = metrics
+        self._pending = []
+        self._size = 0
+        self._timer = None
+
+    def parse(self, texts):
+        """:return: a future for the results of texts"""
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((texts, future))
+        self._size += len(texts)
+        self.metrics.enqueued(len(texts))
+        if self._size >= self.max_batch:
+            self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.max_delay, self.flush)
+        return future
+
+    def flush(self):
+        """Parses everything pending as one batch"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending, size = self._pending, self._size
+        self._pending, self._size = [], 0
+        if not pending:
+            return
+        self.metrics.observe_batch(size)
+        texts = [text for request, future in pending for text in request]
+        try:
+            try:
+                results = parse_numbers(texts, self.lang, self.determine_value, engine=self.engine, **self.options)
+            except Exception:
+                results = self.parse_each(texts)
+        except Exception as e:
+            for request, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        start = 0
+        for request, future in pending:
+            if not future.done():
+                future.set_result(results[start:start + len(request)])
+            start += len(request)
+
+    def parse_each(self, texts):
+        """Parses texts one at a time, each distinct text once, rejecting the texts parse_number raises for,
+           e.g. quatre-vingt-deux in fr with determine_value
+           :return: list of the results for the texts"""
+        parse_number = get_parser(self.lang, self.engine)
+        rejected = (None, None) if self.determine_value else False
+        seen = {}
+        results = []
+        for text in texts:
+            try:
+                result = seen[text]
+            except KeyError:
+                try:
+                    result = parse_number(text, determine_value=self.determine_value, **self.options)
+                except Exception:
+                    self.metrics.errors += 1
+                    result = rejected
+                seen[text] = result
+            results.append(result)
+        return results
+
+
+class ParseServer(object):
+    """Serves parse_numbers over HTTP, see the module docstring"""
+
+    def __init__(self, engine='hybrid', max_delay=DEFAULT_MAX_DELAY, max_batch=DEFAULT_MAX_BATCH):
+        self.engine = engine
+        self.max_delay = max_delay
+        self.max_batch = max_batch
+        self.metrics = BatchMetrics()
+        self._batchers = {}
+
+    def batcher(self, lang, determine_value, options):
+        """:return: the MicroBatcher for lang, determine_value and options"""
+        key = (lang, determine_value, tuple(sorted(options.items())))
+        try:
+            return self._batchers[key]
+        except KeyError:
+            batcher = self._batchers[key] = MicroBatcher(lang, determine_value, options, self.engine,
+                                                         self.max_delay, self.max_batch, self.metrics)
+            return batcher
+
+    async def parse(self, request):
+        """:param request: dict holding texts, and optionally lang, determine_value and options
+           :return: list of the results for the texts"""
+        texts = request['texts']
+        if not isinstance(texts, list) or not all(isinstance(text, str) for text in texts):
+            raise ValueError('texts should be a list of strings')
+        lang = resolve_language(request.get('lang', 'nl'))
+        options = request.get('options') or {}
+        if not isinstance(options, dict):
+            raise ValueError('options should be an object')
+        # Raises TypeError for options parse_number of the language doesn't take, before they reach a batch
+        load_language(lang).parse_number('', **options)
+        return await self.batcher(lang, bool(request.get('determine_value', False)), options).parse(texts)
+
+    async def respond(self, method, target, body):
+        """:return: a tuple consisting of the status, the content type and the body of the response"""
+        path = target.split('?', 1)[0]
+        if path == '/parse':
+            if method != 'POST':
+                return 405, 'text/plain', b'Use POST\n'
+            try:
+                results = await self.parse(json.loads(body.decode('utf8')))
+            except (ValueError, KeyError, TypeError, AttributeError) as e:
+                return 400, 'application/json', json.dumps({'error': str(e)}).encode('utf8')
+            except Exception as e:
+                return 500, 'application/json', json.dumps({'error': str(e)}).encode('utf8')
+            return 200, 'application/json', json.dumps({'results': results}).encode('utf8')
+        if path == '/metrics':
+            return 200, 'text/plain; version=0.0.4', self.metrics.to_prometheus().encode('utf8')
+        if path == '/health':
+            return 200, 'text/plain', b'ok\n'
+        return 404, 'text/plain', b'Not found\n'
+
+    async def handle(self, reader, writer):
+        """Answers the HTTP/1.1 requests on one connection"""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, target, version = request_line.decode('latin-1').split()
+                except ValueError:
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get('content-length', 0)))
+                status, content_type, payload = await self.respond(method, target, body)
+                keep_alive = version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+                writer.write('HTTP/1.1 {} {}\r\nContent-Type: {}\r\nContent-Length: {}\r\nConnection: {}\r\n\r\n'.format(
+                    status, _reasons[status], content_type, len(payload), 'keep-alive' if keep_alive else 'close'
+                ).encode('latin-1') + payload)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, path=None, host='127.0.0.1', port=DEFAULT_PORT):
+        """Starts listening on the Unix socket path, or on host and port when path is None
+           :return: the asyncio server"""
+        if path is not None:
+            return await asyncio.start_unix_server(self.handle, path=path)
+        return await asyncio.start_server(self.handle, host=host, port=port)
+
+
+def serve(path=None, host='127.0.0.1', port=DEFAULT_PORT, **kwargs):
+    """Runs a ParseServer until interrupted, see ParseServer.start, kwargs go to ParseServer"""
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    server = loop.run_until_complete(ParseServer(**kwargs).start(path, host, port))
+    try:
+        loop.run_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        loop.run_until_complete(server.wait_closed())
+        loop.close()
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+
+    def __init__(self, path, timeout):
+        http.client.HTTPConnection.__init__(self, 'localhost', timeout=timeout)
+        self.unix_path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.unix_path)
+
+
+class ParseClient(object):
+    """Client of a ParseServer, keeping up to pool_size connections open for reuse.
+       It can be shared by threads, each request takes a connection of its own."""
+
+    def __init__(self, path=None, host='127.0.0.1', port=DEFAULT_PORT, pool_size=8, timeout=10.0):
+        self.path = path
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self._pool = queue.LifoQueue(pool_size)
+
+    def _connect(self):
+        if self.path is not None:
+            return _UnixHTTPConnection(self.path, self.timeout)
+        return http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+
+    def _request(self, method, url, body=None):
+        for attempt in (1, 2):
+            try:
+                connection = self._pool.get_nowait()
+            except queue.Empty:
+                connection = self._connect()
+            try:
+                connection.request(method, url, body, {'Content-Type': 'application/json'} if body else {})
+                response = connection.getresponse()
+                payload = response.read()
+            except (http.client.HTTPException, ConnectionError):
+                # The server closed a pooled connection, a new one gets a second chance
+                connection.close()
+                if attempt == 2:
+                    raise
+                continue
+            try:
+                self._pool.put_nowait(connection)
+            except queue.Full:
+                connection.close()
+            return response.status, payload
+
+    def parse_numbers(self, texts, lang='nl', determine_value=False, **options):
+        """:return: the same as parse_numeric_value.batch.parse_numbers, parsed by the server"""
+        body = json.dumps({'texts': list(texts), 'lang': lang, 'determine_value': determine_value,
+                           'options': options}).encode('utf8')
+        status, payload = self._request('POST', '/parse', body)
+        if status == 400:
+            raise ValueError(json.loads(payload.decode('utf8'))['error'])
+        if status != 200:
+            raise RuntimeError('Parse server answered {}'.format(status))
+        results = json.loads(payload.decode('utf8'))['results']
+        return [tuple(result) for result in results] if determine_value else results
+
+    def parse_number(self, text, lang='nl', determine_value=False, **options):
+        """:return: the same as parse_number of the language module, parsed by the server"""
+        return self.parse_numbers([text], lang, determine_value, **options)[0]
+
+    def metrics(self):
+        """:return: the metrics of the server in the Prometheus text format"""
+        return self._request('GET', '/metrics')[1].decode('utf8')
+
+    def close(self):
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--unix', metavar='PATH', help='listen on this Unix socket instead of TCP')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--engine', default='hybrid')
+    parser.add_argument('--max-delay', type=float, default=DEFAULT_MAX_DELAY,
+                        help='seconds a request waits for others to join its batch')
+    parser.add_argument('--max-batch', type=int, default=DEFAULT_MAX_BATCH,
+                        help='texts after which a batch is parsed without waiting')
+    args = parser.parse_args(argv)
+    serve(args.unix, args.host, args.port, engine=args.engine, max_delay=args.max_delay, max_batch=args.max_batch)
+
+
+if __name__ == '__main__':
+    main()
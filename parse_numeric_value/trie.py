@@ -0,0 +1,52 @@
+# coding: utf8
+"""Character trie over the spellings of the lookup table engine, for finding spellings inside longer text
+   and near misspelled ones, see parse_numeric_value.extract and parse_numeric_value.fuzzy.
+
+   Every node is a dict mapping the next character to the next node.
+   Accepting nodes hold the lookup table entry under the key None.
+   Recognizing a string reads each character once and stops at the first
+   character no spelling continues with, without any backtracking."""
+from __future__ import unicode_literals
+
+from parse_numeric_value.engines import lookup_table
+from parse_numeric_value.registry import resolve_language
+
+_tries = {}
+
+
+def build_trie(table):
+    """:param table: dict mapping spellings to their entries, see parse_numeric_value.engines.build_table
+       :return: the root node of the trie"""
+    root = {}
+    for text, entry in table.items():
+        node = root
+        for char in text:
+            try:
+                node = node[char]
+            except KeyError:
+                node[char] = node = {}
+        node[None] = entry
+    return root
+
+
+def get_trie(lang, **options):
+    """:return: the trie for lang and options, built at first use"""
+    key = (resolve_language(lang), tuple(sorted(options.items())))
+    try:
+        return _tries[key]
+    except KeyError:
+        trie = _tries[key] = build_trie(lookup_table(lang, **options))
+        return trie
+
+
+def recognize(trie, text):
+    """:param trie: root node of a trie
+       :param text: text string that may be a number
+       :return: the entry of text or None if the trie doesn't hold it"""
+    node = trie
+    for char in text:
+        node = node.get(char)
+        if node is None:
+            return None
+    return node.get(None)
+
@@ -1,4 +1,8 @@
+import os
+import sys
+
 import setuptools
+import setuptools.command.build_py
 import setuptools.command.install
 from pathlib import Path
 
@@ -13,6 +17,15 @@ class PostInstallCommand(setuptools.command.install.install):
             pass
 
 
+class BuildPyCommand(setuptools.command.build_py.build_py):
+    """Writes the prebuilt lookup tables into the built package."""
+    def run(self):
+        setuptools.command.build_py.build_py.run(self)
+        sys.path.insert(0, str(Path(__file__).resolve().parent))
+        from parse_numeric_value.artifacts import build_artifacts
+        build_artifacts(os.path.join(self.build_lib, 'parse_numeric_value', 'data'))
+
+
 with open(Path(__file__).resolve().parent.joinpath('README.md'), 'r') as fh:
     long_description = fh.read()
 
@@ -30,13 +43,22 @@ setuptools.setup(
     long_description_content_type='text/markdown',
     url='https://github.com/PolyglotOpenstreetmap/parse_numeric_value',
     packages=setuptools.find_packages(),
+    package_data={'parse_numeric_value': ['data/*.table', 'data/*.mmap']},
     classifiers=[
         'Programming Language :: Python :: 3.6',
         'License :: OSI Approved :: GPL3 License',
         'Operating System :: OS Independent',
     ],
     install_requires=requirements,
+    extras_require={
+        'pbf': ['osmium>=3.7'],
+        'numpy': ['numpy'],
+    },
+    entry_points={
+        'console_scripts': ['parse_numeric_value=parse_numeric_value.cli:main'],
+    },
     cmdclass={
+        'build_py': BuildPyCommand,
         'install': PostInstallCommand,
     },
 )
\ No newline at end of file
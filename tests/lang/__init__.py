@@ -0,0 +1,15 @@
+# coding: utf-8
+"""The conversion tests of the languages, shared with the other tests and the benchmarks."""
+from __future__ import unicode_literals
+
+import importlib.util
+import os
+
+
+def conversion_cases(lang):
+    """:return: the (text, value, match) parametrisation of tests/lang/<lang>/test_parse_to_numeric_value.py"""
+    path = os.path.join(os.path.dirname(__file__), lang, 'test_parse_to_numeric_value.py')
+    spec = importlib.util.spec_from_file_location('test_{}_conversion'.format(lang), path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.test_conversion_to_numeric_values.pytestmark[0].args[1]
@@ -6,7 +6,7 @@ from __future__ import unicode_literals
 
 import pytest
 
-from parse_numeric_value.lang.de.parse_to_numeric_value import parse_number
+from parse_numeric_value.lang.de.parse_to_numeric_value import parse_number, set_trace
 
 @pytest.mark.parametrize('text,value,match', [
     ('dog', (None, None), False), (',', (None, None), False),
@@ -143,3 +143,18 @@ from parse_numeric_value.lang.de.parse_to_numeric_value import parse_number
 ])
 def test_conversion_to_numeric_values(text, value, match):
     assert parse_number(text, determine_value=True) == value
+
+
+@pytest.mark.parametrize('text,path,options', [
+    ('', 'empty', {}), ('eins', 'dict', {}), ('fünfte', 'dict', {}),
+    ('achtte', 'ordinal_reject', {}), ('zweihundert', 'regex', {}),
+])
+def test_trace(text, path, options):
+    calls = []
+    previous = set_trace(lambda *args: calls.append(args))
+    try:
+        parse_number(text, determine_value=True, **options)
+    finally:
+        set_trace(previous)
+    assert calls[0][:2] == (text, path)
+    assert (calls[0][2] is None) == (path != 'regex')
@@ -1,7 +1,7 @@
 # coding: utf8
 from __future__ import unicode_literals
 import pytest
-from parse_numeric_value.lang.fr.parse_to_numeric_value import parse_number
+from parse_numeric_value.lang.fr.parse_to_numeric_value import parse_number, set_trace
 
 @pytest.mark.parametrize('text,value,match', [
     ('zéro', (0, False), True), ('zéroième', (0, True), True),
@@ -204,4 +204,18 @@ from parse_numeric_value.lang.fr.parse_to_numeric_value import parse_number
     # ('neuf-cents-nonante-neuvième', (999, True), True),
 ])
 def test_conversion_to_numeric_values(text, value, match):
-    assert parse_number(text, determine_value=True) == value
\ No newline at end of file
+    assert parse_number(text, determine_value=True) == value
+
+
+@pytest.mark.parametrize('text,path,options', [
+    ('', 'empty', {}), ('une', 'special_case', {}), ('trente-deux', 'regex', {}),
+])
+def test_trace(text, path, options):
+    calls = []
+    previous = set_trace(lambda *args: calls.append(args))
+    try:
+        parse_number(text, determine_value=True, **options)
+    finally:
+        set_trace(previous)
+    assert calls[0][:2] == (text, path)
+    assert (calls[0][2] is None) == (path != 'regex')
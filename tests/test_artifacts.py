@@ -0,0 +1,51 @@
+# coding: utf-8
+"""Test reading, writing and rebuilding the prebuilt lookup tables."""
+
+
+from __future__ import unicode_literals
+
+import os
+
+import pytest
+
+from parse_numeric_value.artifacts import (artifact_path, build_artifacts, load_table, read_table, table_version,
+                                           write_table)
+from parse_numeric_value.engines import build_table
+
+
+@pytest.mark.parametrize('lang', ['nl', 'de', 'fr'])
+def test_round_trip(lang, tmp_path):
+    directory = str(tmp_path)
+    path, mapped = build_artifacts(directory, [lang])
+    assert path == artifact_path(lang, directory)
+    assert mapped == path[:-len('.table')] + '.mmap'
+    assert read_table(path, table_version(lang)) == build_table(lang)
+
+
+def test_table_version():
+    assert table_version('nl') == table_version('nl-BE')
+    assert table_version('nl') != table_version('de')
+    assert table_version('nl') != table_version('nl', strict_AN_spelling=True)
+
+
+def test_stale_and_damaged_files_are_rejected(tmp_path):
+    path = str(tmp_path / 'nl.table')
+    write_table({'drie': ((3, False), True)}, path, 'old')
+    assert read_table(path, 'old') == {'drie': ((3, False), True)}
+    assert read_table(path, table_version('nl')) is None
+    with open(path, 'wb') as fh:
+        fh.write(b'parse_numeric_value table old\n\x00\x01')
+    assert read_table(path, 'old') is None
+    assert read_table(str(tmp_path / 'missing.table'), 'old') is None
+
+
+def test_load_table_rebuilds_stale_files(tmp_path):
+    directories = [str(tmp_path / 'package'), str(tmp_path / 'cache')]
+    path = artifact_path('nl', directories[0], strict_AN_spelling=True)
+    table = load_table('nl', directories, strict_AN_spelling=True)
+    assert table == build_table('nl', strict_AN_spelling=True)
+    assert read_table(path, table_version('nl', strict_AN_spelling=True)) == table
+
+    write_table({}, path, 'old')
+    assert load_table('nl', directories, strict_AN_spelling=True) == table
+    assert os.listdir(directories[0]) == [os.path.basename(path)]
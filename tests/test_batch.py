@@ -0,0 +1,63 @@
+# coding: utf-8
+"""Test that batch parsing gives the same results as parsing one string at a time."""
+
+
+from __future__ import unicode_literals
+
+import pytest
+
+from parse_numeric_value.batch import parse_numbers
+from parse_numeric_value.engines import load_language
+
+texts = {
+    'nl': ['vijfde', 'Dorpsstraat', 'vijfde', 'tweehonderd', '', 'tweehonderd', 'duizendpoot', 'vijfde'],
+    'de': ['dritte', 'Hauptstraße', 'dritte', 'zweihundert', '', 'zweihundert', 'fünfzahl'],
+    'fr': ['trente-deux', 'Rue', 'trente-deux', 'premier', '', 'premier', 'xyz'],
+}
+
+
+@pytest.mark.parametrize('lang', ['nl', 'de', 'fr'])
+@pytest.mark.parametrize('determine_value', [True, False])
+@pytest.mark.parametrize('compact', [True, False])
+def test_batch_matches_parse_number(lang, determine_value, compact):
+    module = load_language(lang)
+    expected = [module.parse_number(text, determine_value=determine_value) for text in texts[lang]]
+    results = parse_numbers(iter(texts[lang]), lang=lang, determine_value=determine_value, compact=compact)
+    assert list(results) == expected
+    assert len(results) == len(expected)
+
+
+def test_compact_results_store_distinct_results_once():
+    results = parse_numbers(texts['nl'], lang='nl', determine_value=True, compact=True)
+    assert len(results.results) == 5
+    assert results[0] == (5, True)
+    assert results[-2:] == [(None, None), (5, True)]
+
+
+def test_batch_passes_options():
+    assert parse_numbers(['tweeste'], lang='nl', determine_value=True, strict_AN_spelling=True) == [(None, None)]
+
+
+@pytest.mark.parametrize('lang', ['nl', 'de', 'fr'])
+def test_array_matches_parse_number(lang):
+    numpy = pytest.importorskip('numpy')
+    from parse_numeric_value.batch import CARDINAL, INVALID, ORDINAL, parse_numbers_array
+    results, exact = parse_numbers_array(texts[lang], lang)
+    assert results.dtype.names == ('value', 'valid', 'kind', 'overflow')
+    assert len(results) == len(texts[lang])
+    module = load_language(lang)
+    for row, text in zip(results.tolist(), texts[lang]):
+        value, ordinal = module.parse_number(text, determine_value=True)
+        assert row == (value or 0, ordinal is not None,
+                       INVALID if ordinal is None else ORDINAL if ordinal else CARDINAL, False)
+    assert exact == {}
+    assert numpy.array_equal(results['valid'], results['kind'] != INVALID)
+
+
+def test_array_overflow_side_channel():
+    pytest.importorskip('numpy')
+    from parse_numeric_value.batch import parse_numbers_array
+    results, exact = parse_numbers_array(['driekwart', 'drie', 'quadriljard', 'driekwart'], 'nl')
+    assert results['overflow'].tolist() == [True, False, True, True]
+    assert results['value'].tolist() == [0, 3, 0, 0]
+    assert exact == {0: 0.75, 2: 10 ** 27, 3: 0.75}
@@ -0,0 +1,38 @@
+# coding: utf-8
+"""Test the memoization of parse_number."""
+
+
+from __future__ import unicode_literals
+
+import pytest
+
+from parse_numeric_value.cache import cache_clear, cache_info, cached_parser
+
+
+@pytest.mark.parametrize('lang,text,value', [
+    ('nl', 'vijfde', (5, True)), ('de', 'fünfte', (5, True)), ('fr', 'cinquième', (5, True)),
+])
+def test_cached_results_and_statistics(lang, text, value):
+    parse_number = cached_parser(lang)
+    cache_clear(lang)
+    assert parse_number(text, determine_value=True) == value
+    assert parse_number(text, True) == value
+    assert parse_number(text) is True
+    info = cache_info(lang)[(lang, 'regex')]
+    assert (info.hits, info.misses, info.currsize) == (1, 2, 2)
+
+
+def test_options_are_part_of_the_key():
+    parse_number = cached_parser('nl')
+    assert parse_number('tweeste', determine_value=True) == (2, True)
+    assert parse_number('tweeste', determine_value=True, strict_AN_spelling=True) == (None, None)
+
+
+def test_eviction():
+    parse_number = cached_parser('de', maxsize=2)
+    assert parse_number is cached_parser('de', maxsize=2)
+    for text in ('eins', 'zwei', 'drei', 'eins'):
+        parse_number(text)
+    info = parse_number.cache_info()
+    assert (info.hits, info.misses, info.maxsize, info.currsize) == (0, 4, 2, 2)
+    assert cached_parser('de') is not parse_number
@@ -0,0 +1,64 @@
+# coding: utf-8
+"""Test the command line tool."""
+
+
+from __future__ import unicode_literals
+
+import io
+import json
+
+import pytest
+
+from parse_numeric_value.cli import main
+
+tokens = 'vijfde\nDorpsstraat\r\ntweeënveertig\n\nvijfde\ntweeste\n'
+
+
+def run(argv, text=tokens):
+    stdout = io.BytesIO()
+    assert main(argv, io.BytesIO(text.encode('utf8')), stdout) == 0
+    return stdout.getvalue().decode('utf8')
+
+
+def test_tsv():
+    assert run([]) == 'vijfde\t5\t1\tnl\ntweeënveertig\t42\t0\tnl\nvijfde\t5\t1\tnl\ntweeste\t2\t1\tnl\n'
+
+
+def test_jsonl_with_rejected_tokens():
+    rows = [json.loads(line) for line in run(['--format', 'jsonl', '--all', '--dedup']).splitlines()]
+    assert rows == [{'text': 'vijfde', 'value': 5, 'ordinal': True, 'lang': 'nl'},
+                    {'text': 'Dorpsstraat', 'value': None, 'ordinal': None, 'lang': 'nl'},
+                    {'text': 'tweeënveertig', 'value': 42, 'ordinal': False, 'lang': 'nl'},
+                    {'text': 'tweeste', 'value': 2, 'ordinal': True, 'lang': 'nl'}]
+
+
+def test_strict():
+    assert 'tweeste' not in run(['--strict'])
+
+
+def test_tokens_the_parser_raises_for_are_rejected():
+    assert run(['--lang', 'fr'], 'quatre-vingt-deux\nvingt\n') == 'vingt\t20\t0\tfr\n'
+    assert run(['--lang', 'fr', '--all', '--jobs', '2'], 'quatre-vingt-deux\n') == 'quatre-vingt-deux\t\t\tfr\n'
+
+
+@pytest.mark.parametrize('engine', ['regex', 'table'])
+def test_files_and_jobs(tmp_path, engine):
+    paths = []
+    for index, text in enumerate(['dritte\nStraße\n', 'zweihundert\n' * 30000]):
+        path = tmp_path / '{}.txt'.format(index)
+        path.write_text(text, encoding='utf8')
+        paths.append(str(path))
+    expected = 'dritte\t3\t1\tde\n' + 'zweihundert\t200\t0\tde\n' * 30000
+    assert run(paths + ['--lang', 'de', '--engine', engine]) == expected
+    assert run(paths + ['--lang', 'de', '--engine', engine, '--jobs', '2']) == expected
+
+
+@pytest.mark.parametrize('jobs', ['1', '2'])
+def test_lang_column_holds_the_language_without_region(jobs):
+    assert run(['--lang', 'FR-be', '--jobs', jobs], 'vingt\n') == 'vingt\t20\t0\tfr\n'
+
+
+@pytest.mark.parametrize('argv', [['--lang', 'xx'], ['--lang', 'fr', '--strict'], ['--jobs', '-1']])
+def test_usage_errors(argv):
+    with pytest.raises(SystemExit):
+        run(argv)
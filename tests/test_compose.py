@@ -0,0 +1,61 @@
+# coding: utf-8
+"""Test composing numbers written in several words."""
+
+
+from __future__ import unicode_literals
+
+import pytest
+
+from parse_numeric_value import parse_number
+from parse_numeric_value.compose import parse_phrase, scale_words
+
+
+@pytest.mark.parametrize('text,lang,value', [
+    ('drie miljoen', 'nl', (3000000, False)),
+    ('drie miljoen tweehonderdduizend', 'nl', (3200000, False)),
+    ('negentigduizend achthonderdachtentachtig', 'nl', (90888, False)),
+    ('duizend miljoen', 'nl', (1000000000, False)),
+    ('twee honderd drie', 'nl', (203, False)),
+    ('drie miljoenste', 'nl', (3000000, True)),
+    ('tweeduizend honderd', 'nl', (2100, False)),
+    ('drei millionen zweihunderttausend', 'de', (3200000, False)),
+    ('zwei milliarden', 'de', (2000000000, False)),
+    ('drei millionste', 'de', (3000000, True)),
+    ('eine million', 'de', (1000000, False)),
+    ('deux millions trois cent mille', 'fr', (2300000, False)),
+    ('vingt et un', 'fr', (21, False)),
+    ('deux cents', 'fr', (200, False)),
+    ('trois millionième', 'fr', (3000000, True)),
+    ('drie vier', 'nl', (None, None)),
+    ('tweede drie', 'nl', (None, None)),
+    ('miljoen miljoen', 'nl', (None, None)),
+    ('drie straat', 'nl', (None, None)),
+    ('en drie', 'nl', (None, None)),
+    ('tausend tausend', 'de', (None, None)),
+    ('duizend miljard', 'nl', (1000000000000, False)),
+    ('twee miljoen drie miljard', 'nl', (None, None)),
+    ('twee miljoen duizend miljard', 'nl', (None, None)),
+    ('miljoen miljard', 'nl', (None, None)),
+    ('nul miljoen', 'nl', (None, None)),
+    ('zéro million', 'fr', (None, None)),
+    ('null tausend', 'de', (None, None)),
+    ('nul drie', 'nl', (None, None)),
+    ('drie miljoen nul', 'nl', (None, None)),
+    ('negentig twee', 'nl', (None, None)),
+    ('neunzig zweite', 'de', (None, None)),
+    ('tweehonderd drie', 'nl', (203, False)),
+    ('deux cent quatre-vingt-deux', 'fr', (282, False)),
+    ('mille quatre-vingt-deux', 'fr', (1082, False)),
+    ('deux cent quatre-vingt-deuxième', 'fr', (None, None)),
+])
+def test_parse_phrase(text, lang, value):
+    assert parse_phrase(text, lang, determine_value=True) == value
+    assert parse_phrase(text, lang) == (value[1] is not None)
+    assert parse_number(text, lang, determine_value=True) == value
+
+
+def test_scale_words():
+    assert scale_words('nl')['honderd'] == (100, False)
+    assert scale_words('de')['milliardste'] == (10 ** 9, True)
+    assert scale_words('fr')['millième'] == (1000, True)
+    assert 'milles' not in scale_words('fr')
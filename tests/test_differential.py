@@ -0,0 +1,50 @@
+# coding: utf-8
+"""Differential fuzzing of the engines, caches and batch paths against the reference parsers.
+   Set PARSE_NUMERIC_VALUE_FUZZ_BUDGET for more inputs per language than the default."""
+
+
+from __future__ import unicode_literals
+
+import pytest
+
+from parse_numeric_value import differential
+from parse_numeric_value.differential import Raised, check, generate_inputs, outcome, run, shrink
+from parse_numeric_value.registry import load_language
+
+
+@pytest.mark.parametrize('lang', ['nl', 'de', 'fr'])
+def test_implementations_agree_with_reference(lang):
+    assert run(languages=[lang]) == []
+
+
+def test_parallel_agrees_with_reference():
+    assert run(budget=200, languages=['nl'], parallel=True) == []
+
+
+def test_inputs_are_reproducible():
+    assert generate_inputs('de', 50, seed=1) == generate_inputs('de', 50, seed=1)
+    assert generate_inputs('de', 50, seed=1) != generate_inputs('de', 50, seed=2)
+
+
+def test_outcome():
+    assert outcome(load_language('nl').parse_number, 'vijfde', True, {}) == (5, True)
+    assert outcome(lambda text, determine_value: {}[text], 'x', True, {}) == Raised('KeyError')
+
+
+def test_shrink():
+    assert shrink('abXcdeXfgh', lambda text: text.count('X') == 2) == 'XX'
+
+
+def test_mismatches_are_found_and_shrunk(monkeypatch):
+    reference = load_language('nl').parse_number
+
+    def broken(text, determine_value=False, **options):
+        if 'drie' in text:
+            return (None, None) if determine_value else False
+        return reference(text, determine_value=determine_value, **options)
+
+    monkeypatch.setattr(differential, 'implementations', lambda lang: {'broken': (broken, False)})
+    monkeypatch.setattr(differential, 'batch_implementations', lambda lang, parallel=False: {})
+    mismatches = check('nl', ['vijfde', 'Dorpsstraat', 'driehonderdzesde'])
+    assert len(mismatches) == 4
+    assert {(mismatch.text, mismatch.shrunk) for mismatch in mismatches} == {('driehonderdzesde', 'drie')}
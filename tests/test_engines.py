@@ -0,0 +1,61 @@
+# coding: utf-8
+"""Test that the alternative engines give the same results as the regex engine."""
+
+
+from __future__ import unicode_literals
+
+import pytest
+
+from parse_numeric_value.engines import ENGINES, get_parser, load_language, lookup_table
+
+
+@pytest.mark.parametrize('lang,options', [
+    ('nl', {}), ('nl', {'strict_AN_spelling': True}), ('de', {}), ('fr', {}),
+])
+def test_hybrid_agrees_with_regex(lang, options):
+    module = load_language(lang)
+    hybrid = get_parser(lang, engine='hybrid')
+    for text in list(module.candidate_spellings()) + ['', 'dog', 'vijftal', 'drie miljoen']:
+        for determine_value in (True, False):
+            try:
+                expected = module.parse_number(text, determine_value=determine_value, **options)
+            except (KeyError, TypeError):
+                continue
+            assert hybrid(text, determine_value=determine_value, **options) == expected, text
+
+
+@pytest.mark.parametrize('lang,text,value', [
+    ('nl', 'negenhonderdnegenennegentig', (999, False)), ('nl', 'tweeduizendste', (2000, True)),
+    ('nl', 'vijftal', (None, None)), ('de', 'achthunderterste', (801, True)),
+    ('de', 'fünfzahl', (None, None)), ('fr', 'trente-neuvième', (39, True)), ('fr', 'xyz', (None, None)),
+])
+def test_table_engine(lang, text, value):
+    parse_number = get_parser(lang, engine='table')
+    assert parse_number(text, determine_value=True) == value
+    assert parse_number(text) == (value[1] is not None)
+
+
+def test_table_is_built_once():
+    assert lookup_table('de') is lookup_table('de')
+
+
+def test_unknown_engine():
+    assert 'regex' in ENGINES
+    with pytest.raises(ValueError):
+        get_parser('nl', engine='quantum')
+
+
+@pytest.mark.parametrize('lang', ['nl', 'de', 'fr'])
+def test_trie_engine_agrees_with_table_engine(lang):
+    table = get_parser(lang, engine='table')
+    trie = get_parser(lang, engine='trie')
+    for text in list(lookup_table(lang)) + ['', 'dog', 'vijftal', 'hunderthundert', 'trente-']:
+        assert trie(text, determine_value=True) == table(text, determine_value=True), text
+        assert trie(text) == table(text), text
+
+
+def test_trie_engine_uses_the_table(monkeypatch):
+    from parse_numeric_value import trie
+    monkeypatch.setattr(trie, '_tries', {})
+    assert get_parser('nl', engine='trie')('drieste', determine_value=True) == (3, True)
+    assert not trie._tries
@@ -0,0 +1,28 @@
+# coding: utf-8
+"""Test finding numerals in running text."""
+
+
+from __future__ import unicode_literals
+
+import pytest
+
+from parse_numeric_value.extract import Numeral, extract_numerals
+
+
+@pytest.mark.parametrize('text,lang,expected', [
+    ('Tweede Nassaustraat', 'nl', [(0, 6, 2, True)]),
+    ('Rue du Quatre-Septembre', 'fr', [(7, 13, 4, False)]),
+    ('Dritte Querstraße', 'de', [(0, 6, 3, True)]),
+    ('Achterweg', 'nl', []),
+    ('Place du Vingt-Deux-Août', 'fr', [(9, 19, 22, False)]),
+    ('Hoek Vijfde en Zesde Straat', 'nl', [(5, 11, 5, True), (15, 20, 6, True)]),
+    ('Vierhonderdvijftigste', 'nl', [(0, 21, 450, True)]),
+    ('', 'de', []),
+])
+def test_extract_numerals(text, lang, expected):
+    assert extract_numerals(text, lang) == [Numeral(*numeral) for numeral in expected]
+
+
+def test_compounds():
+    assert extract_numerals('Tweedestraat', 'nl') == []
+    assert extract_numerals('Tweedestraat', 'nl', compounds=True) == [(0, 6, 2, True)]
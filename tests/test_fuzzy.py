@@ -0,0 +1,56 @@
+# coding: utf-8
+"""Test typo tolerant matching of numerals."""
+
+
+from __future__ import unicode_literals
+
+import pytest
+
+from parse_numeric_value.fuzzy import FuzzyMatch, fuzzy_matches, fuzzy_parse_number, search
+from parse_numeric_value.trie import build_trie
+
+
+def levenshtein(a, b):
+    row = list(range(len(b) + 1))
+    for i, char in enumerate(a, 1):
+        previous, row = row, [i]
+        for j, other in enumerate(b, 1):
+            row.append(min(row[j - 1] + 1, previous[j] + 1, previous[j - 1] + (char != other)))
+    return row[-1]
+
+
+words = ['een', 'twee', 'drie', 'dertig', 'drieëndertig', 'tweeëndertig', 'honderd', 'tweehonderd', 'derde']
+
+
+@pytest.mark.parametrize('text', ['drei', 'dertg', 'tweehondred', 'drieendertig', 'x', '', 'honderdd', 'twee'])
+@pytest.mark.parametrize('max_distance', [0, 1, 2, 3])
+def test_search_agrees_with_levenshtein(text, max_distance):
+    trie = build_trie({word: ((index, False), True) for index, word in enumerate(words)})
+    expected = sorted((word, levenshtein(word, text)) for word in words if levenshtein(word, text) <= max_distance)
+    assert sorted((spelling, distance) for spelling, entry, distance in search(trie, text, max_distance)) == expected
+
+
+@pytest.mark.parametrize('text,lang,max_distance,expected', [
+    ('vierhonderdvyftig', 'nl', 2, FuzzyMatch('vierhonderdvijftig', 450, False, 2)),
+    ('vierhonderdvyftig', 'nl', 1, None),
+    ('zwanzigstte', 'de', 1, FuzzyMatch('zwanzigste', 20, True, 1)),
+    ('trante-deux', 'fr', 1, FuzzyMatch('trente-deux', 32, False, 1)),
+    ('vijfde', 'nl', 1, FuzzyMatch('vijfde', 5, True, 0)),
+    ('Dorpsstraat', 'nl', 2, None),
+    ('en', 'nl', 1, None),
+])
+def test_fuzzy_parse_number(text, lang, max_distance, expected):
+    assert fuzzy_parse_number(text, lang, max_distance) == expected
+
+
+def test_fuzzy_matches_closest_first():
+    matches = fuzzy_matches('zestg', 'nl', 2)
+    assert matches[0] == FuzzyMatch('zestig', 60, False, 1)
+    assert [match.distance for match in matches] == sorted(match.distance for match in matches)
+    assert all(match.ordinal is not None for match in matches)
+
+
+def test_fuzzy_options():
+    assert fuzzy_parse_number('tweeste', 'nl').distance == 0
+    assert fuzzy_parse_number('tweeste', 'nl', strict_AN_spelling=True) is None
+    assert fuzzy_parse_number('tweeste', 'nl', 2, strict_AN_spelling=True) == FuzzyMatch('tweede', 2, True, 2)
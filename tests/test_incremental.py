@@ -0,0 +1,129 @@
+# coding: utf-8
+"""Test keeping the numerals of an OSM dataset up to date with change files."""
+
+
+from __future__ import unicode_literals
+
+import io
+import sqlite3
+import tracemalloc
+
+import pytest
+
+from parse_numeric_value import artifacts
+from parse_numeric_value.artifacts import result_version
+from parse_numeric_value.incremental import ResultStore
+from parse_numeric_value.osm import iter_changes
+
+osm_xml = '''<?xml version="1.0" encoding="UTF-8"?>
+<osm version="0.6">
+  <node id="1"><tag k="name" v="Tweede Nassaustraat"/><tag k="amenity" v="bench"/></node>
+  <node id="2"><tag k="name" v="Dorpsstraat"/></node>
+  <way id="3"><tag k="addr:street:de" v="Dritte Querstraße"/></way>
+  <relation id="4"><tag k="ref:fr-BE" v="trente-deux"/></relation>
+</osm>'''.encode('utf-8')
+
+osm_change = '''<?xml version="1.0" encoding="UTF-8"?>
+<osmChange version="0.6">
+  <create><node id="5"><tag k="name" v="Vijfde Laan"/></node></create>
+  <modify>
+    <node id="1"><tag k="name" v="Tweede Nassaustraat"/><tag k="amenity" v="post_box"/></node>
+    <node id="2"><tag k="name" v="Derde Dorpsstraat"/></node>
+  </modify>
+  <delete><way id="3"/></delete>
+</osmChange>'''.encode('utf-8')
+
+
+@pytest.fixture
+def store(tmp_path):
+    with ResultStore(str(tmp_path / 'numerals.sqlite'), default_lang='nl') as store:
+        assert store.load(io.BytesIO(osm_xml)) == {'parsed': 4, 'unchanged': 0, 'deleted': 0, 'errors': 0}
+        yield store
+
+
+def test_iter_changes():
+    assert [(action, element) for action, element, tags in iter_changes(io.BytesIO(osm_change))] == [
+        ('create', 'node/5'), ('modify', 'node/1'), ('modify', 'node/2'), ('delete', 'way/3')]
+
+
+def test_iter_changes_keeps_memory_bounded(tmp_path):
+    path = str(tmp_path / 'large.osc')
+    with io.open(path, 'w', encoding='utf-8') as fh:
+        fh.write('<osmChange version="0.6"><modify>')
+        for element_id in range(20000):
+            fh.write('<node id="{}"><tag k="name" v="Derde Dorpsstraat"/></node>'.format(element_id))
+        fh.write('</modify></osmChange>')
+    tracemalloc.start()
+    try:
+        count = sum(1 for change in iter_changes(path))
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    assert count == 20000
+    # Holding every element of the modify would take tens of megabytes
+    assert peak < 2 * 1024 ** 2
+
+
+def test_load(store):
+    assert sorted(store.numerals()) == [('node/1', 'name', 'Tweede', 2, True),
+                                        ('relation/4', 'ref:fr-BE', 'trente-deux', 32, False),
+                                        ('way/3', 'addr:street:de', 'Dritte', 3, True)]
+
+
+def test_apply_change_parses_only_changed_tags(store):
+    counts = store.apply_change(io.BytesIO(osm_change), sequence=4242)
+    assert counts == {'parsed': 2, 'unchanged': 1, 'deleted': 1, 'errors': 0}
+    assert store.sequence == 4242
+    assert sorted(store.numerals()) == [('node/1', 'name', 'Tweede', 2, True),
+                                        ('node/2', 'name', 'Derde', 3, True),
+                                        ('node/5', 'name', 'Vijfde', 5, True),
+                                        ('relation/4', 'ref:fr-BE', 'trente-deux', 32, False)]
+    assert list(store.numerals('node/5')) == [('node/5', 'name', 'Vijfde', 5, True)]
+
+
+def test_upgrade_refreshes_only_stale_rows(store, tmp_path):
+    assert store.stale() == {}
+    store.connection.execute("UPDATE tags SET version = 'old', numerals = '[]' WHERE lang = 'nl'")
+    store.connection.commit()
+    assert store.stale() == {'nl': 2}
+    assert store.refresh() == 2
+    assert store.stale() == {}
+    assert ('node/1', 'name', 'Tweede', 2, True) in store.numerals()
+    versions = dict(store.connection.execute('SELECT lang, version FROM tags'))
+    assert versions == {lang: result_version(lang) for lang in ('nl', 'de', 'fr')}
+
+
+def test_library_upgrade_makes_everything_stale(store, monkeypatch):
+    monkeypatch.setattr(artifacts, 'library_version', lambda: '99.0')
+    with ResultStore(store.connection.execute('PRAGMA database_list').fetchone()[2], default_lang='nl') as upgraded:
+        assert upgraded.stale() == {'nl': 2, 'de': 1, 'fr': 1}
+
+
+def test_other_kind_of_engine_makes_everything_stale(store):
+    path = store.connection.execute('PRAGMA database_list').fetchone()[2]
+    with ResultStore(path, default_lang='nl', engine='hybrid') as same_kind:
+        assert same_kind.stale() == {}
+    with ResultStore(path, default_lang='nl', engine='table') as table_only:
+        assert table_only.stale() == {'nl': 2, 'de': 1, 'fr': 1}
+        assert table_only.refresh() == 4
+        assert table_only.stale() == {}
+        versions = set(version for version, in table_only.connection.execute('SELECT version FROM tags'))
+        assert all(version.endswith('/table') for version in versions)
+
+
+def test_tokens_the_parser_raises_for_are_counted(store):
+    change = '''<osmChange version="0.6"><create>
+      <node id="6"><tag k="name:fr" v="Rue Quatre-Vingt-Deux"/><tag k="ref:fr" v="vingt"/></node>
+    </create></osmChange>'''.encode('utf-8')
+    assert store.apply_change(io.BytesIO(change)) == {'parsed': 2, 'unchanged': 0, 'deleted': 0, 'errors': 1}
+    assert list(store.numerals('node/6')) == [('node/6', 'ref:fr', 'vingt', 20, False)]
+
+
+def test_settings_are_fixed(tmp_path):
+    path = str(tmp_path / 'numerals.sqlite')
+    ResultStore(path, default_lang='nl').close()
+    with pytest.raises(ValueError):
+        ResultStore(path, default_lang='de')
+    with pytest.raises(ValueError):
+        ResultStore(path, keys=('name',), default_lang='nl')
+    assert sqlite3.connect(path).execute('SELECT COUNT(*) FROM tags').fetchone() == (0,)
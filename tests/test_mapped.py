@@ -0,0 +1,61 @@
+# coding: utf-8
+"""Test the memory-mapped lookup tables."""
+
+
+from __future__ import unicode_literals
+
+import pytest
+
+from parse_numeric_value.artifacts import table_version
+from parse_numeric_value.engines import get_parser, lookup_table
+from parse_numeric_value.mapped import MappedTable, mapped_path, mapped_table, write_mapped_table
+
+
+@pytest.mark.parametrize('lang', ['nl', 'de', 'fr'])
+def test_mapped_table_matches_lookup_table(lang, tmp_path):
+    table = lookup_table(lang)
+    path = str(tmp_path / 'table.mmap')
+    write_mapped_table(table, path, table_version(lang))
+    with MappedTable(path) as mapped:
+        assert len(mapped) == len(table)
+        assert dict(mapped.items()) == table
+        for text, entry in table.items():
+            assert mapped[text] == entry
+        assert 'Dorpsstraat' not in mapped
+        assert mapped.get('', 'missing') == 'missing'
+
+
+def test_values_beyond_int64(tmp_path):
+    table = {'driekwart': ((0.75, False), True), 'quadriljard': ((10 ** 27, False), True),
+             'straat': ((None, None), False), 'tweede': ((2, True), True)}
+    path = str(tmp_path / 'table.mmap')
+    write_mapped_table(table, path, '0' * 40)
+    with MappedTable(path) as mapped:
+        assert dict(mapped.items()) == table
+        with pytest.raises(KeyError):
+            mapped['derde']
+
+
+def test_stale_tables_are_rewritten(tmp_path):
+    directories = [str(tmp_path)]
+    path = mapped_path('de', directories[0])
+    write_mapped_table({}, path, '0' * 40)
+    mapped = mapped_table('de', directories)
+    assert mapped.version == table_version('de')
+    assert mapped['dritte'] == ((3, True), True)
+    assert mapped_table('de', directories) is mapped
+
+
+def test_not_a_mapped_table(tmp_path):
+    path = tmp_path / 'table.mmap'
+    path.write_bytes(b'not a table')
+    with pytest.raises(ValueError):
+        MappedTable(str(path))
+
+
+@pytest.mark.parametrize('lang,text', [('nl', 'vijfde'), ('de', 'zweihundert'), ('fr', 'trente-deux'), ('nl', 'xyz')])
+def test_mmap_engine(lang, text):
+    table = get_parser(lang, engine='table')
+    mapped = get_parser(lang, engine='mmap')
+    for determine_value in (True, False):
+        assert mapped(text, determine_value=determine_value) == table(text, determine_value=determine_value)
@@ -0,0 +1,58 @@
+# coding: utf-8
+"""Test the per-path counters and latency histograms."""
+
+
+from __future__ import unicode_literals
+
+import pytest
+
+from parse_numeric_value.engines import load_language
+from parse_numeric_value.metrics import ParseMetrics
+
+
+@pytest.fixture
+def metrics():
+    metrics = ParseMetrics()
+    yield metrics
+    metrics.uninstall()
+
+
+def test_counts_per_path(metrics):
+    parse_number = metrics.instrument('nl')
+    for text in ('vijfde', 'tweehonderd', 'vijftal', '', 'twee drie'):
+        parse_number(text, determine_value=True)
+    assert parse_number('tweeste', strict_AN_spelling=True) is False
+    assert metrics.counts() == {('nl', 'dict'): 1, ('nl', 'regex'): 2, ('nl', 'empty'): 1,
+                                ('nl', 'multi_word'): 1, ('nl', 'ordinal_reject'): 1}
+
+
+def test_engine_hits_are_counted_under_engine_name(metrics):
+    parse_number = metrics.instrument('de', engine='hybrid')
+    assert parse_number('zweihundert', determine_value=True) == (200, False)
+    parse_number('hunderthundert')
+    assert metrics.counts() == {('de', 'hybrid'): 1, ('de', 'regex'): 1}
+
+
+def test_exports(metrics, tmpdir):
+    parse_number = metrics.instrument('fr')
+    parse_number('trente-deux')
+    parse_number('trente-trois')
+    exported = metrics.as_dict()
+    assert exported['fr']['regex']['count'] == 2
+    assert sum(exported['fr']['regex']['buckets'].values()) == 2
+    path = str(tmpdir.join('parse.prom'))
+    metrics.write_prometheus(path)
+    with open(path) as fh:
+        text = fh.read()
+    assert 'parse_numeric_value_calls_total{lang="fr",path="regex"} 2\n' in text
+    assert 'parse_numeric_value_seconds_bucket{lang="fr",path="regex",le="+Inf"} 2\n' in text
+    assert 'parse_numeric_value_seconds_count{lang="fr",path="regex"} 2\n' in text
+
+
+def test_uninstall_restores_trace(metrics):
+    module = load_language('de')
+    previous = module.trace
+    metrics.instrument('de')
+    assert module.trace is not previous
+    metrics.uninstall()
+    assert module.trace is previous
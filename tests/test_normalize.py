@@ -0,0 +1,94 @@
+# coding: utf-8
+"""Test normalization of text before it's parsed."""
+
+
+from __future__ import unicode_literals
+
+import unicodedata
+
+import pytest
+
+from parse_numeric_value import parse_number
+from parse_numeric_value.batch import parse_numbers
+from parse_numeric_value.engines import lookup_table
+from parse_numeric_value.normalize import morphemes, normalize, strip_diacritics
+
+
+@pytest.mark.parametrize('text,lang,expected', [
+    ('Vijfde', 'nl', 'vijfde'),
+    ('ZWANZIG', 'de', 'zwanzig'),
+    (unicodedata.normalize('NFD', 'zéro'), 'fr', 'zéro'),
+    (unicodedata.normalize('NFD', 'fünf'), 'de', 'fünf'),
+    ('vingt–et‑un', 'fr', 'vingt-et-un'),
+    ('vingt­-deux', 'fr', 'vingt-deux'),
+    (' drie  miljoen\t', 'nl', 'drie miljoen'),
+    ('Dreißig', 'de', 'dreißig'),
+])
+def test_normalize(text, lang, expected):
+    assert normalize(text, lang) == expected
+
+
+@pytest.mark.parametrize('text,lang,expected', [
+    ('fuenf', 'de', 'fünf'),
+    ('Fünfzehn', 'de', 'fünfzehn'),
+    ('zwoelfte', 'de', 'zwölfte'),
+    ('dreissig', 'de', 'dreizig'),
+    ('Dreißigste', 'de', 'dreizigste'),
+    ('décillion', 'fr', 'décillion'),
+    ('tweeenveertig', 'nl', 'tweeënveertig'),
+    ('drieëntwintig', 'nl', 'drieëntwintig'),
+    ('één', 'nl', 'een'),
+    ('zero', 'fr', 'zéro'),
+    ('DEUXIEME', 'fr', 'deuxième'),
+    ('premiere', 'fr', 'première'),
+])
+def test_fold_diacritics(text, lang, expected):
+    assert normalize(text, lang, fold_diacritics=True) == expected
+
+
+def test_strip_diacritics():
+    assert strip_diacritics('één fünf zéro') == 'een funf zero'
+
+
+@pytest.mark.parametrize('text,lang,value', [
+    ('Vijfde', 'nl', (5, True)),
+    ('ZWANZIG', 'de', (20, False)),
+    (unicodedata.normalize('NFD', 'zéro'), 'fr', (0, False)),
+    ('vingt–et–un', 'fr', (21, False)),
+])
+def test_parse_normalized(text, lang, value):
+    assert parse_number(text, lang, True) == (None, None)
+    assert parse_number(text, lang, True, normalize=True) == value
+    assert parse_numbers([text], lang, True, normalize=True) == [value]
+    assert parse_numbers([text], lang, True, engine='table', normalize=True) == [value]
+
+
+@pytest.mark.parametrize('text,lang,value', [('fuenf', 'de', (5, False)), ('deuxieme', 'fr', (2, True)),
+                                             ('Tweeenveertig', 'nl', (42, False)), ('dreissig', 'de', (30, False)),
+                                             ('Dreißigste', 'de', (30, True)), ('decillion', 'fr', (10 ** 60, False))])
+def test_parse_folded(text, lang, value):
+    assert parse_number(text, lang, True, normalize=True) == (None, None)
+    assert parse_number(text, lang, True, normalize=True, fold_diacritics=True) == value
+    assert parse_numbers([text], lang, True, normalize=True, fold_diacritics=True) == [value]
+
+
+@pytest.mark.parametrize('lang,folded,canonical', [(lang, folded, canonical) for lang in sorted(morphemes)
+                                                   for folded, canonical in morphemes[lang]])
+def test_morphemes_map_to_accepted_spellings(lang, folded, canonical):
+    assert any(canonical in text for text in lookup_table(lang))
+
+
+@pytest.mark.parametrize('lang', ['nl', 'de', 'fr'])
+def test_folded_spellings_parse(lang):
+    failures = []
+    for text, (value, valid) in lookup_table(lang).items():
+        folded = [strip_diacritics(text), text.replace('ü', 'ue').replace('ö', 'oe')]
+        for variant in set(folded) - {text}:
+            if parse_number(variant, lang, True, normalize=True, fold_diacritics=True) != value:
+                failures.append(variant)
+    assert failures == []
+
+
+def test_options_reach_the_parser():
+    assert parse_number('Tweeste', 'nl', normalize=True)
+    assert not parse_number('Tweeste', 'nl', normalize=True, strict_AN_spelling=True)
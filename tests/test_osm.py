@@ -0,0 +1,61 @@
+# coding: utf-8
+"""Test scanning OSM files for numerals in tag values."""
+
+
+from __future__ import unicode_literals
+
+import io
+
+import pytest
+
+from parse_numeric_value.osm import scan_tags, split_key
+
+osm_xml = '''<?xml version="1.0" encoding="UTF-8"?>
+<osm version="0.6">
+  <node id="1" lat="50.8" lon="4.3">
+    <tag k="name" v="Tweede Nassaustraat"/>
+    <tag k="name:fr" v="Rue du Quatre-Septembre"/>
+    <tag k="amenity" v="bench"/>
+  </node>
+  <way id="2">
+    <nd ref="1"/>
+    <tag k="addr:street:de" v="Dritte Querstraße"/>
+    <tag k="name:nl" v="Dorpsstraat"/>
+  </way>
+  <relation id="3">
+    <member type="way" ref="2" role="outer"/>
+    <tag k="ref:fr-BE" v="trente-deux"/>
+  </relation>
+</osm>'''.encode('utf-8')
+
+
+def test_scan_tags():
+    records = list(scan_tags(io.BytesIO(osm_xml), default_lang='nl'))
+    assert records == [
+        ('node/1', 'name', 'Tweede', 2, True),
+        ('way/2', 'addr:street:de', 'Dritte', 3, True),
+        ('relation/3', 'ref:fr-BE', 'trente-deux', 32, False),
+    ]
+
+
+def test_keys_without_language_are_skipped_without_default():
+    assert [record[0] for record in scan_tags(io.BytesIO(osm_xml))] == ['way/2', 'relation/3']
+
+
+def test_tokens_the_parser_raises_for_are_skipped():
+    source = '''<osm version="0.6">
+      <node id="1"><tag k="name:fr" v="Rue Quatre-Vingt-Deux"/></node>
+      <node id="2"><tag k="name:fr" v="Rue Vingt"/></node>
+    </osm>'''.encode('utf-8')
+    errors = []
+    assert list(scan_tags(io.BytesIO(source), errors=errors)) == [('node/2', 'name:fr', 'Vingt', 20, False)]
+    assert [(element_id, key, token, type(e)) for element_id, key, token, e in errors] == [
+        ('node/1', 'name:fr', 'Quatre-Vingt-Deux', KeyError)]
+
+
+@pytest.mark.parametrize('key,expected', [
+    ('name', ('name', None)), ('name:nl', ('name', 'nl')), ('addr:street', ('addr:street', None)),
+    ('addr:street:de', ('addr:street', 'de')), ('name:fr-CH', ('name', 'fr')), ('name:en', ('name:en', None)),
+])
+def test_split_key(key, expected):
+    assert split_key(key) == expected
@@ -0,0 +1,28 @@
+# coding: utf-8
+"""Test that parallel parsing gives the same results in the same order."""
+
+
+from __future__ import unicode_literals
+
+import pytest
+
+from parse_numeric_value.batch import parse_numbers
+from parse_numeric_value.parallel import chunked, parse_numbers_parallel
+
+texts = ['vijfde', 'Dorpsstraat', 'tweehonderd', '', 'duizendpoot', 'tweeste', 'negentig'] * 50
+
+
+@pytest.mark.parametrize('determine_value', [True, False])
+def test_parallel_matches_batch(determine_value):
+    expected = parse_numbers(texts, lang='nl', determine_value=determine_value)
+    assert parse_numbers_parallel(iter(texts), lang='nl', determine_value=determine_value,
+                                  workers=2, chunk_size=16) == expected
+
+
+def test_parallel_passes_options():
+    assert parse_numbers_parallel(['tweeste'], lang='nl', determine_value=True, workers=1,
+                                  strict_AN_spelling=True) == [(None, None)]
+
+
+def test_chunked():
+    assert list(chunked(range(5), 2)) == [[0, 1], [2, 3], [4]]
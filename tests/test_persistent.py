@@ -0,0 +1,70 @@
+# coding: utf-8
+"""Test the parse results kept on disk across runs."""
+
+
+from __future__ import unicode_literals
+
+import pytest
+
+from parse_numeric_value.batch import parse_numbers
+from parse_numeric_value.persistent import PersistentCache
+
+texts = ['vijfde', 'Dorpsstraat', 'tweehonderd', '', 'driekwart', 'tweeste', 'vijfde', 'drie miljoen']
+
+
+@pytest.mark.parametrize('determine_value', [True, False])
+def test_warm_run_parses_nothing(tmp_path, determine_value):
+    path = str(tmp_path / 'results.sqlite')
+    with PersistentCache(path) as cache:
+        assert cache.parse_numbers(texts, 'nl', determine_value) == parse_numbers(texts, 'nl', determine_value)
+        assert (cache.hits, cache.misses) == (0, 7)
+        assert len(cache) == 0
+    with PersistentCache(path) as cache:
+        assert len(cache) == 7
+        assert cache.parse_numbers(texts, 'nl', determine_value) == parse_numbers(texts, 'nl', determine_value)
+        assert (cache.hits, cache.misses) == (7, 0)
+
+
+def test_key_holds_options_and_normalization(tmp_path):
+    with PersistentCache(str(tmp_path / 'results.sqlite'), write_batch=1) as cache:
+        assert cache.parse_number('tweeste', 'nl', True) == (2, True)
+        assert cache.parse_number('tweeste', 'nl', True, strict_AN_spelling=True) == (None, None)
+        assert cache.parse_number('tweeste', 'nl') is True
+        assert cache.parse_number('Tweeste', 'nl', True) == (None, None)
+        assert cache.parse_number('Tweeste', 'nl', True, normalize=True) == (2, True)
+        assert cache.parse_number('TWEESTE', 'nl-BE', True, normalize=True) == (2, True)
+        assert cache.parse_number('tweeste', 'de', True) == (None, None)
+        assert (cache.hits, cache.misses) == (1, 6)
+
+
+def test_key_holds_table_only_engines(tmp_path):
+    path = str(tmp_path / 'results.sqlite')
+    with PersistentCache(path, engine='table') as cache:
+        assert cache.parse_number('drie miljoen', 'nl', True) == (None, None)
+    with PersistentCache(path, engine='regex') as cache:
+        assert cache.parse_number('drie miljoen', 'nl', True) == (3000000, False)
+        assert cache.misses == 1
+
+
+def test_write_behind_and_eviction(tmp_path):
+    with PersistentCache(str(tmp_path / 'results.sqlite'), max_entries=4, write_batch=3) as cache:
+        cache.parse_numbers(['een', 'twee'], 'nl')
+        assert len(cache) == 0
+        cache.parse_numbers(['een', 'drie'], 'nl')
+        assert len(cache) == 3
+        cache.parse_numbers(['vier', 'vijf', 'zes'], 'nl')
+        assert len(cache) == 4
+        assert cache.evict() == 0
+    with PersistentCache(str(tmp_path / 'results.sqlite')) as cache:
+        cache.parse_numbers(['vier', 'vijf', 'zes'], 'nl')
+        assert (cache.hits, cache.misses) == (3, 0)
+
+
+def test_many_texts(tmp_path):
+    many = ['{}ste'.format(text) for text in ['twintig', 'dertig', 'veertig'] * 1000] + [str(i) for i in range(2000)]
+    with PersistentCache(str(tmp_path / 'results.sqlite')) as cache:
+        expected = parse_numbers(many, 'nl', True)
+        assert cache.parse_numbers(many, 'nl', True) == expected
+        cache.flush()
+        assert cache.parse_numbers(many, 'nl', True) == expected
+        assert cache.hits == 2003
@@ -0,0 +1,59 @@
+# coding: utf-8
+"""Test that the prefilter never rejects a string parse_number accepts."""
+
+
+from __future__ import unicode_literals
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from parse_numeric_value.engines import load_language
+from parse_numeric_value.prefilter import get_prefilter, prefiltered_parser
+from tests.lang import conversion_cases
+
+
+def accepted(module, text):
+    try:
+        return module.parse_number(text, determine_value=True) != (None, None) or module.parse_number(text)
+    except (KeyError, TypeError):
+        return True
+
+
+@pytest.mark.parametrize('lang', ['nl', 'de', 'fr'])
+def test_no_false_negatives(lang):
+    module = load_language(lang)
+    may_be_numeral = get_prefilter(lang)
+    texts = [case[0] for case in conversion_cases(lang)] + list(module.candidate_spellings())
+    false_negatives = [text for text in texts if not may_be_numeral(text) and accepted(module, text)]
+    assert false_negatives == []
+
+
+@pytest.mark.parametrize('lang,text', [
+    ('nl', 'vijftal'), ('nl', 'duizendpoot'), ('nl', 'tweebenig'), ('nl', 'Dorpsstraat'), ('nl', ''),
+    ('de', 'fünfzahl'), ('de', 'zwölfteilige'), ('de', 'Hauptstraße'),
+    ('fr', 'avenue'), ('fr', 'Septembre'), ('fr', 'allée'),
+])
+def test_rejects_non_numerals(lang, text):
+    assert not get_prefilter(lang)(text)
+    assert prefiltered_parser(lang)(text, determine_value=True) == (None, None)
+    assert prefiltered_parser(lang)(text) is False
+
+
+@pytest.mark.parametrize('sre_parse', [None, object()])
+def test_changed_re_internals_pass_every_text(monkeypatch, sre_parse):
+    from parse_numeric_value import prefilter
+    monkeypatch.setattr(prefilter, 'sre_parse', sre_parse)
+    monkeypatch.setattr(prefilter, '_prefilters', {})
+    assert get_prefilter('nl')('Dorpsstraat')
+    assert prefiltered_parser('nl')('vijfde', determine_value=True) == (5, True)
+
+
+def test_import_does_not_scan_unicode():
+    code = ('from parse_numeric_value import prefilter; '
+            'assert prefilter._whitespace.cache_info().currsize == 0; '
+            'prefilter.get_prefilter("fr"); '
+            'assert " " in prefilter._whitespace()')
+    subprocess.check_call([sys.executable, '-c', code], cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
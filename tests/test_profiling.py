@@ -0,0 +1,89 @@
+# coding: utf-8
+"""Profiling of corpus runs, per language and code path."""
+
+
+from __future__ import unicode_literals
+
+import io
+import json
+import pstats
+
+import pytest
+
+from parse_numeric_value.profiling import ERROR_PATH, main, profile_corpus, read_corpus
+from parse_numeric_value.registry import load_language
+
+CORPUS = 'vijfde\neenentwintigste\nhuis\nnegentig en een\nde\tdreiundzwanzig\nfr\tquatre-vingt\n'
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    path = tmp_path / 'corpus.txt'
+    path.write_text(CORPUS, encoding='utf8')
+    return str(path)
+
+
+def test_read_corpus(corpus):
+    assert read_corpus(corpus, ['nl', 'de'])[:2] == [('nl', 'vijfde'), ('de', 'vijfde')]
+    assert read_corpus(corpus)[-2:] == [('de', 'dreiundzwanzig'), ('fr', 'quatre-vingt')]
+
+
+def test_breakdown_per_language_and_path(corpus):
+    report = profile_corpus(read_corpus(corpus), slowest=2)
+    assert set(report.paths) == {('nl', 'dict'), ('nl', 'regex'), ('nl', 'multi_word'), ('de', 'regex'),
+                                 ('fr', 'regex')}
+    assert report.paths[('nl', 'regex')].calls == 2
+    # The French reference parser raises for quatre-vingt
+    assert report.paths[('fr', 'regex')].errors == 1
+    assert all(statistics.allocated_bytes >= 0 for statistics in report.paths.values())
+    assert len(report.slowest) == 2
+    assert report.slowest[0][0] >= report.slowest[1][0]
+    assert json.loads(json.dumps(report.as_dict()))['engine'] == 'regex'
+    assert 'de;regex;parse_to_numeric_value.py:parse_number;re:wrong_ordinals_re.match' in report.stacks
+    assert not any('profiling.py' in stack for stack in report.stacks)
+
+
+@pytest.mark.parametrize('engine', ['table', 'hybrid'])
+def test_engines(corpus, engine):
+    report = profile_corpus(read_corpus(corpus), engine, allocations=False, cprofile=False, stacks=False)
+    assert sum(statistics.calls for statistics in report.paths.values()) == 6
+    assert all(statistics.allocated_bytes is None for statistics in report.paths.values())
+
+
+def test_trace_hooks_are_restored(corpus):
+    module = load_language('nl')
+    hook = module.trace
+    profile_corpus(read_corpus(corpus))
+    assert module.trace is hook
+
+
+def test_main_writes_reports(corpus, tmp_path, capsys):
+    folded, profile, report = (str(tmp_path / name) for name in ('nl.folded', 'nl.prof', 'report.json'))
+    main([corpus, '--lang', 'nl', '--folded', folded, '--pstats', profile, '--json', report, '--top', '3'])
+    assert 'multi_word' in capsys.readouterr().out
+    with io.open(folded, encoding='utf8') as fh:
+        lines = fh.read().splitlines()
+    assert lines
+    for line in lines:
+        stack, count = line.rsplit(' ', 1)
+        assert stack.split(';')[0] in ('nl', 'de', 'fr')
+        assert int(count) > 0
+    assert pstats.Stats(profile).total_calls > 0
+    with io.open(report, encoding='utf8') as fh:
+        assert {path['lang'] for path in json.load(fh)['paths']} == {'nl', 'de', 'fr'}
+
+
+def test_calls_raising_before_a_path_is_reported():
+    # The German parser has no strict_AN_spelling, so it raises TypeError before tracing a path
+    report = profile_corpus([('de', 'drei'), ('nl', 'tweeste')], strict_AN_spelling=True, allocations=False)
+    assert report.paths[('de', ERROR_PATH)].errors == 1
+    assert not any(stack.startswith('de;regex') for stack in report.stacks)
+
+
+def test_strict_only_for_nl(corpus, tmp_path, capsys):
+    with pytest.raises(SystemExit):
+        main([corpus, '--strict'])
+    nl_only = tmp_path / 'nl.txt'
+    nl_only.write_text('tweeste\nvijfde\n', encoding='utf8')
+    main([str(nl_only), '--lang', 'nl', '--strict'])
+    assert 'ordinal_reject' in capsys.readouterr().out
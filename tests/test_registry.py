@@ -0,0 +1,53 @@
+# coding: utf-8
+"""Test the language registry and the parse_number front door."""
+
+
+from __future__ import unicode_literals
+
+import subprocess
+import sys
+
+import pytest
+
+import parse_numeric_value
+from parse_numeric_value import parse_number, resolve_language
+
+
+@pytest.mark.parametrize('text,lang,value', [
+    ('vijfde', 'nl', (5, True)), ('vijfde', 'nl-BE', (5, True)), ('fünfte', 'de', (5, True)),
+    ('fünfte', 'de_AT', (5, True)), ('septante', 'fr-BE', (70, False)), ('nonante', 'fr-CH', (90, False)),
+    ('trente-deux', 'FR', (32, False)),
+])
+def test_front_door(text, lang, value):
+    assert parse_number(text, lang=lang, determine_value=True) == value
+    assert parse_number(text, lang=lang, determine_value=True, engine='hybrid') == value
+    assert parse_number(text, lang=lang) is True
+
+
+def test_front_door_passes_options():
+    assert parse_number('tweeste', lang='nl', determine_value=True) == (2, True)
+    assert parse_number('tweeste', lang='nl', determine_value=True, strict_AN_spelling=True) == (None, None)
+
+
+def test_unsupported_language():
+    with pytest.raises(ValueError):
+        resolve_language('en')
+
+
+def test_languages_are_imported_lazily():
+    code = ('import sys, parse_numeric_value\n'
+            'assert not [m for m in sys.modules if m.startswith("parse_numeric_value.lang.")], sys.modules\n'
+            'parse_numeric_value.parse_number("zwei", lang="de")\n'
+            'print(sorted(m for m in sys.modules if m.endswith(".parse_to_numeric_value")))')
+    output = subprocess.check_output([sys.executable, '-c', code], cwd=parse_numeric_value.__path__[0] + '/..')
+    assert output.decode().strip() == "['parse_numeric_value.lang.de.parse_to_numeric_value']"
+
+
+def test_registered_languages_are_listed(monkeypatch):
+    from parse_numeric_value import registry
+    assert parse_numeric_value.languages() == ('nl', 'de', 'fr')
+    # Removes xx again after the test
+    monkeypatch.setitem(registry.modules, 'xx', registry.modules['nl'])
+    registry.register_language('xx', registry.modules['nl'])
+    assert parse_numeric_value.languages() == ('nl', 'de', 'fr', 'xx')
+    assert parse_number('vijfde', lang='xx', determine_value=True) == (5, True)
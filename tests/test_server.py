@@ -0,0 +1,127 @@
+# coding: utf-8
+"""Test the parse server and its client."""
+
+
+from __future__ import unicode_literals
+
+import asyncio
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from parse_numeric_value.batch import parse_numbers
+from parse_numeric_value.server import BatchMetrics, ParseClient, ParseServer
+
+
+@pytest.fixture
+def running():
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    started = []
+
+    def start(server, **kwargs):
+        started.append(asyncio.run_coroutine_threadsafe(server.start(**kwargs), loop).result(5))
+        return started[-1]
+
+    yield start
+    for server in started:
+        server.close()
+
+    async def cancel_connections():
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    asyncio.run_coroutine_threadsafe(cancel_connections(), loop).result(5)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(5)
+    loop.close()
+
+
+@pytest.mark.parametrize('lang,texts', [('nl', ['vijfde', 'Dorpsstraat', 'tweeënveertig', 'vijfde']),
+                                        ('de', ['dritte', 'zweihundert']),
+                                        ('fr', ['trente-deux', 'premier', 'rue'])])
+def test_unix_socket(running, tmp_path, lang, texts):
+    path = str(tmp_path / 'parse.sock')
+    running(ParseServer(), path=path)
+    client = ParseClient(path)
+    for determine_value in (True, False):
+        assert client.parse_numbers(texts, lang, determine_value) == parse_numbers(texts, lang, determine_value)
+    assert client.parse_number(texts[0], lang) == parse_numbers(texts[:1], lang)[0]
+    client.close()
+
+
+def test_tcp_and_errors(running):
+    server = running(ParseServer(), host='127.0.0.1', port=0)
+    client = ParseClient(port=server.sockets[0].getsockname()[1], pool_size=1)
+    assert client.parse_number('derde', 'nl-BE', True) == (3, True)
+    with pytest.raises(ValueError):
+        client.parse_number('drei', 'xx')
+    with pytest.raises(ValueError):
+        client.parse_number('drie', 'nl', no_such_option=True)
+    assert client.parse_numbers([], 'nl') == []
+    client.close()
+
+
+def test_concurrent_requests_are_batched(running, tmp_path):
+    path = str(tmp_path / 'parse.sock')
+    server = ParseServer(max_delay=0.05)
+    running(server, path=path)
+    client = ParseClient(path, pool_size=16)
+    texts = ['een', 'twee', 'drie', 'vierde']
+    with ThreadPoolExecutor(16) as executor:
+        results = list(executor.map(lambda text: client.parse_number(text, 'nl', True), texts * 8))
+    assert results == parse_numbers(texts * 8, 'nl', True)
+    assert server.metrics.requests == 32
+    assert server.metrics.texts == 32
+    assert sum(server.metrics.batch_sizes) < 32
+    assert server.metrics.queue_depth == 0
+    assert 'parse_numeric_value_batch_size_count {}'.format(sum(server.metrics.batch_sizes)) in client.metrics()
+    client.close()
+
+
+def test_texts_raising_are_rejected():
+    server = ParseServer(max_delay=0.05)
+
+    async def concurrently():
+        return await asyncio.gather(*[
+            server.respond('POST', '/parse', json.dumps({'texts': texts, 'lang': 'fr', 'determine_value': True})
+                           .encode('utf8'))
+            for texts in (['quatre-vingt-deux', 'trente'], ['vingt'])])
+
+    first, second = asyncio.run(concurrently())
+    assert first == (200, 'application/json', b'{"results": [[null, null], [30, false]]}')
+    assert second == (200, 'application/json', b'{"results": [[20, false]]}')
+    assert server.metrics.errors == 1
+    assert 'parse_numeric_value_parse_errors_total 1' in server.metrics.to_prometheus()
+
+
+def test_unexpected_errors_answer_500(monkeypatch):
+    server = ParseServer()
+
+    async def parse(request):
+        raise RuntimeError('out of memory')
+
+    monkeypatch.setattr(server, 'parse', parse)
+    status, content_type, body = asyncio.run(server.respond('POST', '/parse', b'{"texts": []}'))
+    assert status == 500
+    assert json.loads(body.decode('utf8')) == {'error': 'out of memory'}
+
+
+def test_batch_metrics():
+    metrics = BatchMetrics(buckets=(1, 10))
+    metrics.enqueued(3)
+    metrics.enqueued(20)
+    assert metrics.queue_depth == metrics.max_queue_depth == 23
+    metrics.observe_batch(3)
+    metrics.observe_batch(20)
+    assert metrics.queue_depth == 0
+    assert metrics.batch_sizes == [0, 1, 1]
+    text = metrics.to_prometheus()
+    assert 'parse_numeric_value_batch_size_bucket{le="10"} 1' in text
+    assert 'parse_numeric_value_batch_size_bucket{le="+Inf"} 2' in text
+    assert 'parse_numeric_value_max_queue_depth 23' in text
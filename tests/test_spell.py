@@ -0,0 +1,98 @@
+# coding: utf-8
+"""Test spelling values out in words."""
+
+
+from __future__ import unicode_literals
+
+import types
+
+import pytest
+
+from parse_numeric_value import parse_number
+from parse_numeric_value.spell import spell_range, spellings
+
+
+@pytest.mark.parametrize('value,lang,ordinal,expected', [
+    (1, 'nl', False, ['een', 'één']),
+    (1, 'nl', True, ['eerste']),
+    (102, 'nl', False, ['honderdtwee', 'honderdentwee']),
+    (90888, 'nl', False, ['negentigduizend achthonderdachtentachtig']),
+    (3200000, 'nl', False, ['drie miljoen tweehonderdduizend']),
+    (1000, 'nl-BE', True, ['duizendste', 'eenduizendste']),
+    (3, 'de', True, ['dritte', 'dritter', 'drittes']),
+    (2300, 'de', False, ['zweitausend dreihundert']),
+    (2000000000, 'de-AT', False, ['zwei milliarden']),
+    (70, 'fr', False, ['soixante-dix', 'septante']),
+    (71, 'fr-FR', False, ['soixante et onze', 'soixante-et-onze']),
+    (80, 'fr-CH', False, ['huitante', 'octante']),
+    (80, 'fr_BE', False, ['quatre-vingts']),
+    (97, 'fr-CA', False, ['quatre-vingt-dix-sept']),
+    (80000, 'fr-FR', False, ['quatre-vingt mille', 'quatre-vingt-mille']),
+    (200, 'fr-FR', True, ['deux centième', 'deux-centième']),
+    (2300000, 'fr-FR', False, ['deux millions trois cent mille', 'deux millions trois-cent-mille']),
+])
+def test_spellings(value, lang, ordinal, expected):
+    assert list(spellings(value, lang, ordinal)) == expected
+
+
+@pytest.mark.parametrize('value', [-1, 1.5, '12'])
+def test_invalid_values(value):
+    with pytest.raises(ValueError):
+        list(spellings(value, 'nl'))
+
+
+@pytest.mark.parametrize('start', [-2, 1.5])
+def test_spell_range_rejects_invalid_starts(start):
+    with pytest.raises(ValueError):
+        spell_range(start, 1, 'nl')
+
+
+def test_spell_range_is_lazy():
+    spelled = spell_range(0, 10 ** 12, 'fr')
+    assert isinstance(spelled, types.GeneratorType)
+    assert next(spelled) == (0, False, 'zéro')
+
+
+@pytest.mark.parametrize('lang,start,stop', [('fr', 69990, 71010), ('fr', 998990, 1001010), ('fr-CH', 79000, 81001),
+                                             ('de', 0, 2001)])
+def test_spell_range_gives_the_spellings(lang, start, stop):
+    expected = [(value, ordinal, text) for value in range(start, stop) for ordinal in (False, True)
+                for text in spellings(value, lang, ordinal)]
+    spelled = list(spell_range(start, stop, lang, ordinal=None))
+    assert spelled == expected
+    assert len(set(spelled)) == len(spelled)
+
+
+def test_round_trip_dutch():
+    for value, ordinal, text in spell_range(0, 20000, 'nl', ordinal=None):
+        assert parse_number(text, 'nl', determine_value=True) == (value, ordinal), text
+
+
+@pytest.mark.parametrize('lang', ['de', 'fr'])
+def test_accepted_only_round_trips(lang):
+    spelled = list(spell_range(0, 3001, lang, ordinal=None))
+    accepted = list(spell_range(0, 3001, lang, ordinal=None, accepted_only=True))
+    assert 0 < len(accepted) < len(spelled)
+    for value, ordinal, text in accepted:
+        assert parse_number(text, lang, determine_value=True) == (value, ordinal), text
+
+
+@pytest.mark.parametrize('value,lang,ordinal,accepted', [
+    (30, 'de', False, []),
+    (8, 'de', True, []),
+    (3, 'de', True, ['dritte', 'dritter', 'drittes']),
+    (70, 'fr', False, ['septante']),
+    (2, 'fr', True, ['deuxième']),
+])
+def test_spellings_accepted_only(value, lang, ordinal, accepted):
+    assert list(spellings(value, lang, ordinal, accepted_only=True)) == accepted
+
+
+@pytest.mark.parametrize('value,lang', [
+    (3200000, 'nl'), (1002003004, 'nl'), (2000001, 'de'), (4700000, 'de'),
+    (2000021, 'fr'), (1000001, 'fr'),
+])
+def test_round_trip_large(value, lang):
+    for ordinal in (False, True):
+        for text in spellings(value, lang, ordinal):
+            assert parse_number(text, lang, determine_value=True) == (value, ordinal), text